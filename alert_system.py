@@ -8,6 +8,8 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from quantum_rng import get_qrng
+
 class AlertSystem:
     """
     Sistem avansat de alerte și notificări pentru activități suspecte și tentative de fraudă
@@ -118,7 +120,7 @@ class AlertSystem:
         
         # Creăm alerta
         alert = {
-            "alert_id": hashlib.sha256(f"ALERT-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "alert_id": hashlib.sha256(f"ALERT-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "timestamp": alert_data["timestamp"].strftime("%d.%m.%Y %H:%M:%S"),
             "level": alert_data["level"],
             "type": alert_data["type"],
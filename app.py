@@ -279,6 +279,9 @@ if 'global_network' not in st.session_state:
     st.session_state.global_network = GlobalDatacenterNetwork()
 if 'show_help' not in st.session_state:
     st.session_state.show_help = False
+if 'session_id' not in st.session_state:
+    # Identifică sesiunea în managerul de job-uri IBM (rezultatele sunt livrate per sesiune)
+    st.session_state.session_id = hashlib.sha256(f"SESSION-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16]
 
 # Display watermark and copyright
 watermark = generate_watermark("Ervin Radosavlevici")
@@ -490,6 +493,8 @@ def run_console():
             - `șterge` - Șterge istoricul consolei
             - `rulează circuit` - Rulează un circuit quantum de bază
             - `conectare ibm` - Conectare la hardware-ul real IBM Quantum
+            - `rulează circuit real` - Trimite asincron un circuit Bell pe IBM Quantum
+            - `rezultate ibm` - Afișează job-urile IBM Quantum în lucru
             - `teleportare` - Demonstrează teleportarea quantum
             - `teleportare reală` - Teleportare pe hardware-ul real IBM Quantum
             - `generează cheie dna` - Generează o nouă cheie de securitate DNA
@@ -500,6 +505,12 @@ def run_console():
             - `ieșire` - Șterge consola și resetează
             """)
     
+    # Rezultatele job-urilor IBM terminate de la ultima reîmprospătare
+    for output, visualization in st.session_state.quantum_simulator.poll_ibm_results(st.session_state.session_id):
+        st.session_state.console_history.append({'type': 'output', 'text': output})
+        if visualization:
+            st.session_state.console_history.append({'type': 'visualization', 'chart': visualization})
+    
     # Console output area with scrolling
     console_container = st.container()
     with console_container:
@@ -553,6 +564,8 @@ def process_command(command):
             <li><code>șterge</code> - Șterge istoricul consolei</li>
             <li><code>rulează circuit</code> - Rulează un circuit quantum de bază</li>
             <li><code>conectare ibm</code> - Conectare la hardware-ul real IBM Quantum</li>
+            <li><code>rulează circuit real</code> - Trimite asincron un circuit Bell pe IBM Quantum</li>
+            <li><code>rezultate ibm</code> - Afișează job-urile IBM Quantum în lucru</li>
             <li><code>teleportare</code> - Demonstrează teleportarea quantum</li>
             <li><code>teleportare reală</code> - Teleportare pe hardware-ul real IBM Quantum</li>
             <li><code>generează cheie dna</code> - Generează o nouă cheie de securitate DNA</li>
@@ -748,6 +761,30 @@ def process_command(command):
         st.session_state.console_history.append({'type': 'output', 'text': output})
         if visualization:
             st.session_state.console_history.append({'type': 'visualization', 'chart': visualization})
+        
+        # Trimitem circuitul de teleportare în coada asincronă; rezultatul apare la o reîmprospătare ulterioară
+        if st.session_state.teleportation_sim.ibm_available:
+            job_id = st.session_state.teleportation_sim.submit_teleportation_job(user_id=st.session_state.session_id)
+            output = display_console_text(f"Job de teleportare {job_id} pus în coadă. Rezultatul va apărea automat (sau cu comanda 'rezultate ibm').")
+            st.session_state.console_history.append({'type': 'output', 'text': output})
+    
+    elif command == "run real circuit" or command == "rulează circuit real":
+        # Circuit Bell trimis asincron pe IBM Quantum (sau pe backend-urile fake, offline)
+        from qiskit import QuantumCircuit
+        qc = QuantumCircuit(2, 2, name="bell_state")
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure([0, 1], [0, 1])
+        job_id = st.session_state.quantum_simulator.submit_ibm_job(qc, user_id=st.session_state.session_id)
+        output = display_console_text(f"Job {job_id} pus în coadă. Rezultatul va apărea automat (sau cu comanda 'rezultate ibm').")
+        st.session_state.console_history.append({'type': 'output', 'text': output})
+    
+    elif command == "ibm results" or command == "rezultate ibm":
+        # Rezultatele sunt colectate la fiecare reîmprospătare; afișăm și job-urile încă în lucru
+        from ibm_job_manager import get_job_manager
+        running = [job for job in get_job_manager().get_user_jobs(st.session_state.session_id) if not job["finished_at"]]
+        output = display_console_text(f"Job-uri IBM în lucru: {len(running)}" + "".join(f" | {job['job_id']}: {job['status']}" for job in running))
+        st.session_state.console_history.append({'type': 'output', 'text': output})
             
     elif command == "protection" or command == "protecție":
         # Afișăm informații despre protecția împotriva manipulării copyright/watermark
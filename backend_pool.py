@@ -0,0 +1,146 @@
+import os
+import threading
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Backend-urile legacy obținute prin Aer.get_backend(); restul sunt AerSimulator
+LEGACY_BACKENDS = ("statevector_simulator", "qasm_simulator")
+
+
+def _env_int(name):
+    value = os.environ.get(name)
+    try:
+        return int(value) if value else None
+    except ValueError:
+        print(f"[BACKEND POOL] Valoare invalidă pentru {name}: {value}")
+        return None
+
+
+class SimulatorBackendPool:
+    """
+    Registru comun procesului pentru backend-urile de simulare Aer.
+
+    Fiecare backend este creat la prima utilizare și apoi partajat de
+    QuantumSimulator, QuantumTeleportation și QuantumConnector, astfel încât
+    sesiunile noi nu mai construiesc (și nu mai păstrează în memorie) propriile
+    simulatoare. Setările de memorie și thread-uri se aplică tuturor backend-urilor.
+    """
+
+    def __init__(self, max_memory_mb=None, max_parallel_threads=None):
+        self.max_memory_mb = max_memory_mb
+        self.max_parallel_threads = max_parallel_threads
+        self._backends = {}
+        self._lock = threading.Lock()
+        self.backends_created = 0
+
+    def _backend_options(self):
+        options = {}
+        if self.max_memory_mb is not None:
+            options["max_memory_mb"] = self.max_memory_mb
+        if self.max_parallel_threads is not None:
+            options["max_parallel_threads"] = self.max_parallel_threads
+        return options
+
+    def _create_backend(self, name, method):
+        """Construiește un backend nou (importul qiskit_aer are loc doar aici)"""
+        from qiskit_aer import Aer, AerSimulator
+
+        if name in LEGACY_BACKENDS:
+            backend = Aer.get_backend(name)
+            options = self._backend_options()
+            if options:
+                backend.set_options(**options)
+            return backend
+
+        if name != "aer_simulator":
+            raise ValueError(f"Backend de simulare necunoscut: {name}")
+
+        options = self._backend_options()
+        if method:
+            options["method"] = method
+        return AerSimulator(**options)
+
+    def get_backend(self, name="aer_simulator", method=None):
+        """
+        Returnează backend-ul partajat, creându-l la prima utilizare
+
+        Args:
+            name (str): "aer_simulator", "statevector_simulator" sau "qasm_simulator"
+            method (str, optional): Metoda de simulare Aer (ex. "stabilizer")
+
+        Returns:
+            Backend-ul Aer partajat
+        """
+        key = (name, method)
+        backend = self._backends.get(key)
+        if backend is not None:
+            return backend
+
+        with self._lock:
+            backend = self._backends.get(key)
+            if backend is None:
+                backend = self._create_backend(name, method)
+                self._backends[key] = backend
+                self.backends_created += 1
+            return backend
+
+    def configure(self, max_memory_mb=None, max_parallel_threads=None):
+        """
+        Actualizează limitele de memorie și thread-uri pentru toate backend-urile
+
+        Args:
+            max_memory_mb (int, optional): Memoria maximă per simulare (MB)
+            max_parallel_threads (int, optional): Numărul maxim de thread-uri per job
+        """
+        with self._lock:
+            if max_memory_mb is not None:
+                self.max_memory_mb = max_memory_mb
+            if max_parallel_threads is not None:
+                self.max_parallel_threads = max_parallel_threads
+
+            options = self._backend_options()
+            if options:
+                for backend in self._backends.values():
+                    backend.set_options(**options)
+
+        return self.get_settings()
+
+    def get_settings(self):
+        """Returnează setările curente ale registrului de backend-uri"""
+        return {
+            "max_memory_mb": self.max_memory_mb,
+            "max_parallel_threads": self.max_parallel_threads,
+            "backends_created": self.backends_created,
+            "active_backends": [
+                name if method is None else f"{name}:{method}"
+                for name, method in self._backends.keys()
+            ]
+        }
+
+
+_backend_pool = None
+_backend_pool_lock = threading.Lock()
+
+
+def get_backend_pool():
+    """
+    Returnează registrul de backend-uri comun procesului.
+    Limitele inițiale se citesc din QUANTUM_AER_MAX_MEMORY_MB și QUANTUM_AER_MAX_THREADS.
+    """
+    global _backend_pool
+    if _backend_pool is None:
+        with _backend_pool_lock:
+            if _backend_pool is None:
+                _backend_pool = SimulatorBackendPool(
+                    max_memory_mb=_env_int('QUANTUM_AER_MAX_MEMORY_MB'),
+                    max_parallel_threads=_env_int('QUANTUM_AER_MAX_THREADS')
+                )
+    return _backend_pool
+
+
+def get_backend(name="aer_simulator", method=None):
+    """Returnează un backend partajat din registrul comun"""
+    return get_backend_pool().get_backend(name, method)
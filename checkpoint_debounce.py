@@ -0,0 +1,150 @@
+import time
+import atexit
+import threading
+from concurrent.futures import Future
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Intervalul minim între două checkpoint-uri de securitate (secunde)
+DEFAULT_MIN_INTERVAL_SECONDS = 2.0
+
+# Numărul maxim de evenimente acoperite de un singur checkpoint de securitate
+DEFAULT_MAX_EVENTS = 100
+
+
+class SecurityCheckpointDebouncer:
+    """
+    Coalescența checkpoint-urilor de securitate în timpul unui atac.
+
+    Primul eveniment după o perioadă liniștită primește imediat un checkpoint.
+    Evenimentele care urmează în intervalul minim sunt adunate și împart un singur
+    checkpoint, care listează ID-urile tuturor evenimentelor. Acesta este creat la
+    sfârșitul intervalului (un timer garantează că există un checkpoint după
+    ultimul eveniment) sau imediat ce se adună numărul maxim de evenimente.
+    """
+
+    def __init__(self, create_function, min_interval=DEFAULT_MIN_INTERVAL_SECONDS, max_events=DEFAULT_MAX_EVENTS):
+        """
+        Args:
+            create_function (callable): create_function(description, event_ids) creează checkpoint-ul
+            min_interval (float): Intervalul minim între checkpoint-uri (0 = fără coalescență)
+            max_events (int): Evenimente maxime per checkpoint
+        """
+        self.create_function = create_function
+        self.min_interval = max(0.0, float(min_interval))
+        self.max_events = max(1, int(max_events))
+
+        self._lock = threading.Lock()
+        self._pending_events = []
+        self._pending_descriptions = []
+        self._pending_future = None
+        self._timer = None
+        self._last_checkpoint = None
+
+        # Statistici
+        self.events_recorded = 0
+        self.checkpoints_created = 0
+        self.max_events_per_checkpoint = 0
+
+        # Evenimentele încă neacoperite primesc checkpoint-ul la oprirea procesului
+        atexit.register(self.flush)
+
+    def record(self, event_id, description):
+        """
+        Înregistrează un eveniment de securitate
+
+        Args:
+            event_id (str): ID-ul evenimentului (ex. attempt_id)
+            description (str): Descrierea checkpoint-ului dacă evenimentul este singur în fereastră
+
+        Returns:
+            dict: checkpoint_id (dacă checkpoint-ul a fost creat acum), future (rezultatul
+                create_function pentru checkpoint-ul care acoperă evenimentul) și numărul
+                de evenimente încă în așteptare
+        """
+        with self._lock:
+            self.events_recorded += 1
+            self._pending_events.append(event_id)
+            self._pending_descriptions.append(description)
+            if self._pending_future is None:
+                self._pending_future = Future()
+            future = self._pending_future
+
+            now = time.monotonic()
+            quiet = self._last_checkpoint is None or now - self._last_checkpoint >= self.min_interval
+            if quiet or len(self._pending_events) >= self.max_events:
+                batch = self._take_pending(now)
+            else:
+                batch = None
+                if self._timer is None:
+                    delay = self._last_checkpoint + self.min_interval - now
+                    self._timer = threading.Timer(delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+            pending = len(self._pending_events)
+
+        if batch is None:
+            return {"checkpoint_id": None, "future": future, "pending_events": pending}
+        result = self._create(*batch)
+        return {"checkpoint_id": result.get("checkpoint_id") if result else None, "future": future,
+                "pending_events": pending}
+
+    def _take_pending(self, now):
+        """Preia evenimentele în așteptare (apelat cu lock-ul deținut)"""
+        batch = (self._pending_events, self._pending_descriptions, self._pending_future)
+        self._pending_events = []
+        self._pending_descriptions = []
+        self._pending_future = None
+        self._last_checkpoint = now
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _create(self, event_ids, descriptions, future):
+        """Creează checkpoint-ul comun pentru un grup de evenimente și rezolvă Future-ul grupului"""
+        if len(event_ids) == 1:
+            description = descriptions[0]
+        else:
+            description = f"Shared Security Checkpoint ({len(event_ids)} events)"
+        try:
+            result = self.create_function(description, list(event_ids))
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la checkpoint-ul de securitate: {str(e)}")
+            future.set_exception(e)
+            return None
+        self.checkpoints_created += 1
+        self.max_events_per_checkpoint = max(self.max_events_per_checkpoint, len(event_ids))
+        future.set_result(result)
+        return result
+
+    def flush(self):
+        """
+        Creează imediat checkpoint-ul pentru evenimentele în așteptare (dacă există)
+
+        Returns:
+            dict: Rezultatul create_function sau None dacă nu exista niciun eveniment
+        """
+        with self._lock:
+            if not self._pending_events:
+                self._timer = None
+                return None
+            batch = self._take_pending(time.monotonic())
+        return self._create(*batch)
+
+    def get_stats(self):
+        with self._lock:
+            pending = len(self._pending_events)
+        return {
+            "min_interval_seconds": self.min_interval,
+            "max_events": self.max_events,
+            "events_recorded": self.events_recorded,
+            "checkpoints_created": self.checkpoints_created,
+            "pending_events": pending,
+            "events_per_checkpoint": round(self.events_recorded / self.checkpoints_created, 2)
+            if self.checkpoints_created else None,
+            "max_events_per_checkpoint": self.max_events_per_checkpoint
+        }
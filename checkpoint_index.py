@@ -0,0 +1,173 @@
+import bisect
+import datetime
+import threading
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Ordinea de căutare a nivelurilor, ca în rollback_to_checkpoint
+TIERS = ("primary", "hidden", "ghost")
+
+
+def _to_timestamp(value):
+    """Momentul creării ca timestamp POSIX (acceptă datetime, șir ISO sau număr)"""
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+class CheckpointIndex:
+    """
+    Index unificat în memorie pentru checkpoint-urile primare, ascunse și ghost.
+
+    Un dicționar checkpoint_id → înregistrările fiecărui nivel dă căutarea după
+    ID în O(1), iar o listă sortată de (moment creare, checkpoint_id) dă
+    interogările "cel mai recent checkpoint înainte de T" în O(log n) prin bisect.
+    Ghost-urile sunt păstrate în forma lor codificată și decodate doar când
+    sunt efectiv selectate.
+    """
+
+    def __init__(self, ghost_decoder=None):
+        """
+        Args:
+            ghost_decoder (callable, optional): Transformă o înregistrare ghost în corpul checkpoint-ului
+        """
+        self.ghost_decoder = ghost_decoder
+        self._entries = {}
+        self._times = []
+        self._lock = threading.RLock()
+
+        # Statistici
+        self.lookups = 0
+        self.ghost_decodes = 0
+
+    def add(self, tier, checkpoint_id, record, created_at):
+        """
+        Înregistrează nivelul unui checkpoint
+
+        Args:
+            tier (str): "primary", "hidden" sau "ghost"
+            checkpoint_id (str): ID-ul checkpoint-ului
+            record (dict): Înregistrarea nivelului (pentru ghost, forma codificată)
+            created_at: Momentul creării (datetime, șir ISO sau timestamp)
+        """
+        with self._lock:
+            entry = self._entries.get(checkpoint_id)
+            if entry is None:
+                timestamp = _to_timestamp(created_at)
+                entry = {"created_at": timestamp}
+                self._entries[checkpoint_id] = entry
+                bisect.insort(self._times, (timestamp, checkpoint_id))
+            entry[tier] = record
+
+    def remove(self, tier, checkpoint_id):
+        """Elimină nivelul unui checkpoint; checkpoint-ul dispare din index odată cu ultimul nivel"""
+        with self._lock:
+            entry = self._entries.get(checkpoint_id)
+            if entry is None or entry.pop(tier, None) is None:
+                return False
+            if tier == "ghost":
+                entry.pop("ghost_decoded", None)
+            if not any(name in entry for name in TIERS):
+                del self._entries[checkpoint_id]
+                position = bisect.bisect_left(self._times, (entry["created_at"], checkpoint_id))
+                if position < len(self._times) and self._times[position][1] == checkpoint_id:
+                    del self._times[position]
+            return True
+
+    def _select(self, checkpoint_id, tiers):
+        """
+        Prima înregistrare disponibilă din nivelurile cerute; ghost-ul este decodat doar acum
+
+        Înregistrarea este aleasă sub lock, dar decodarea ghost-ului (care poate aștepta
+        golirea scriitorului de checkpoint-uri) rulează fără lock, ca add/remove
+        concurente să nu fie blocate.
+        """
+        for tier in tiers:
+            with self._lock:
+                entry = self._entries.get(checkpoint_id)
+                if entry is None:
+                    return None
+                record = entry.get(tier)
+                if record is None:
+                    continue
+                if tier != "ghost" or self.ghost_decoder is None:
+                    return record
+                if entry.get("ghost_decoded") is not None:
+                    return entry["ghost_decoded"]
+
+            try:
+                decoded = self.ghost_decoder(record)
+            except Exception:
+                # Ghost-ul ilizibil nu este selectat; decodarea se reîncearcă la următoarea căutare
+                continue
+
+            with self._lock:
+                self.ghost_decodes += 1
+                # Ghost-ul poate fi fost eliminat sau înlocuit între timp
+                if decoded is not None and entry.get("ghost") is record:
+                    entry["ghost_decoded"] = decoded
+            if decoded is not None:
+                return decoded
+        return None
+
+    def get(self, checkpoint_id, tiers=TIERS):
+        """
+        Checkpoint-ul cu ID-ul dat, din primul nivel disponibil (O(1))
+
+        Args:
+            checkpoint_id (str): ID-ul checkpoint-ului
+            tiers (tuple): Nivelurile căutate, în ordinea preferinței
+
+        Returns:
+            dict: Checkpoint-ul sau None dacă nu a fost găsit
+        """
+        with self._lock:
+            self.lookups += 1
+        return self._select(checkpoint_id, tiers)
+
+    def latest_before(self, when, tiers=TIERS):
+        """
+        Cel mai recent checkpoint creat cel târziu la momentul dat (O(log n) până la primul candidat)
+
+        Args:
+            when: Momentul limită (datetime, șir ISO sau timestamp)
+            tiers (tuple): Nivelurile acceptate, în ordinea preferinței
+
+        Returns:
+            dict: Checkpoint-ul sau None dacă nu există niciunul înainte de moment
+        """
+        # Perechile (timestamp, id) cu același timestamp sunt toate incluse
+        bound = (_to_timestamp(when), "\uffff")
+        with self._lock:
+            self.lookups += 1
+        while True:
+            # Poziția este recalculată la fiecare pas, deoarece lock-ul este eliberat la decodare
+            with self._lock:
+                position = bisect.bisect_left(self._times, bound)
+                if position == 0:
+                    return None
+                bound = self._times[position - 1]
+            record = self._select(bound[1], tiers)
+            if record is not None:
+                return record
+
+    def __contains__(self, checkpoint_id):
+        return checkpoint_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_stats(self):
+        with self._lock:
+            tier_counts = {tier: sum(1 for entry in self._entries.values() if tier in entry) for tier in TIERS}
+            return {
+                "indexed_checkpoints": len(self._entries),
+                "tiers": tier_counts,
+                "lookups": self.lookups,
+                "ghost_decodes": self.ghost_decodes
+            }
@@ -0,0 +1,283 @@
+import os
+import json
+import mmap
+import zlib
+import struct
+import threading
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Directorul implicit al segmentelor, alături de locațiile checkpoint-urilor
+DEFAULT_LOG_DIR = "./checkpoints/log"
+
+# Dimensiunea după care segmentul activ este închis și se deschide unul nou
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+
+# Antetul fiecărui segment (identifică formatul și versiunea)
+SEGMENT_MAGIC = b"QTSLOG01"
+
+# Antetul fiecărei înregistrări: lungimea payload-ului, CRC32(cheie + payload), lungimea cheii
+RECORD_HEADER = struct.Struct("<IIH")
+
+
+def _segment_name(number):
+    return f"{number:08d}.seg"
+
+
+class SegmentLog:
+    """
+    Jurnal append-only de înregistrări cheie → JSON, împărțit în segmente rotite după dimensiune.
+
+    Fiecare înregistrare este încadrată ca [lungime][CRC32][lungime cheie][cheie][payload],
+    deci scrierile sunt secvențiale (un singur write per înregistrare, fără fișiere noi
+    sau actualizări de director), iar o înregistrare trunchiată sau coruptă la finalul
+    jurnalului este detectată și eliminată la deschidere. Un index în memorie
+    mapează cheia la (segment, offset, lungime); citirile merg direct la poziție
+    prin mmap, fără a citi restul segmentului. Un payload gol marchează ștergerea cheii.
+    """
+
+    def __init__(self, directory=DEFAULT_LOG_DIR, max_segment_bytes=DEFAULT_SEGMENT_BYTES):
+        """
+        Args:
+            directory (str): Directorul segmentelor
+            max_segment_bytes (int): Dimensiunea de rotire a segmentului activ
+        """
+        self.directory = directory
+        self.max_segment_bytes = int(max_segment_bytes)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._index = {}
+        self._maps = {}
+        self._lock = threading.RLock()
+        self._active_number = None
+        self._active_file = None
+        self._active_size = 0
+
+        # Statistici
+        self.records_appended = 0
+        self.bytes_appended = 0
+        self.records_recovered = 0
+        self.corrupt_tails = 0
+        self.syncs = 0
+
+        self._recover()
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, _segment_name(number))
+
+    def _segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".seg") and name[:-4].isdigit():
+                numbers.append(int(name[:-4]))
+        return sorted(numbers)
+
+    def _recover(self):
+        """Reconstruiește indexul parcurgând segmentele; trunchiază o coadă coruptă a ultimului segment"""
+        numbers = self._segment_numbers()
+        for position, number in enumerate(numbers):
+            path = self._segment_path(number)
+            valid_end = self._scan_segment(number, path)
+            if valid_end < os.path.getsize(path):
+                self.corrupt_tails += 1
+                if position == len(numbers) - 1:
+                    print(f"[CHECKPOINT LOG] Coadă incompletă în {path}; trunchiere la {valid_end} octeți")
+                    with open(path, "r+b") as f:
+                        f.truncate(valid_end)
+                else:
+                    print(f"[CHECKPOINT LOG] Înregistrare coruptă în {path} la {valid_end}; restul segmentului este ignorat")
+
+        if numbers and os.path.getsize(self._segment_path(numbers[-1])) < self.max_segment_bytes:
+            self._open_active(numbers[-1])
+        else:
+            self._open_active(numbers[-1] + 1 if numbers else 1)
+
+    def _scan_segment(self, number, path):
+        """Indexează înregistrările valide ale unui segment și returnează offset-ul primei invalide"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(SEGMENT_MAGIC):
+            return 0
+
+        offset = len(SEGMENT_MAGIC)
+        while offset + RECORD_HEADER.size <= len(data):
+            payload_length, checksum, key_length = RECORD_HEADER.unpack_from(data, offset)
+            body_start = offset + RECORD_HEADER.size
+            end = body_start + key_length + payload_length
+            if end > len(data) or zlib.crc32(data[body_start:end]) != checksum:
+                break
+            key = data[body_start:body_start + key_length].decode("utf-8")
+            self._apply_index(key, number, body_start + key_length, payload_length)
+            self.records_recovered += 1
+            offset = end
+        return offset
+
+    def _apply_index(self, key, number, payload_offset, payload_length):
+        if payload_length:
+            self._index[key] = (number, payload_offset, payload_length)
+        else:
+            self._index.pop(key, None)
+
+    def _open_active(self, number):
+        if self._active_file is not None:
+            self._active_file.close()
+        path = self._segment_path(number)
+        # Fără buffer în proces: fiecare înregistrare ajunge imediat în page cache, vizibilă prin mmap
+        self._active_file = open(path, "ab", buffering=0)
+        if self._active_file.tell() == 0:
+            self._active_file.write(SEGMENT_MAGIC)
+        self._active_number = number
+        self._active_size = self._active_file.tell()
+
+    def _rotate(self):
+        """Închide segmentul activ (îl sincronizează pe disc) și deschide unul nou"""
+        os.fsync(self._active_file.fileno())
+        self._open_active(self._active_number + 1)
+
+    def append(self, key, record):
+        """
+        Adaugă o înregistrare la finalul jurnalului
+
+        Args:
+            key (str): Cheia înregistrării (ex. checkpoint_id)
+            record (dict): Payload-ul JSON; None marchează ștergerea cheii
+
+        Returns:
+            tuple: (segment, offset) al payload-ului scris
+        """
+        key_bytes = key.encode("utf-8")
+        payload = b"" if record is None else json.dumps(record, separators=(",", ":")).encode("utf-8")
+        body = key_bytes + payload
+        frame = RECORD_HEADER.pack(len(payload), zlib.crc32(body), len(key_bytes)) + body
+
+        with self._lock:
+            if self._active_size + len(frame) > self.max_segment_bytes and self._active_size > len(SEGMENT_MAGIC):
+                self._rotate()
+            offset = self._active_size
+            self._active_file.write(frame)
+            self._active_size += len(frame)
+            payload_offset = offset + RECORD_HEADER.size + len(key_bytes)
+            self._apply_index(key, self._active_number, payload_offset, len(payload))
+            self.records_appended += 1
+            self.bytes_appended += len(frame)
+            return self._active_number, payload_offset
+
+    def delete(self, key):
+        """Marchează cheia ca ștearsă (înregistrare cu payload gol)"""
+        with self._lock:
+            if key not in self._index:
+                return False
+        self.append(key, None)
+        return True
+
+    def sync(self):
+        """Forțează pe disc înregistrările segmentului activ (fsync)"""
+        with self._lock:
+            os.fsync(self._active_file.fileno())
+            self.syncs += 1
+
+    def _segment_map(self, number, required_size):
+        """mmap-ul unui segment, refăcut dacă segmentul activ a crescut peste maparea curentă"""
+        mapped = self._maps.get(number)
+        if mapped is None or len(mapped) < required_size:
+            with open(self._segment_path(number), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # Maparea veche nu este închisă explicit: poate avea încă view-uri active
+            self._maps[number] = mapped
+        return mapped
+
+    def read_bytes(self, key):
+        """
+        Payload-ul unei chei ca memoryview direct peste mmap-ul segmentului (fără copiere)
+
+        Returns:
+            memoryview: Payload-ul sau None dacă cheia nu există
+        """
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            number, payload_offset, payload_length = location
+            mapped = self._segment_map(number, payload_offset + payload_length)
+        return memoryview(mapped)[payload_offset:payload_offset + payload_length]
+
+    def get(self, key):
+        """
+        Înregistrarea unei chei: o singură căutare în index și o singură citire din segment
+
+        Returns:
+            dict: Înregistrarea sau None dacă cheia nu există
+        """
+        payload = self.read_bytes(key)
+        if payload is None:
+            return None
+        try:
+            return json.loads(payload.tobytes())
+        finally:
+            payload.release()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def keys(self):
+        with self._lock:
+            return list(self._index)
+
+    def close(self):
+        with self._lock:
+            if self._active_file is not None:
+                os.fsync(self._active_file.fileno())
+                self._active_file.close()
+                self._active_file = None
+            self._maps.clear()
+
+    def get_stats(self):
+        with self._lock:
+            segments = self._segment_numbers()
+            return {
+                "directory": self.directory,
+                "segments": len(segments),
+                "active_segment": self._active_number,
+                "active_segment_bytes": self._active_size,
+                "indexed_keys": len(self._index),
+                "records_appended": self.records_appended,
+                "bytes_appended": self.bytes_appended,
+                "records_recovered": self.records_recovered,
+                "corrupt_tails": self.corrupt_tails,
+                "syncs": self.syncs
+            }
+
+
+if __name__ == "__main__":
+    import time
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = SegmentLog(directory, max_segment_bytes=1024 * 1024)
+        record = {"id": "0" * 16, "description": "Security Checkpoint After Theft Attempt", "dna_sequence": "ACGT" * 32}
+
+        start_time = time.perf_counter()
+        for i in range(10_000):
+            log.append(f"{i:016x}", dict(record, id=f"{i:016x}"))
+        log.sync()
+        elapsed = time.perf_counter() - start_time
+        print(f"append: {elapsed / 10_000 * 1e6:.1f} µs/înregistrare")
+
+        start_time = time.perf_counter()
+        for i in range(0, 10_000, 7):
+            assert log.get(f"{i:016x}")["id"] == f"{i:016x}"
+        elapsed = time.perf_counter() - start_time
+        print(f"get: {elapsed / len(range(0, 10_000, 7)) * 1e6:.1f} µs/înregistrare")
+        print(log.get_stats())
+        log.close()
+
+        start_time = time.perf_counter()
+        reopened = SegmentLog(directory, max_segment_bytes=1024 * 1024)
+        print(f"recuperare index: {(time.perf_counter() - start_time) * 1000:.1f} ms, {len(reopened)} chei")
+        reopened.close()
@@ -0,0 +1,330 @@
+import os
+import sys
+import json
+import zlib
+import base64
+import hashlib
+import threading
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Directorul implicit al obiectelor, alături de locațiile checkpoint-urilor
+DEFAULT_OBJECTS_DIR = "./checkpoints/objects"
+
+# Nivelul de compresie zlib (corpurile JSON se comprimă de ~2-3 ori)
+COMPRESSION_LEVEL = 6
+
+# Câmpurile unei referințe care descriu plasarea, nu conținutul checkpoint-ului
+REFERENCE_KEYS = ("object", "tier", "placements")
+
+# Câmpurile adăugate de fiecare nivel peste corpul checkpoint-ului
+DIST_FIELDS = ("distributed_id", "distribution_node", "distribution_timestamp")
+HIDDEN_FIELDS = ("hidden", "hidden_id", "hidden_key", "theft_protection", "auto_restore_on_theft")
+
+
+def canonical_json(data):
+    """Serializarea canonică (chei sortate, fără spații): același conținut dă același hash"""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def fsync_paths(paths):
+    """
+    Face durabile fișierele date: fsync pe fiecare fișier, apoi pe directoarele
+    părinte (care conțin intrările create, redenumite sau șterse)
+
+    Args:
+        paths (iterable): Căile fișierelor; cele care nu mai există contează doar prin director
+    """
+    directories = set()
+    for path in paths:
+        directories.add(os.path.dirname(os.path.abspath(path)))
+        try:
+            descriptor = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            continue
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+    for directory in sorted(directories):
+        try:
+            descriptor = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # Directoarele nu pot fi deschise pe toate platformele (ex. Windows)
+            continue
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+
+def _write_file_atomic(path, payload, sync_paths):
+    """Fișier temporar + os.replace; fsync imediat sau amânat prin sync_paths"""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+        if sync_paths is None:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    if sync_paths is None:
+        fsync_paths([os.path.dirname(os.path.abspath(path))])
+    else:
+        sync_paths.add(path)
+
+
+def write_json_atomic(path, data, sync_paths=None):
+    """
+    Scrie un fișier JSON compact prin fișier temporar + os.replace (fără fișiere trunchiate)
+
+    Args:
+        path (str): Calea fișierului
+        data (dict): Conținutul
+        sync_paths (set, optional): Colectează calea pentru un fsync comun ulterior (fsync_paths);
+            implicit fișierul și directorul său sunt sincronizate imediat
+    """
+    _write_file_atomic(path, canonical_json(data), sync_paths)
+
+
+class ContentAddressedStore:
+    """
+    Depozit de obiecte adresate prin conținut pentru corpurile checkpoint-urilor.
+
+    Fiecare corp este serializat canonic, identificat prin SHA-256 și salvat o
+    singură dată, comprimat, în objects/<primele 2 caractere>/<restul hash-ului>.
+    Copiile primare, distribuite, ascunse și ghost devin referințe mici care
+    conțin doar hash-ul obiectului și câmpurile proprii nivelului lor. La citire
+    hash-ul este recalculat, deci orice modificare a obiectului este detectată.
+    """
+
+    def __init__(self, root=DEFAULT_OBJECTS_DIR, compression_level=COMPRESSION_LEVEL):
+        self.root = root
+        self.compression_level = compression_level
+        os.makedirs(self.root, exist_ok=True)
+
+        # Statistici
+        self.objects_written = 0
+        self.duplicate_puts = 0
+        self.bytes_raw = 0
+        self.bytes_stored = 0
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:])
+
+    def put(self, data, sync_paths=None):
+        """
+        Salvează un corp de checkpoint (o singură dată per conținut)
+
+        Args:
+            data (dict): Corpul checkpoint-ului
+            sync_paths (set, optional): Colectează căile scrise pentru un fsync comun ulterior
+
+        Returns:
+            str: Hash-ul SHA-256 (hex) al obiectului
+        """
+        raw = canonical_json(data)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            self.duplicate_puts += 1
+            return digest
+
+        compressed = zlib.compress(raw, self.compression_level)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+            # Intrarea noului director de prefix trebuie și ea să fie durabilă
+            if sync_paths is None:
+                fsync_paths([directory])
+            else:
+                sync_paths.add(directory)
+        _write_file_atomic(path, compressed, sync_paths)
+
+        self.objects_written += 1
+        self.bytes_raw += len(raw)
+        self.bytes_stored += len(compressed)
+        return digest
+
+    def get(self, digest):
+        """
+        Citește și verifică un obiect
+
+        Returns:
+            dict: Corpul checkpoint-ului
+
+        Raises:
+            KeyError: Obiectul nu există
+            ValueError: Conținutul nu mai corespunde hash-ului (obiect manipulat)
+        """
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                raw = zlib.decompress(f.read())
+        except FileNotFoundError:
+            raise KeyError(digest)
+        if hashlib.sha256(raw).hexdigest() != digest:
+            raise ValueError(f"Obiectul {digest} nu corespunde hash-ului său")
+        return json.loads(raw)
+
+    def exists(self, digest):
+        return os.path.exists(self._object_path(digest))
+
+    def delete(self, digest):
+        try:
+            os.remove(self._object_path(digest))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_digests(self):
+        """Hash-urile tuturor obiectelor din depozit"""
+        for prefix in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith(".tmp"):
+                    yield prefix + name
+
+    def resolve(self, reference):
+        """
+        Reconstruiește înregistrarea completă dintr-o referință
+
+        Corpul obiectului este completat cu câmpurile proprii nivelului
+        (ex. distributed_id, hidden_key), ca în formatul vechi cu copii complete.
+        Referințele ghost se rezolvă doar la corpul checkpoint-ului.
+        """
+        data = self.get(reference["object"])
+        if reference.get("tier") != "ghost":
+            data.update({key: value for key, value in reference.items() if key not in REFERENCE_KEYS})
+        return data
+
+    def get_stats(self):
+        return {
+            "root": self.root,
+            "objects_written": self.objects_written,
+            "duplicate_puts": self.duplicate_puts,
+            "bytes_raw": self.bytes_raw,
+            "bytes_stored": self.bytes_stored,
+            "compression_ratio": round(self.bytes_raw / self.bytes_stored, 2) if self.bytes_stored else None
+        }
+
+
+def make_reference(tier, checkpoint_id, digest, **fields):
+    """Înregistrarea-referință scrisă în locul unei copii complete"""
+    reference = {"id": checkpoint_id, "tier": tier, "object": digest}
+    reference.update(fields)
+    return reference
+
+
+def _classify_checkpoint_file(path):
+    """Nivelul unui fișier din arborele vechi, după nume și director"""
+    name = os.path.basename(path)
+    if name.endswith(".ghost"):
+        return "ghost"
+    if not name.endswith(".json"):
+        return None
+    if name.endswith("_hidden.json"):
+        return "hidden"
+    if "_dist" in name:
+        return "dist"
+    if os.path.basename(os.path.dirname(path)) == "primary":
+        return "primary"
+    return None
+
+
+def _split_record(tier, record):
+    """Separă corpul checkpoint-ului de câmpurile proprii nivelului"""
+    if tier == "ghost":
+        body = json.loads(base64.b64decode(record["ghost_checkpoint"]).decode())
+        fields = {key: value for key, value in record.items() if key != "ghost_checkpoint"}
+        return body, fields
+    tier_fields = {"dist": DIST_FIELDS, "hidden": HIDDEN_FIELDS}.get(tier, ())
+    body = {key: value for key, value in record.items() if key not in tier_fields}
+    fields = {key: record[key] for key in tier_fields if key in record}
+    return body, fields
+
+
+def migrate_checkpoint_tree(root="./checkpoints", dry_run=False):
+    """
+    Migrează arborele vechi de checkpoint-uri (copii JSON complete) la depozitul de obiecte
+
+    Fiecare fișier primar, distribuit, ascuns sau ghost este înlocuit, în același
+    loc, cu o referință la obiectul comprimat al corpului său. Fișierele deja
+    migrate sunt sărite, deci migrarea poate fi reluată după o întrerupere.
+
+    Args:
+        root (str): Rădăcina arborelui (implicit ./checkpoints)
+        dry_run (bool): Doar calculează efectul, fără a scrie nimic
+
+    Returns:
+        dict: Fișierele migrate / sărite / cu erori și octeții înainte și după
+    """
+    objects_dir = os.path.join(root, "objects")
+    store = None if dry_run else ContentAddressedStore(objects_dir)
+    seen_digests = set()
+    report = {
+        "root": root,
+        "dry_run": dry_run,
+        "files_migrated": 0,
+        "files_skipped": 0,
+        "errors": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+        "objects": 0
+    }
+
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if os.path.join(directory, d) != objects_dir)
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            tier = _classify_checkpoint_file(path)
+            if tier is None:
+                continue
+            size = os.path.getsize(path)
+            try:
+                with open(path, "r") as f:
+                    record = json.load(f)
+                if "object" in record:
+                    report["files_skipped"] += 1
+                    continue
+
+                body, fields = _split_record(tier, record)
+                raw = canonical_json(body)
+                digest = hashlib.sha256(raw).hexdigest()
+                if tier == "ghost":
+                    reference = dict(fields, tier="ghost", object=digest)
+                else:
+                    reference = make_reference(tier, body.get("id"), digest, **fields)
+
+                if digest not in seen_digests:
+                    seen_digests.add(digest)
+                    report["objects"] += 1
+                    report["bytes_after"] += len(zlib.compress(raw, COMPRESSION_LEVEL)) if dry_run else 0
+                if not dry_run:
+                    store.put(body)
+                    write_json_atomic(path, reference)
+                    report["bytes_after"] += os.path.getsize(path)
+                else:
+                    report["bytes_after"] += len(canonical_json(reference))
+                report["bytes_before"] += size
+                report["files_migrated"] += 1
+            except Exception as e:
+                report["errors"] += 1
+                print(f"[CHECKPOINT STORE] Eroare la migrarea {path}: {str(e)}")
+
+    if store is not None:
+        report["bytes_after"] += store.bytes_stored
+    return report
+
+
+if __name__ == "__main__":
+    # python checkpoint_store.py [rădăcină] [--dry-run]
+    arguments = [arg for arg in sys.argv[1:] if arg != "--dry-run"]
+    migration = migrate_checkpoint_tree(arguments[0] if arguments else "./checkpoints",
+                                        dry_run="--dry-run" in sys.argv[1:])
+    print(json.dumps(migration, indent=2))
@@ -7,7 +7,18 @@ import json
 import threading
 import shutil
 import base64
+import hmac
 import uuid
+import atexit
+from concurrent.futures import Future
+
+from quantum_rng import get_qrng
+from qkd_bb84 import get_qkd_key_source
+from checkpoint_store import ContentAddressedStore, make_reference, write_json_atomic, fsync_paths
+from checkpoint_log import SegmentLog, DEFAULT_SEGMENT_BYTES
+from checkpoint_writer import GroupCommitWriter, DEFAULT_QUEUE_SIZE, DEFAULT_COMMIT_WINDOW_SECONDS
+from checkpoint_debounce import SecurityCheckpointDebouncer, DEFAULT_MIN_INTERVAL_SECONDS, DEFAULT_MAX_EVENTS
+from checkpoint_index import CheckpointIndex
 
 class CheckpointRollbackSystem:
     """
@@ -40,6 +51,44 @@ class CheckpointRollbackSystem:
         for location in self.checkpoint_locations.values():
             os.makedirs(location, exist_ok=True)
         
+        # Corpurile checkpoint-urilor sunt salvate o singură dată, comprimate, după hash;
+        # locațiile de mai sus conțin doar referințe la aceste obiecte
+        self.object_store = ContentAddressedStore(os.path.join("./checkpoints", "objects"))
+        
+        # Backend-ul de stocare: "files" (referințe + obiecte) sau "log" (jurnal append-only de segmente)
+        self.storage_backend = os.environ.get('QUANTUM_CHECKPOINT_BACKEND', 'files').lower()
+        self.checkpoint_log = None
+        if self.storage_backend == "log":
+            self.checkpoint_log = SegmentLog(
+                os.path.join("./checkpoints", "log"),
+                max_segment_bytes=int(os.environ.get('QUANTUM_CHECKPOINT_SEGMENT_BYTES', DEFAULT_SEGMENT_BYTES))
+            )
+        
+        # Scrierile pe disc rulează pe un thread de fundal cu group commit (un fsync per batch);
+        # QUANTUM_CHECKPOINT_ASYNC=0 revine la scrierea sincronă pe thread-ul apelantului.
+        # Căile scrise de batch-ul curent; folosite doar de thread-ul scriitorului, în modul
+        # sincron fiecare apel își colectează și sincronizează propriile căi
+        self._unsynced_paths = set()
+        self.checkpoint_writer = None
+        if os.environ.get('QUANTUM_CHECKPOINT_ASYNC', '1') != '0':
+            commit_window_ms = float(os.environ.get('QUANTUM_CHECKPOINT_COMMIT_WINDOW_MS',
+                                                    DEFAULT_COMMIT_WINDOW_SECONDS * 1000))
+            self.checkpoint_writer = GroupCommitWriter(
+                self._sync_storage,
+                queue_size=int(os.environ.get('QUANTUM_CHECKPOINT_QUEUE_SIZE', DEFAULT_QUEUE_SIZE)),
+                commit_window=commit_window_ms / 1000
+            )
+            # Scrierile rămase în coadă sunt finalizate la oprirea procesului
+            atexit.register(self.checkpoint_writer.close)
+        
+        # Evenimentele de securitate (furt, fraudă, rollback) din aceeași fereastră împart un
+        # singur checkpoint; creat după scriitor, deci golit înaintea lui la oprirea procesului
+        self.security_debouncer = SecurityCheckpointDebouncer(
+            self._create_security_checkpoint,
+            min_interval=float(os.environ.get('QUANTUM_CHECKPOINT_MIN_INTERVAL', DEFAULT_MIN_INTERVAL_SECONDS)),
+            max_events=int(os.environ.get('QUANTUM_CHECKPOINT_MAX_EVENTS', DEFAULT_MAX_EVENTS))
+        )
+        
         # Lista de checkpoints
         self.checkpoints = []
         self.hidden_checkpoints = []
@@ -47,6 +96,9 @@ class CheckpointRollbackSystem:
         self.max_checkpoints = 50
         self.max_hidden_checkpoints = 100
         
+        # Index unificat al celor trei niveluri: după ID și după momentul creării
+        self.checkpoint_index = CheckpointIndex(ghost_decoder=self._decode_ghost_checkpoint)
+        
         # Sistem de detecție anti-theft și anti-scammer
         self.theft_attempts = []
         self.scammer_attempts = []
@@ -132,12 +184,13 @@ class CheckpointRollbackSystem:
                     break
                 time.sleep(1)
     
-    def create_checkpoint(self, description=""):
+    def create_checkpoint(self, description="", security_events=None):
         """
         Creează un nou checkpoint al sistemului cu protecție anti-theft și anti-scammer
         
         Args:
             description (str): Descrierea checkpoint-ului
+            security_events (list, optional): ID-urile evenimentelor de securitate acoperite
         
         Returns:
             dict: Informații despre checkpoint-ul creat
@@ -151,9 +204,6 @@ class CheckpointRollbackSystem:
         # Creăm semnătura checkpoint-ului
         checkpoint_signature = hashlib.sha256(f"{checkpoint_id}:{description}:{timestamp}:{self.signature}".encode()).hexdigest()
         
-        # Locația primară a checkpoint-ului
-        primary_location = os.path.join(self.checkpoint_locations["PRIMARY"], f"{checkpoint_id}.json")
-        
         # Informațiile checkpoint-ului
         checkpoint_data = {
             "id": checkpoint_id,
@@ -177,6 +227,9 @@ class CheckpointRollbackSystem:
             "auto_restore_enabled": self.auto_restore
         }
         
+        if security_events:
+            checkpoint_data["security_events"] = list(security_events)
+        
         # Protecție DNA
         if self.dna_encoding:
             checkpoint_data["dna_key"] = self._generate_dna_key(checkpoint_id)
@@ -195,91 +248,91 @@ class CheckpointRollbackSystem:
             checkpoint_data["blockchain_verification_key"] = self._generate_blockchain_verification_key(checkpoint_id)
             self.system_stats["blockchain_verifications"] += 1
         
-        # Salvăm checkpoint-ul în locația primară
-        try:
-            with open(primary_location, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
-        except Exception as e:
-            print(f"[CHECKPOINT SYSTEM] Eroare la salvarea checkpoint-ului primar: {str(e)}")
-        
-        # Distribuim checkpoint-ul dacă este activată protecția distribuită
+        # Replicile distribuite: fiecare are o locație aleatorie și un nod de protecție
+        replicas = []
         if self.distributed_protection:
             for i in range(self.replication_factor):
-                # Alegem o locație aleatorie din cele disponibile
-                location_key = random.choice(list(self.checkpoint_locations.keys()))
-                distributed_location = os.path.join(self.checkpoint_locations[location_key], f"{checkpoint_id}_dist{i}.json")
-                
-                # Adăugăm informații despre această copie distribuită
-                distributed_data = checkpoint_data.copy()
-                distributed_data["distributed_id"] = f"{checkpoint_id}_dist{i}"
-                distributed_data["distribution_node"] = self.protection_nodes[i % len(self.protection_nodes)]
-                distributed_data["distribution_timestamp"] = datetime.datetime.now().isoformat()
-                
-                try:
-                    with open(distributed_location, 'w') as f:
-                        json.dump(distributed_data, f, indent=2)
-                    self.system_stats["distributed_copies"] += 1
-                except Exception as e:
-                    print(f"[CHECKPOINT SYSTEM] Eroare la salvarea copiei distribuite: {str(e)}")
+                replicas.append({
+                    "location": random.choice(list(self.checkpoint_locations.keys())),
+                    "distributed_id": f"{checkpoint_id}_dist{i}",
+                    "distribution_node": self.protection_nodes[i % len(self.protection_nodes)],
+                    "distribution_timestamp": datetime.datetime.now().isoformat()
+                })
         
         # Creăm copii ascunse pentru protecție suplimentară anti-theft
+        hidden_data = None
         if self.anti_theft:
-            # Locația ascunsă pentru checkpoint
-            hidden_location = os.path.join(self.checkpoint_locations["HIDDEN"], f"{checkpoint_id}_hidden.json")
-            
-            # Copie ascunsă cu protecție suplimentară
             hidden_data = checkpoint_data.copy()
             hidden_data["hidden"] = True
             hidden_data["hidden_id"] = f"{checkpoint_id}_hidden"
             hidden_data["hidden_key"] = self._generate_hidden_key(checkpoint_id)
             hidden_data["theft_protection"] = "MAXIMUM"
             hidden_data["auto_restore_on_theft"] = True
-            
-            try:
-                with open(hidden_location, 'w') as f:
-                    json.dump(hidden_data, f, indent=2)
-                self.hidden_checkpoints.append(hidden_data)
-            except Exception as e:
-                print(f"[CHECKPOINT SYSTEM] Eroare la salvarea checkpoint-ului ascuns: {str(e)}")
-            
-            # Dacă depășim limita de checkpoint-uri ascunse, eliminăm cele mai vechi
-            if len(self.hidden_checkpoints) > self.max_hidden_checkpoints:
-                oldest_hidden = self.hidden_checkpoints.pop(0)
-                try:
-                    os.remove(os.path.join(self.checkpoint_locations["HIDDEN"], f"{oldest_hidden['id']}_hidden.json"))
-                except Exception:
-                    pass
         
         # Creăm un ghost checkpoint pentru recuperare în caz de atac avansat
-        ghost_location = os.path.join(self.checkpoint_locations["GHOST"], f"{uuid.uuid4().hex}.ghost")
         ghost_data = {
             "original_id": checkpoint_id,
             "timestamp": timestamp,
-            "ghost_signature": hashlib.sha256(f"GHOST-{checkpoint_id}-{random.random()}".encode()).hexdigest(),
+            "ghost_signature": hashlib.sha256(f"GHOST-{checkpoint_id}-{get_qrng().token_hex(16)}".encode()).hexdigest(),
             "recovery_key": hashlib.sha256(f"RECOVERY-{checkpoint_id}-{self.signature}".encode()).hexdigest(),
-            "ghost_checkpoint": base64.b64encode(json.dumps(checkpoint_data).encode()).decode(),
             "invisible": True,
             "auto_activate_on_theft": True,
-            "created_by": "Ervin Remus Radosavlevici - Sistem Securizat ADN"
+            "created_by": "Ervin Remus Radosavlevici - Sistem Securizat ADN",
+            "tier": "ghost"
         }
         
-        try:
-            with open(ghost_location, 'w') as f:
-                json.dump(ghost_data, f, indent=2)
+        # Scriem toate nivelurile prin backend-ul de stocare configurat; în modul asincron
+        # apelantul doar pune scrierea în coadă și primește un Future rezolvat după fsync
+        if self.checkpoint_writer is not None:
+            durable = self.checkpoint_writer.submit(self._persist_checkpoint, checkpoint_data, replicas,
+                                                    hidden_data, ghost_data)
+        else:
+            durable = Future()
+            try:
+                written_paths = set()
+                saved = self._persist_checkpoint(checkpoint_data, replicas, hidden_data, ghost_data,
+                                                 sync_paths=written_paths)
+                self._sync_storage(written_paths)
+                durable.set_result(saved)
+            except Exception as e:
+                print(f"[CHECKPOINT SYSTEM] Eroare la sincronizarea checkpoint-ului: {str(e)}")
+                durable.set_exception(e)
+        
+        # Nivelurile sunt înregistrate imediat; dacă scrierea eșuează, rezultatul
+        # Future-ului le retrage din liste și din index
+        saved = {"hidden": True, "ghost": True}
+        if durable.done():
+            saved = durable.result() if durable.exception() is None else {"hidden": False, "ghost": False}
+        
+        created_at = checkpoint_data["creation_datetime"]
+        if hidden_data is not None and saved["hidden"]:
+            self.hidden_checkpoints.append(hidden_data)
+            self.checkpoint_index.add("hidden", checkpoint_id, hidden_data, created_at)
+            
+            # Dacă depășim limita de checkpoint-uri ascunse, eliminăm cele mai vechi
+            if len(self.hidden_checkpoints) > self.max_hidden_checkpoints:
+                oldest_hidden = self.hidden_checkpoints.pop(0)
+                self.checkpoint_index.remove("hidden", oldest_hidden["id"])
+                self._remove_checkpoint_file("HIDDEN", f"{oldest_hidden['id']}_hidden.json")
+        
+        if saved["ghost"]:
+            # Ghost-ul este indexat în forma codificată și decodat doar dacă este selectat
             self.ghost_checkpoints.append(ghost_data)
-        except Exception as e:
-            print(f"[CHECKPOINT SYSTEM] Eroare la salvarea ghost checkpoint-ului: {str(e)}")
+            self.checkpoint_index.add("ghost", checkpoint_id, ghost_data, created_at)
+        
+        # Înregistrat după adăugare: un Future deja rezolvat apelează imediat funcția
+        durable.add_done_callback(
+            lambda future: self._reconcile_saved_tiers(checkpoint_id, hidden_data, ghost_data, future))
         
         # Adăugăm checkpoint-ul în lista principală
         self.checkpoints.append(checkpoint_data)
+        self.checkpoint_index.add("primary", checkpoint_id, checkpoint_data, created_at)
         
         # Dacă depășim limita de checkpoint-uri, eliminăm cele mai vechi
         if len(self.checkpoints) > self.max_checkpoints:
             oldest = self.checkpoints.pop(0)
-            try:
-                os.remove(os.path.join(self.checkpoint_locations["PRIMARY"], f"{oldest['id']}.json"))
-            except Exception:
-                pass
+            self.checkpoint_index.remove("primary", oldest["id"])
+            self._remove_checkpoint_file("PRIMARY", f"{oldest['id']}.json")
         
         # Actualizăm timestamp-ul ultimului checkpoint și statisticile
         self.last_checkpoint_time = datetime.datetime.now()
@@ -296,8 +349,218 @@ class CheckpointRollbackSystem:
             "hidden_protection": self.anti_theft,
             "quantum_protected": self.quantum_protection,
             "blockchain_verified": self.blockchain_verification,
-            "dna_encoded": self.dna_encoding
+            "dna_encoded": self.dna_encoding,
+            "durable": durable
+        }
+    
+    def _create_security_checkpoint(self, description, event_ids):
+        """Checkpoint-ul comun al unui grup de evenimente de securitate"""
+        return self.create_checkpoint(description, security_events=event_ids)
+    
+    def _persist_checkpoint(self, checkpoint_data, replicas, hidden_data, ghost_data, sync_paths=None):
+        """
+        Scrie toate nivelurile unui checkpoint prin backend-ul configurat
+        
+        Args:
+            sync_paths (set, optional): Colectează căile scrise (implicit cele ale batch-ului scriitorului)
+        """
+        if self.checkpoint_log is not None:
+            saved = self._write_checkpoint_log(checkpoint_data, replicas, hidden_data, ghost_data)
+        else:
+            saved = self._write_checkpoint_files(checkpoint_data, replicas, hidden_data, ghost_data,
+                                                 self._unsynced_paths if sync_paths is None else sync_paths)
+        saved["checkpoint_id"] = checkpoint_data["id"]
+        return saved
+    
+    def _reconcile_saved_tiers(self, checkpoint_id, hidden_data, ghost_data, future):
+        """Retrage nivelurile ascuns și ghost înregistrate anticipat dacă scrierea lor a eșuat"""
+        saved = future.result() if future.exception() is None else {"hidden": False, "ghost": False}
+        if hidden_data is not None and not saved["hidden"]:
+            if any(hidden is hidden_data for hidden in self.hidden_checkpoints):
+                self.hidden_checkpoints.remove(hidden_data)
+                self.checkpoint_index.remove("hidden", checkpoint_id)
+        if not saved["ghost"]:
+            if any(ghost is ghost_data for ghost in self.ghost_checkpoints):
+                self.ghost_checkpoints.remove(ghost_data)
+                self.checkpoint_index.remove("ghost", checkpoint_id)
+    
+    def _sync_storage(self, paths=None):
+        """
+        Face durabile scrierile unui batch: un fsync al segmentului activ sau, pe fișiere,
+        fsync doar pe fișierele scrise de batch și pe directoarele lor
+        
+        Args:
+            paths (set, optional): Căile de sincronizat (implicit cele ale batch-ului scriitorului)
+        """
+        if self.checkpoint_log is not None:
+            self.checkpoint_log.sync()
+            return
+        if paths is None:
+            paths, self._unsynced_paths = self._unsynced_paths, set()
+        fsync_paths(paths)
+    
+    def flush_checkpoints(self):
+        """Așteaptă până când toate checkpoint-urile puse în coadă sunt scrise durabil"""
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.flush()
+    
+    def _write_checkpoint_files(self, checkpoint_data, replicas, hidden_data, ghost_data, sync_paths):
+        """
+        Backend-ul pe fișiere: corpul este salvat o singură dată în depozitul de obiecte,
+        iar fiecare nivel (primar, replici, ascuns, ghost) primește o referință mică
+        
+        Args:
+            sync_paths (set): Colectează căile scrise pentru fsync-ul ulterior
+        
+        Returns:
+            dict: Ce niveluri au fost salvate (hidden, ghost)
+        """
+        checkpoint_id = checkpoint_data["id"]
+        saved = {"hidden": False, "ghost": False}
+        
+        try:
+            object_digest = self.object_store.put(checkpoint_data, sync_paths=sync_paths)
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la salvarea obiectului checkpoint-ului: {str(e)}")
+            object_digest = None
+        
+        # Fiecare replică este o referință într-o locație aleatorie, nu o copie a corpului
+        placements = []
+        if object_digest:
+            for replica in replicas:
+                distributed_location = os.path.join(self.checkpoint_locations[replica["location"]],
+                                                    f"{replica['distributed_id']}.json")
+                distributed_fields = {key: value for key, value in replica.items() if key != "location"}
+                try:
+                    write_json_atomic(distributed_location, make_reference("dist", checkpoint_id, object_digest,
+                                                                           **distributed_fields),
+                                      sync_paths=sync_paths)
+                    placements.append(replica["location"])
+                    self.system_stats["distributed_copies"] += 1
+                except Exception as e:
+                    print(f"[CHECKPOINT SYSTEM] Eroare la salvarea copiei distribuite: {str(e)}")
+        
+        # Referința primară, cu locațiile replicilor (copie completă dacă obiectul lipsește)
+        primary_location = os.path.join(self.checkpoint_locations["PRIMARY"], f"{checkpoint_id}.json")
+        try:
+            if object_digest:
+                write_json_atomic(primary_location, make_reference("primary", checkpoint_id, object_digest,
+                                                                   placements=placements),
+                                  sync_paths=sync_paths)
+            else:
+                write_json_atomic(primary_location, checkpoint_data, sync_paths=sync_paths)
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la salvarea checkpoint-ului primar: {str(e)}")
+        
+        if hidden_data is not None:
+            hidden_location = os.path.join(self.checkpoint_locations["HIDDEN"], f"{checkpoint_id}_hidden.json")
+            try:
+                if object_digest:
+                    hidden_fields = {key: value for key, value in hidden_data.items() if key not in checkpoint_data}
+                    write_json_atomic(hidden_location, make_reference("hidden", checkpoint_id, object_digest,
+                                                                      **hidden_fields),
+                                      sync_paths=sync_paths)
+                else:
+                    write_json_atomic(hidden_location, hidden_data, sync_paths=sync_paths)
+                saved["hidden"] = True
+            except Exception as e:
+                print(f"[CHECKPOINT SYSTEM] Eroare la salvarea checkpoint-ului ascuns: {str(e)}")
+        
+        if object_digest:
+            # Corpul nu mai este încorporat în base64: ghost-ul referă același obiect
+            ghost_data["object"] = object_digest
+        else:
+            ghost_data["ghost_checkpoint"] = base64.b64encode(json.dumps(checkpoint_data).encode()).decode()
+        
+        ghost_location = os.path.join(self.checkpoint_locations["GHOST"], f"{uuid.uuid4().hex}.ghost")
+        try:
+            write_json_atomic(ghost_location, ghost_data, sync_paths=sync_paths)
+            saved["ghost"] = True
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la salvarea ghost checkpoint-ului: {str(e)}")
+        
+        return saved
+    
+    def _write_checkpoint_log(self, checkpoint_data, replicas, hidden_data, ghost_data):
+        """
+        Backend-ul log-structured: toate nivelurile checkpoint-ului într-o singură
+        înregistrare adăugată secvențial în jurnalul de segmente
+        
+        Returns:
+            dict: Ce niveluri au fost salvate (hidden, ghost)
+        """
+        record = {
+            "checkpoint": checkpoint_data,
+            "replicas": replicas,
+            "hidden": {key: value for key, value in hidden_data.items() if key not in checkpoint_data}
+            if hidden_data is not None else None,
+            "ghost": ghost_data
         }
+        try:
+            self.checkpoint_log.append(checkpoint_data["id"], record)
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la scrierea în jurnalul de checkpoint-uri: {str(e)}")
+            return {"hidden": False, "ghost": False}
+        
+        self.system_stats["distributed_copies"] += len(replicas)
+        return {"hidden": hidden_data is not None, "ghost": True}
+    
+    def _remove_checkpoint_file(self, location_key, file_name):
+        """Șterge fișierul unui checkpoint eliminat (în jurnal înregistrările rămân ca istoric)"""
+        if self.checkpoint_log is not None:
+            return
+        path = os.path.join(self.checkpoint_locations[location_key], file_name)
+        if self.checkpoint_writer is not None:
+            # Prin aceeași coadă, deci după scrierea fișierului, chiar dacă aceasta încă așteaptă
+            self.checkpoint_writer.submit(self._remove_file, path)
+        else:
+            removed_paths = set()
+            self._remove_file(path, removed_paths)
+            self._sync_storage(removed_paths)
+    
+    def _remove_file(self, path, sync_paths=None):
+        try:
+            os.remove(path)
+            # Ștergerea devine durabilă prin fsync-ul directorului (implicit la sincronizarea batch-ului)
+            (self._unsynced_paths if sync_paths is None else sync_paths).add(path)
+        except Exception:
+            pass
+    
+    def _load_persisted_checkpoint(self, checkpoint_id):
+        """
+        Citește un checkpoint din stocare (ex. după ce a fost eliminat din memorie)
+        
+        În jurnal: o căutare în index și o singură citire; pe fișiere: referința primară
+        și obiectul ei.
+        
+        Returns:
+            dict: Corpul checkpoint-ului sau None dacă nu există
+        """
+        self.flush_checkpoints()
+        try:
+            if self.checkpoint_log is not None:
+                record = self.checkpoint_log.get(checkpoint_id)
+                return record["checkpoint"] if record else None
+            
+            primary_location = os.path.join(self.checkpoint_locations["PRIMARY"], f"{checkpoint_id}.json")
+            if not os.path.exists(primary_location):
+                return None
+            with open(primary_location, 'r') as f:
+                record = json.load(f)
+            return self.object_store.get(record["object"]) if "object" in record else record
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la citirea checkpoint-ului {checkpoint_id}: {str(e)}")
+            return None
+    
+    def _decode_ghost_checkpoint(self, ghost_checkpoint):
+        """Corpul unui ghost checkpoint: obiect referit, corp încorporat (format vechi) sau jurnal"""
+        # Referința la obiect este completată de scriitorul de fundal
+        self.flush_checkpoints()
+        if "object" in ghost_checkpoint:
+            return self.object_store.get(ghost_checkpoint["object"])
+        if "ghost_checkpoint" in ghost_checkpoint:
+            return json.loads(base64.b64decode(ghost_checkpoint["ghost_checkpoint"]).decode())
+        return self._load_persisted_checkpoint(ghost_checkpoint["original_id"])
     
     def rollback_to_checkpoint(self, checkpoint_id=None):
         """
@@ -318,32 +581,18 @@ class CheckpointRollbackSystem:
                 }
             target_checkpoint = self.checkpoints[-1]
         else:
-            # Căutăm checkpoint-ul specificat
-            target_checkpoint = next((cp for cp in self.checkpoints if cp["id"] == checkpoint_id), None)
+            # Căutăm checkpoint-ul specificat în index: primar, apoi ascuns, apoi ghost (decodat doar acum)
+            target_checkpoint = self.checkpoint_index.get(checkpoint_id)
             
             if not target_checkpoint:
-                # Verificăm și în copiile ascunse
-                hidden_checkpoint = next((cp for cp in self.hidden_checkpoints if cp["id"] == checkpoint_id), None)
-                
-                if hidden_checkpoint:
-                    target_checkpoint = hidden_checkpoint
-                else:
-                    # Verificăm în ghost checkpoints
-                    ghost_checkpoint = next((cp for cp in self.ghost_checkpoints if cp["original_id"] == checkpoint_id), None)
-                    
-                    if ghost_checkpoint:
-                        # Descifrăm ghost checkpoint-ul
-                        try:
-                            ghost_data = json.loads(base64.b64decode(ghost_checkpoint["ghost_checkpoint"]).decode())
-                            target_checkpoint = ghost_data
-                        except Exception:
-                            pass
-                    
-                    if not target_checkpoint:
-                        return {
-                            "success": False,
-                            "message": f"Checkpoint-ul cu ID-ul {checkpoint_id} nu a fost găsit."
-                        }
+                # Ultima variantă: checkpoint-ul persistat, eliminat între timp din memorie
+                target_checkpoint = self._load_persisted_checkpoint(checkpoint_id)
+            
+            if not target_checkpoint:
+                return {
+                    "success": False,
+                    "message": f"Checkpoint-ul cu ID-ul {checkpoint_id} nu a fost găsit."
+                }
         
         # Verificăm semnătura checkpoint-ului pentru a preveni manipularea
         verification_result = self._verify_checkpoint_integrity(target_checkpoint)
@@ -365,8 +614,8 @@ class CheckpointRollbackSystem:
         rollback_id = hashlib.sha256(f"ROLLBACK-{target_checkpoint['id']}-{datetime.datetime.now()}".encode()).hexdigest()[:16]
         timestamp = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
         
-        # Creăm un checkpoint înainte de rollback pentru siguranță
-        pre_rollback_checkpoint = self.create_checkpoint(f"Pre-Rollback Security Checkpoint")
+        # Creăm un checkpoint înainte de rollback pentru siguranță (comun pentru rollback-urile apropiate)
+        pre_rollback_checkpoint = self.security_debouncer.record(rollback_id, "Pre-Rollback Security Checkpoint")
         
         # Actualizăm statisticile și timestamp-ul
         self.last_rollback_time = datetime.datetime.now()
@@ -378,6 +627,7 @@ class CheckpointRollbackSystem:
             "checkpoint_id": target_checkpoint["id"],
             "timestamp": timestamp,
             "pre_rollback_checkpoint": pre_rollback_checkpoint["checkpoint_id"],
+            "pre_rollback_checkpoint_future": pre_rollback_checkpoint["future"],
             "checkpoint_description": target_checkpoint["description"],
             "checkpoint_timestamp": target_checkpoint["timestamp"],
             "message": f"Rollback la checkpoint-ul '{target_checkpoint['description']}' efectuat cu succes."
@@ -457,8 +707,8 @@ class CheckpointRollbackSystem:
         auto_block = len(self.theft_attempts) >= self.auto_block_threshold
         auto_blacklist = len(self.theft_attempts) >= self.auto_blacklist_threshold
         
-        # Creăm un checkpoint de siguranță după tentativa de furt
-        security_checkpoint = self.create_checkpoint("Security Checkpoint After Theft Attempt")
+        # Creăm un checkpoint de siguranță după tentativa de furt (comun pentru o rafală de tentative)
+        security_checkpoint = self.security_debouncer.record(attempt_id, "Security Checkpoint After Theft Attempt")
         
         # Returnăm rezultatul gestionării
         return {
@@ -468,6 +718,7 @@ class CheckpointRollbackSystem:
             "auto_block_activated": auto_block,
             "auto_blacklist_activated": auto_blacklist,
             "security_checkpoint_created": security_checkpoint["checkpoint_id"],
+            "security_checkpoint": security_checkpoint["future"],
             "system_status": "SECURE",
             "countermeasures_activated": True,
             "message": "Tentativă de furt detectată și blocată. Contramăsuri active."
@@ -503,8 +754,8 @@ class CheckpointRollbackSystem:
         auto_block = True
         auto_blacklist = True
         
-        # Creăm un checkpoint de siguranță după tentativa de fraudă
-        security_checkpoint = self.create_checkpoint("Emergency Checkpoint After Scammer Attempt")
+        # Creăm un checkpoint de siguranță după tentativa de fraudă (comun pentru o rafală de tentative)
+        security_checkpoint = self.security_debouncer.record(attempt_id, "Emergency Checkpoint After Scammer Attempt")
         
         # Adăugăm operația în lista de operații blocate
         self.banned_operations.append({
@@ -522,6 +773,7 @@ class CheckpointRollbackSystem:
             "auto_block_activated": auto_block,
             "auto_blacklist_activated": auto_blacklist,
             "security_checkpoint_created": security_checkpoint["checkpoint_id"],
+            "security_checkpoint": security_checkpoint["future"],
             "system_status": "MAXIMUM_PROTECTION",
             "countermeasures_activated": True,
             "global_blacklist_updated": True,
@@ -547,16 +799,20 @@ class CheckpointRollbackSystem:
         Returns:
             dict: Detaliile checkpoint-ului sau None dacă nu a fost găsit
         """
-        # Căutăm în checkpoint-uri normale
-        checkpoint = next((cp for cp in self.checkpoints if cp["id"] == checkpoint_id), None)
-        
-        if checkpoint:
-            return checkpoint
+        # Căutăm în checkpoint-uri normale, apoi în cele ascunse
+        return self.checkpoint_index.get(checkpoint_id, tiers=("primary", "hidden"))
+    
+    def get_checkpoint_before(self, when):
+        """
+        Obține cel mai recent checkpoint creat cel târziu la un moment dat
         
-        # Căutăm în checkpoint-uri ascunse dacă nu am găsit
-        hidden_checkpoint = next((cp for cp in self.hidden_checkpoints if cp["id"] == checkpoint_id), None)
+        Args:
+            when (datetime): Momentul limită (sau șir ISO)
         
-        return hidden_checkpoint
+        Returns:
+            dict: Checkpoint-ul (din nivelul primar, ascuns sau ghost) sau None
+        """
+        return self.checkpoint_index.latest_before(when)
     
     def get_system_status(self):
         """
@@ -587,7 +843,12 @@ class CheckpointRollbackSystem:
             "owner": "Ervin Remus Radosavlevici",
             "system_integrity": "100%",
             "auto_backup_active": self.auto_backup_thread is not None and self.auto_backup_thread.is_alive(),
-            "auto_backup_interval_minutes": self.auto_backup_interval_minutes
+            "auto_backup_interval_minutes": self.auto_backup_interval_minutes,
+            "storage_backend": self.storage_backend,
+            "storage_stats": self.checkpoint_log.get_stats() if self.checkpoint_log is not None else self.object_store.get_stats(),
+            "checkpoint_writer": self.checkpoint_writer.get_stats() if self.checkpoint_writer is not None else None,
+            "security_checkpoints": self.security_debouncer.get_stats(),
+            "checkpoint_index": self.checkpoint_index.get_stats()
         }
     
     def _verify_checkpoint_integrity(self, checkpoint):
@@ -657,32 +918,36 @@ class CheckpointRollbackSystem:
         dna_base = f"DNA-KEY-{checkpoint_id}-{self.signature}"
         dna_hash = hashlib.sha256(dna_base.encode()).hexdigest()
         
-        # Simulăm o cheie DNA (în realitate ar fi un algoritm complex bazat pe secvențe ADN)
-        dna_bases = ['A', 'C', 'G', 'T']
-        dna_key = ''.join(random.choice(dna_bases) for _ in range(64))
+        # Bazele sunt extrase din rezervorul de biți cuantici (4 baze per octet)
+        dna_key = get_qrng().dna_bases(64)
         
         return f"DNA-{dna_hash[:8]}-{dna_key}"
     
     def _generate_dna_sequence(self, signature):
         """Generează o secvență DNA pentru verificare"""
-        # Simulăm o secvență DNA (în realitate ar fi un algoritm complex)
-        dna_bases = ['A', 'C', 'G', 'T']
-        dna_sequence = ''.join(random.choice(dna_bases) for _ in range(128))
+        # Secvența provine din rezervorul de biți cuantici, fără extrageri per caracter
+        dna_sequence = get_qrng().dna_bases(128)
         
         return dna_sequence
     
     def _generate_quantum_key(self, checkpoint_id):
         """Generează o cheie quantum pentru checkpoint"""
         quantum_base = f"QUANTUM-KEY-{checkpoint_id}-{self.signature}"
-        quantum_hash = hashlib.sha256(quantum_base.encode()).hexdigest()
         
-        # Simulăm o cheie quantum (în realitate ar fi generată de un calculator quantum)
+        # Cheia secretă provine dintr-o sesiune BB84 simulată (QKD)
+        try:
+            qkd_key = get_qkd_key_source().get_key(32)
+        except Exception as e:
+            print(f"[CHECKPOINT SYSTEM] Eroare la distribuția cheii QKD: {str(e)}")
+            return f"Q-{hashlib.sha256(quantum_base.encode()).hexdigest()}"
+        
+        quantum_hash = hmac.new(qkd_key, quantum_base.encode(), hashlib.sha256).hexdigest()
         return f"Q-{quantum_hash}"
     
     def _generate_quantum_entanglement(self, signature):
         """Generează un identificator de entanglement quantum"""
         # Simulăm un ID de entanglement quantum
-        entanglement_id = hashlib.sha256(f"ENTANGLE-{signature}-{random.random()}".encode()).hexdigest()
+        entanglement_id = hashlib.sha256(f"ENTANGLE-{signature}-{get_qrng().token_hex(16)}".encode()).hexdigest()
         
         return f"QE-{entanglement_id[:16]}"
     
@@ -695,7 +960,7 @@ class CheckpointRollbackSystem:
     
     def _generate_blockchain_verification_key(self, checkpoint_id):
         """Generează o cheie de verificare blockchain"""
-        verification_base = f"VERIFY-{checkpoint_id}-{self.signature}-{random.random()}"
+        verification_base = f"VERIFY-{checkpoint_id}-{self.signature}-{get_qrng().token_hex(16)}"
         verification_key = hashlib.sha256(verification_base.encode()).hexdigest()
         
         return f"BV-{verification_key[:16]}"
@@ -0,0 +1,158 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Capacitatea cozii; la coadă plină apelantul așteaptă (backpressure), nu se pierd scrieri
+DEFAULT_QUEUE_SIZE = 1024
+
+# Fereastra în care scrierile sosite după prima sunt adunate în același batch
+DEFAULT_COMMIT_WINDOW_SECONDS = 0.005
+
+# Numărul maxim de scrieri per batch (per sincronizare pe disc)
+DEFAULT_MAX_BATCH = 256
+
+
+class GroupCommitWriter:
+    """
+    Scriitor de fundal cu group commit pentru checkpoint-uri.
+
+    Apelantul doar pune scrierea într-o coadă mărginită și primește un
+    concurrent.futures.Future. Thread-ul de fundal adună scrierile sosite într-o
+    fereastră scurtă, le execută în ordine, apoi apelează o singură dată funcția
+    de sincronizare (fsync) pentru tot batch-ul; abia după aceasta Future-urile
+    sunt rezolvate, deci un Future terminat înseamnă o scriere durabilă.
+    """
+
+    def __init__(self, sync_function, queue_size=DEFAULT_QUEUE_SIZE,
+                 commit_window=DEFAULT_COMMIT_WINDOW_SECONDS, max_batch=DEFAULT_MAX_BATCH, name="checkpoint-writer"):
+        """
+        Args:
+            sync_function (callable): Face durabile scrierile batch-ului (ex. fsync)
+            queue_size (int): Capacitatea cozii de scrieri
+            commit_window (float): Fereastra de coalescență (secunde)
+            max_batch (int): Scrieri maxime per batch
+            name (str): Numele thread-ului de fundal
+        """
+        self.sync_function = sync_function
+        self.commit_window = float(commit_window)
+        self.max_batch = max(1, int(max_batch))
+        self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._closed = False
+
+        # Statistici
+        self.writes_completed = 0
+        self.write_errors = 0
+        self.batches = 0
+        self.batched_writes = 0
+        self.syncs = 0
+        self.sync_seconds = 0.0
+        self.max_batch_seen = 0
+
+        self._thread = threading.Thread(target=self._writer_loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Pune o scriere în coadă
+
+        Returns:
+            Future: Se rezolvă cu rezultatul funcției după sincronizarea batch-ului
+        """
+        if self._closed:
+            raise RuntimeError("Scriitorul de checkpoint-uri a fost închis")
+        future = Future()
+        self._queue.put((future, function, args, kwargs))
+        return future
+
+    def _collect_batch(self, first):
+        """Adună scrierile sosite în fereastra de commit după prima"""
+        batch = [first]
+        deadline = time.monotonic() + self.commit_window
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is None:
+                break
+        return batch
+
+    def _writer_loop(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                return
+            batch = self._collect_batch(first)
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+
+            results = []
+            for future, function, args, kwargs in batch:
+                try:
+                    results.append((future, function(*args, **kwargs), None))
+                except Exception as e:
+                    self.write_errors += 1
+                    print(f"[CHECKPOINT WRITER] Eroare la scrierea checkpoint-ului: {str(e)}")
+                    results.append((future, None, e))
+
+            # Un singur fsync pentru tot batch-ul (group commit)
+            sync_error = None
+            start_time = time.perf_counter()
+            try:
+                self.sync_function()
+            except Exception as e:
+                sync_error = e
+                print(f"[CHECKPOINT WRITER] Eroare la sincronizarea pe disc: {str(e)}")
+            self.sync_seconds += time.perf_counter() - start_time
+            self.syncs += 1
+            self.batches += 1
+            self.batched_writes += len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+
+            for future, result, error in results:
+                error = error or sync_error
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    self.writes_completed += 1
+                    future.set_result(result)
+
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Așteaptă până când toate scrierile puse în coadă sunt durabile"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Golește coada și oprește thread-ul de fundal"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def get_stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "writes_completed": self.writes_completed,
+            "write_errors": self.write_errors,
+            "batches": self.batches,
+            "syncs": self.syncs,
+            "average_batch_size": round(self.batched_writes / self.batches, 2) if self.batches else None,
+            "max_batch_size": self.max_batch_seen,
+            "sync_ms_total": round(self.sync_seconds * 1000, 3)
+        }
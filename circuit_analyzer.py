@@ -0,0 +1,141 @@
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Porțile Clifford suportate de metoda "stabilizer" din Aer
+CLIFFORD_GATES = {
+    "id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg",
+    "cx", "cy", "cz", "swap", "ecr", "iswap", "dcx", "pauli"
+}
+
+# Operațiile non-unitare pe care metoda "stabilizer" le acceptă
+STABILIZER_OPERATIONS = {"measure", "reset", "barrier", "delay"}
+
+# Statevector-ul complet este folosit până la această dimensiune (16 B * 2^n: 24 qubiți = 256 MB)
+STATEVECTOR_MAX_QUBITS = 24
+
+# Un circuit este considerat slab entanglat dacă limita superioară a dimensiunii
+# legăturii MPS (2^tăieturi) rămâne sub 2^MPS_MAX_BOND_BITS
+MPS_MAX_BOND_BITS = 12
+
+
+def _operations(circuit, qubit_map=None):
+    """Parcurge recursiv operațiile circuitului, inclusiv blocurile control-flow"""
+    if qubit_map is None:
+        qubit_map = list(range(circuit.num_qubits))
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [qubit_map[circuit.find_bit(qubit).index] for qubit in instruction.qubits]
+        blocks = getattr(operation, "blocks", None)
+        if blocks:
+            # Operația control-flow contează doar prin conținutul blocurilor
+            yield operation.name, qubits, True
+            for block in blocks:
+                if block is not None:
+                    yield from _operations(block, qubits)
+        else:
+            yield operation.name, qubits, False
+
+
+def _max_cut_crossings(num_qubits, two_qubit_gates):
+    """
+    Numărul maxim de porți cu doi qubiți care traversează o tăietură i | i+1
+    în ordinea liniară a qubiților (limită pentru entanglement-ul din MPS)
+    """
+    if num_qubits < 2 or not two_qubit_gates:
+        return 0
+
+    # Diferențe pe tăieturi: poarta (a, b) traversează tăieturile a..b-1
+    crossings = [0] * (num_qubits + 1)
+    for a, b in two_qubit_gates:
+        low, high = min(a, b), max(a, b)
+        crossings[low] += 1
+        crossings[high] -= 1
+
+    maximum = running = 0
+    for cut in range(num_qubits - 1):
+        running += crossings[cut]
+        # Entanglement-ul pe o tăietură este limitat și de numărul de qubiți din partea mai mică
+        bounded = min(running, cut + 1, num_qubits - cut - 1)
+        maximum = max(maximum, bounded)
+    return maximum
+
+
+def analyze_circuit(circuit):
+    """
+    Analizează un circuit și alege metoda de simulare Aer potrivită
+
+    - circuitele exclusiv Clifford (Bell, GHZ, teleportare fără poarta T)
+      merg pe metoda "stabilizer", care scalează polinomial cu numărul de qubiți;
+    - circuitele mici non-Clifford merg pe "statevector";
+    - circuitele mari slab entanglate merg pe "matrix_product_state".
+
+    Args:
+        circuit (QuantumCircuit): Circuitul de analizat
+
+    Returns:
+        dict: Metoda aleasă, motivul și metricile circuitului
+    """
+    num_qubits = circuit.num_qubits
+    non_clifford = set()
+    two_qubit_gates = []
+    multi_qubit_gates = 0
+    has_control_flow = False
+
+    for name, qubits, is_control_flow in _operations(circuit):
+        if is_control_flow:
+            has_control_flow = True
+            continue
+        if name not in CLIFFORD_GATES and name not in STABILIZER_OPERATIONS:
+            non_clifford.add(name)
+        if len(qubits) == 2:
+            two_qubit_gates.append((qubits[0], qubits[1]))
+        elif len(qubits) > 2:
+            multi_qubit_gates += 1
+            # O poartă pe k qubiți este tratată ca lanț de interacțiuni între extremități
+            two_qubit_gates.append((min(qubits), max(qubits)))
+
+    max_cut_crossings = _max_cut_crossings(num_qubits, two_qubit_gates)
+    clifford = not non_clifford
+
+    if clifford:
+        method = "stabilizer"
+        reason = "Circuit exclusiv Clifford: simulare stabilizer în timp polinomial"
+    elif num_qubits <= STATEVECTOR_MAX_QUBITS:
+        method = "statevector"
+        reason = f"Circuit non-Clifford cu {num_qubits} qubiți: statevector complet"
+    elif max_cut_crossings <= MPS_MAX_BOND_BITS:
+        method = "matrix_product_state"
+        reason = f"Entanglement redus (max {max_cut_crossings} porți pe o tăietură): MPS"
+    else:
+        method = "matrix_product_state"
+        reason = (f"Circuit mare și puternic entanglat (max {max_cut_crossings} porți pe o tăietură); "
+                  f"MPS este singura metodă fezabilă, dar poate fi lentă")
+
+    return {
+        "method": method,
+        "reason": reason,
+        "num_qubits": num_qubits,
+        "clifford": clifford,
+        "non_clifford_gates": sorted(non_clifford),
+        "two_qubit_gates": len(two_qubit_gates),
+        "multi_qubit_gates": multi_qubit_gates,
+        "max_cut_crossings": max_cut_crossings,
+        "has_control_flow": has_control_flow,
+        "estimated_statevector_mb": round(16 * 2 ** num_qubits / 1024 ** 2, 3) if num_qubits <= 64 else float('inf')
+    }
+
+
+def supports_natively(circuit, backend):
+    """
+    Verifică dacă backend-ul poate rula circuitul fără transpilare
+    (toate operațiile sunt native). Pentru circuite cu sute de qubiți
+    transpilarea durează secunde și nu aduce nimic simulatorului Aer.
+    """
+    target = getattr(backend, "target", None)
+    if target is None:
+        return False
+    supported = set(target.operation_names)
+    return all(name in supported for name, _, _ in _operations(circuit))
@@ -0,0 +1,184 @@
+import math
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Parametrii stării de teleportat: |ψ⟩ = cos(θ/2)|0⟩ + e^(iφ) sin(θ/2)|1⟩
+# Sunt definiți o singură dată pentru ca circuitele transpilate din cache
+# să poată fi legate cu aceiași parametri la fiecare apel.
+TELEPORT_THETA = Parameter("theta")
+TELEPORT_PHI = Parameter("phi")
+
+
+def build_parameterized_teleportation_circuit(measure=True, corrections=True):
+    """
+    Construiește circuitul de teleportare parametrizat după starea de intrare (θ, φ).
+
+    Corecțiile X/Z sunt aplicate cu porți controlate quantum (principiul măsurării
+    amânate), astfel încât toate măsurătorile sunt la final și simulatorul poate
+    eșantiona toate shot-urile dintr-o singură evoluție a stării. Distribuția
+    rezultatelor este identică cu cea a protocolului cu corecții clasice.
+
+    Args:
+        measure (bool): Dacă False, circuitul nu conține măsurători și poate fi
+            evaluat exact ca statevector
+        corrections (bool): Dacă False, circuitul se oprește după rotația în baza Bell,
+            iar corecțiile sunt adăugate de apelant (ex. ca un canal cu zgomot)
+
+    Returns:
+        QuantumCircuit: Circuit cu 3 qubiți și 3 biți clasici
+            (c0, c1 = măsurătoarea Bell, c2 = qubit-ul teleportat)
+    """
+    qc = QuantumCircuit(3, 3) if measure else QuantumCircuit(3)
+
+    # Starea de teleportat (qubit 0)
+    qc.u(TELEPORT_THETA, TELEPORT_PHI, 0, 0)
+    qc.barrier()
+
+    # Perechea Bell între qubiții 1 și 2
+    qc.h(1)
+    qc.cx(1, 2)
+    qc.barrier()
+
+    # Măsurătoarea Bell (rotația în baza Bell)
+    qc.cx(0, 1)
+    qc.h(0)
+    qc.barrier()
+
+    # Corecții controlate quantum în locul celor condiționate clasic
+    if corrections:
+        qc.cx(1, 2)
+        qc.cz(0, 2)
+
+    if measure:
+        qc.measure([0, 1, 2], [0, 1, 2])
+    return qc
+
+
+def build_teleportation_chain_circuit(hops, t_gate=False):
+    """
+    Construiește un lanț de teleportări succesive: starea pornește pe qubit-ul 0
+    și este teleportată de `hops` ori, folosind câte o pereche Bell nouă la fiecare pas.
+
+    Fără poarta T circuitul este exclusiv Clifford și poate fi simulat cu metoda
+    stabilizer pentru sute sau mii de qubiți.
+
+    Args:
+        hops (int): Numărul de teleportări
+        t_gate (bool): Pregătește starea H·T (non-Clifford) în loc de H·S
+
+    Returns:
+        QuantumCircuit: Circuit cu 2*hops+1 qubiți; ultimul qubit este măsurat în c0
+    """
+    num_qubits = 2 * hops + 1
+    qc = QuantumCircuit(num_qubits, 1)
+
+    qc.h(0)
+    if t_gate:
+        qc.t(0)
+    else:
+        qc.s(0)
+
+    for hop in range(hops):
+        source, alice, bob = 2 * hop, 2 * hop + 1, 2 * hop + 2
+        qc.h(alice)
+        qc.cx(alice, bob)
+        qc.cx(source, alice)
+        qc.h(source)
+        # Corecții controlate quantum (măsurare amânată)
+        qc.cx(alice, bob)
+        qc.cz(source, bob)
+
+    qc.measure(num_qubits - 1, 0)
+    return qc
+
+
+def build_teleportation_tomography_circuits():
+    """
+    Construiește cele trei variante de măsurare ale teleportării pentru tomografia qubit-ului 2.
+
+    Fiecare variantă rotește qubit-ul 2 astfel încât măsurătoarea în baza computațională
+    să fie o măsurătoare a lui X (H), Y (S†, H) sau Z.
+
+    Returns:
+        dict: Baza ("X", "Y", "Z") -> circuit cu 3 qubiți și un bit clasic (qubit-ul 2 în c0)
+    """
+    circuits = {}
+    for basis in ("X", "Y", "Z"):
+        qc = QuantumCircuit(3, 1, name=f"tomography_{basis.lower()}")
+        qc.compose(build_parameterized_teleportation_circuit(measure=False), inplace=True)
+        qc.barrier()
+        if basis == "Y":
+            qc.sdg(2)
+        if basis in ("X", "Y"):
+            qc.h(2)
+        qc.measure(2, 0)
+        circuits[basis] = qc
+    return circuits
+
+
+def build_feedforward_teleportation_circuit():
+    """
+    Construiește protocolul de teleportare cu corecții clasice (if_test), ca în run_teleportation.
+
+    Starea H·T de pe qubit-ul 0 este teleportată pe qubit-ul 2, care este măsurat în c2.
+
+    Returns:
+        QuantumCircuit: Circuit cu 3 qubiți și 3 biți clasici
+    """
+    qc = QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.t(0)
+    qc.h(1)
+    qc.cx(1, 2)
+    qc.cx(0, 1)
+    qc.h(0)
+    qc.measure([0, 1], [0, 1])
+    with qc.if_test((qc.clbits[1], 1)):
+        qc.x(2)
+    with qc.if_test((qc.clbits[0], 1)):
+        qc.z(2)
+    qc.measure(2, 2)
+    return qc
+
+
+def build_ghz_circuit(num_qubits, measure=True):
+    """
+    Construiește starea GHZ pe `num_qubits` qubiți: (|0...0⟩ + |1...1⟩)/√2
+
+    Returns:
+        QuantumCircuit: Lanț H + CX, cu toți qubiții măsurați (dacă measure=True)
+    """
+    qc = QuantumCircuit(num_qubits, num_qubits) if measure else QuantumCircuit(num_qubits)
+    qc.h(0)
+    for qubit in range(num_qubits - 1):
+        qc.cx(qubit, qubit + 1)
+    if measure:
+        qc.measure(range(num_qubits), range(num_qubits))
+    return qc
+
+
+def build_qft_circuit(num_qubits, measure=True):
+    """
+    Construiește transformata Fourier quantum pe `num_qubits` qubiți, aplicată
+    unei stări de intrare nebanale (X pe qubiții impari), cu swap-urile finale
+
+    Returns:
+        QuantumCircuit: Circuitul QFT (non-Clifford, cu rotații controlate de fază)
+    """
+    qc = QuantumCircuit(num_qubits, num_qubits) if measure else QuantumCircuit(num_qubits)
+    for qubit in range(1, num_qubits, 2):
+        qc.x(qubit)
+    for target in reversed(range(num_qubits)):
+        qc.h(target)
+        for control in reversed(range(target)):
+            qc.cp(math.pi / 2 ** (target - control), control, target)
+    for qubit in range(num_qubits // 2):
+        qc.swap(qubit, num_qubits - 1 - qubit)
+    if measure:
+        qc.measure(range(num_qubits), range(num_qubits))
+    return qc
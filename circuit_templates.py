@@ -0,0 +1,367 @@
+import os
+import math
+import importlib
+import threading
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+
+from circuit_library import build_parameterized_teleportation_circuit, TELEPORT_THETA, TELEPORT_PHI
+from transpile_cache import cached_transpile, backend_fingerprint
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Module importate la prima utilizare a registrului; fiecare își înregistrează
+# șabloanele cu @register_template (listă separată prin virgulă)
+PLUGIN_MODULES_ENV = "QUANTUM_CIRCUIT_TEMPLATE_PLUGINS"
+
+
+class UnknownCircuitTypeError(ValueError):
+    """Tipul de circuit cerut nu este înregistrat în registrul de șabloane"""
+
+
+class CircuitTemplate:
+    """
+    Șablon de circuit parametrizat.
+
+    Structura circuitului depinde doar de dimensiune (ex. numărul de qubiți pentru
+    GHZ-n); valorile numerice sunt Parameter-i simbolici legați la fiecare cerere.
+    Un parametru vector (ParameterVector) primește o listă de valori, câte una per qubit.
+    """
+
+    def __init__(self, name, builder, defaults=None, default_size=None, min_size=None, description=""):
+        """
+        Args:
+            name (str): Numele tipului de circuit
+            builder (callable): builder(size) -> QuantumCircuit parametrizat
+                (builder() pentru șabloanele fără dimensiune)
+            defaults (dict or callable): Valorile implicite ale parametrilor, după nume;
+                pentru șabloanele cu dimensiune poate fi o funcție defaults(size)
+            default_size (int, optional): Dimensiunea implicită (None = șablon fără dimensiune)
+            min_size (int, optional): Dimensiunea minimă acceptată
+            description (str): Descrierea afișată utilizatorilor
+        """
+        self.name = name
+        self.builder = builder
+        self.defaults = defaults or {}
+        self.default_size = default_size
+        self.min_size = min_size
+        self.description = description
+
+    @property
+    def sized(self):
+        return self.default_size is not None
+
+    def resolve_size(self, size):
+        if not self.sized:
+            if size is not None:
+                raise ValueError(f"Circuitul '{self.name}' nu acceptă o dimensiune")
+            return None
+        size = self.default_size if size is None else int(size)
+        if self.min_size is not None and size < self.min_size:
+            raise ValueError(f"Circuitul '{self.name}' necesită cel puțin {self.min_size} qubiți")
+        return size
+
+    def build(self, size=None):
+        return self.builder(size) if self.sized else self.builder()
+
+    def default_values(self, size=None):
+        return dict(self.defaults(size) if callable(self.defaults) else self.defaults)
+
+
+def _expand_values(values):
+    """Listele de valori sunt desfăcute pe elementele vectorului (x -> x[0], x[1], ...)"""
+    expanded = {}
+    for name, value in values.items():
+        if isinstance(value, (list, tuple)):
+            for index, element in enumerate(value):
+                expanded[f"{name}[{index}]"] = element
+        else:
+            expanded[name] = value
+    return expanded
+
+
+class CircuitTemplateRegistry:
+    """
+    Registrul tipurilor de circuit cunoscute de QuantumConnector.
+
+    Fiecare șablon este construit o singură dată per dimensiune și transpilat o
+    singură dată per backend, cu parametrii simbolici; o cerere doar leagă valorile
+    (assign_parameters), fără reconstrucție sau transpilare. Tipurile necunoscute
+    sunt respinse imediat cu UnknownCircuitTypeError.
+
+    Tipurile cu dimensiune se cer ca "nume-n" (ex. "ghz-5", "qft-4", "grover-3").
+    """
+
+    def __init__(self, plugin_modules=None):
+        self._templates = {}
+        self._circuits = {}
+        self._compiled = {}
+        self._lock = threading.Lock()
+        self._plugin_modules = plugin_modules
+        self._plugins_loaded = False
+
+    def register(self, template, replace=False):
+        """Înregistrează un șablon (replace=True permite înlocuirea unui tip existent)"""
+        with self._lock:
+            if template.name in self._templates and not replace:
+                raise ValueError(f"Tipul de circuit '{template.name}' este deja înregistrat")
+            self._templates[template.name] = template
+            # Circuitele construite anterior pentru acest tip nu mai sunt valide
+            self._circuits = {key: value for key, value in self._circuits.items() if key[0] != template.name}
+            self._compiled = {key: value for key, value in self._compiled.items() if key[0] != template.name}
+        return template
+
+    def _load_plugins(self):
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        modules = self._plugin_modules
+        if modules is None:
+            modules = [name.strip() for name in os.environ.get(PLUGIN_MODULES_ENV, "").split(",") if name.strip()]
+        for module_name in modules:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"[CIRCUIT TEMPLATES] Eroare la încărcarea plugin-ului {module_name}: {str(e)}")
+
+    def names(self):
+        """Tipurile de circuit înregistrate"""
+        self._load_plugins()
+        return sorted(self._templates)
+
+    def describe(self):
+        """Tipurile înregistrate, cu dimensiunea și parametrii impliciți"""
+        self._load_plugins()
+        return {
+            name: {
+                "description": template.description,
+                "default_size": template.default_size,
+                "parameters": template.default_values(template.default_size)
+            }
+            for name, template in sorted(self._templates.items())
+        }
+
+    def resolve(self, circuit_type):
+        """
+        Găsește șablonul și dimensiunea pentru un tip de circuit ("ghz", "ghz-5", ...)
+
+        Raises:
+            UnknownCircuitTypeError: Dacă tipul nu este înregistrat
+        """
+        self._load_plugins()
+        name, size = circuit_type, None
+        if circuit_type not in self._templates and "-" in circuit_type:
+            base, _, suffix = circuit_type.rpartition("-")
+            if suffix.isdigit():
+                name, size = base, int(suffix)
+        template = self._templates.get(name)
+        if template is None:
+            raise UnknownCircuitTypeError(
+                f"Tip de circuit necunoscut: '{circuit_type}'. Tipuri disponibile: {', '.join(sorted(self._templates))}"
+            )
+        return template, template.resolve_size(size)
+
+    def circuit(self, circuit_type):
+        """Circuitul parametrizat (nelegat) al unui tip, construit o singură dată"""
+        template, size = self.resolve(circuit_type)
+        key = (template.name, size)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = template.build(size)
+            with self._lock:
+                circuit = self._circuits.setdefault(key, circuit)
+        return circuit
+
+    def compiled(self, circuit_type, backend):
+        """Circuitul parametrizat transpilat pentru backend, transpilat o singură dată"""
+        template, size = self.resolve(circuit_type)
+        key = (template.name, size, backend_fingerprint(backend))
+        compiled_circuit = self._compiled.get(key)
+        if compiled_circuit is None:
+            compiled_circuit = cached_transpile(self.circuit(circuit_type), backend)
+            with self._lock:
+                compiled_circuit = self._compiled.setdefault(key, compiled_circuit)
+        return compiled_circuit
+
+    def bind(self, circuit_type, backend=None, **values):
+        """
+        Leagă valorile parametrilor pe circuitul șablonului
+
+        Args:
+            circuit_type (str): Tipul circuitului (ex. "teleportation", "ghz-5")
+            backend: Dacă este dat, se leagă circuitul deja transpilat pentru acest backend
+            **values: Valorile parametrilor (listă pentru parametrii vector);
+                parametrii omiși primesc valorile implicite ale șablonului
+
+        Returns:
+            QuantumCircuit: Circuitul fără parametri liberi
+
+        Raises:
+            UnknownCircuitTypeError: Tip de circuit necunoscut
+            ValueError: Parametru necunoscut
+        """
+        template, size = self.resolve(circuit_type)
+        circuit = self.compiled(circuit_type, backend) if backend is not None else self.circuit(circuit_type)
+
+        # Parametrii sunt căutați după nume, ca la circuitele restaurate din cache-ul de pe disc
+        parameters = {parameter.name: parameter for parameter in circuit.parameters}
+        supplied = _expand_values(values)
+        unknown = set(supplied) - set(parameters)
+        if unknown:
+            raise ValueError(f"Parametri necunoscuți pentru '{circuit_type}': {', '.join(sorted(unknown))}")
+
+        bound_values = _expand_values(template.default_values(size))
+        bound_values.update(supplied)
+        missing = set(parameters) - set(bound_values)
+        if missing:
+            raise ValueError(f"Parametri fără valoare pentru '{circuit_type}': {', '.join(sorted(missing))}")
+
+        return circuit.assign_parameters({parameters[name]: bound_values[name] for name in parameters})
+
+
+_registry = CircuitTemplateRegistry()
+
+
+def get_template_registry():
+    """Returnează registrul de șabloane comun procesului"""
+    return _registry
+
+
+def register_template(name, defaults=None, default_size=None, min_size=None, description="", replace=False):
+    """
+    Decorator pentru înregistrarea unui constructor de circuit ca șablon
+
+    Exemplu (într-un modul plugin listat în QUANTUM_CIRCUIT_TEMPLATE_PLUGINS):
+
+        @register_template("w", default_size=3, min_size=2, description="Starea W")
+        def build_w_state(num_qubits):
+            ...
+    """
+    def decorator(builder):
+        _registry.register(CircuitTemplate(name, builder, defaults=defaults, default_size=default_size,
+                                           min_size=min_size, description=description), replace=replace)
+        return builder
+    return decorator
+
+
+# --- Șabloanele standard ---
+
+# Starea H·T = (|0⟩ + e^(iπ/4)|1⟩)/√2, starea demonstrativă a conectorului
+register_template(
+    "teleportation",
+    defaults={TELEPORT_THETA.name: math.pi / 2, TELEPORT_PHI.name: math.pi / 4},
+    description="Teleportarea stării U(θ, φ)|0⟩ de pe qubit-ul 0 pe qubit-ul 2"
+)(build_parameterized_teleportation_circuit)
+
+
+@register_template("bell", defaults={"theta": math.pi / 2},
+                   description="Perechea entanglată cos(θ/2)|00⟩ + sin(θ/2)|11⟩ (θ = π/2: |Φ+⟩)")
+def build_bell_template():
+    theta = Parameter("theta")
+    qc = QuantumCircuit(2, 2)
+    qc.ry(theta, 0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+@register_template("ghz", defaults={"theta": math.pi / 2}, default_size=3, min_size=2,
+                   description="Starea GHZ-n cos(θ/2)|0...0⟩ + sin(θ/2)|1...1⟩")
+def build_ghz_template(num_qubits):
+    theta = Parameter("theta")
+    qc = QuantumCircuit(num_qubits, num_qubits)
+    qc.ry(theta, 0)
+    for qubit in range(num_qubits - 1):
+        qc.cx(qubit, qubit + 1)
+    qc.measure(range(num_qubits), range(num_qubits))
+    return qc
+
+
+@register_template("qft", defaults=lambda num_qubits: {"x": [math.pi * (qubit % 2) for qubit in range(num_qubits)]},
+                   default_size=4, min_size=1,
+                   description="QFT-n aplicată stării RX(x_i) pe fiecare qubit (x_i = π: bitul i este 1)")
+def build_qft_template(num_qubits):
+    x = ParameterVector("x", num_qubits)
+    qc = QuantumCircuit(num_qubits, num_qubits)
+    for qubit in range(num_qubits):
+        qc.rx(x[qubit], qubit)
+    for target in reversed(range(num_qubits)):
+        qc.h(target)
+        for control in reversed(range(target)):
+            qc.cp(math.pi / 2 ** (target - control), control, target)
+    for qubit in range(num_qubits // 2):
+        qc.swap(qubit, num_qubits - 1 - qubit)
+    qc.measure(range(num_qubits), range(num_qubits))
+    return qc
+
+
+@register_template("grover", defaults=lambda num_qubits: {"marked": [1] * num_qubits}, default_size=3, min_size=2,
+                   description="Căutarea Grover pe n qubiți; marked = biții elementului căutat (0/1 per qubit)")
+def build_grover_template(num_qubits):
+    # RX(π(1-m)) este X pentru m = 0 și identitate pentru m = 1 (până la o fază globală): qubiții
+    # cu bitul marcat 0 sunt inversați, astfel încât elementul marcat devine |1...1⟩ pentru poarta
+    # multi-controlată; elementul marcat se leagă ca parametru fără a schimba structura circuitului
+    marked = ParameterVector("marked", num_qubits)
+    iterations = max(1, int(math.floor(math.pi / 4 * math.sqrt(2 ** num_qubits))))
+    qubits = list(range(num_qubits))
+
+    qc = QuantumCircuit(num_qubits, num_qubits)
+    qc.h(qubits)
+    for _ in range(iterations):
+        # Oracolul: fază -1 pe elementul marcat
+        for qubit in qubits:
+            qc.rx(math.pi * (1 - marked[qubit]), qubit)
+        qc.mcp(math.pi, qubits[:-1], qubits[-1])
+        for qubit in qubits:
+            qc.rx(-math.pi * (1 - marked[qubit]), qubit)
+        # Difuzorul: reflexie față de starea uniformă
+        qc.h(qubits)
+        qc.x(qubits)
+        qc.mcp(math.pi, qubits[:-1], qubits[-1])
+        qc.x(qubits)
+        qc.h(qubits)
+    qc.measure(qubits, qubits)
+    return qc
+
+
+@register_template("superdense", defaults={"bit0": 1, "bit1": 1},
+                   description="Codarea superdensă a doi biți clasici (bit0 → Z, bit1 → X) într-un qubit")
+def build_superdense_template():
+    bit0 = Parameter("bit0")
+    bit1 = Parameter("bit1")
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    # Alice aplică Z^bit0 X^bit1 pe qubit-ul ei (RZ(π) = Z și RX(π) = X până la o fază globală)
+    qc.rx(math.pi * bit1, 0)
+    qc.rz(math.pi * bit0, 0)
+    # Bob decodează în baza Bell: c0 = bit0, c1 = bit1
+    qc.cx(0, 1)
+    qc.h(0)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+@register_template("entanglement_swapping", defaults={"theta": 0.0},
+                   description="Schimbul de entanglement: qubiții 0 și 3 devin entanglați prin măsurătoarea "
+                               "Bell pe 1 și 2; qubit-ul 3 este măsurat în baza rotită cu θ")
+def build_entanglement_swapping_template():
+    theta = Parameter("theta")
+    qc = QuantumCircuit(4, 4)
+    # Două perechi Bell: (0, 1) și (2, 3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.h(2)
+    qc.cx(2, 3)
+    # Măsurătoarea Bell pe qubiții 1 și 2, cu corecții controlate quantum pe qubit-ul 3
+    qc.cx(1, 2)
+    qc.h(1)
+    qc.cx(2, 3)
+    qc.cz(1, 3)
+    qc.ry(-theta, 3)
+    qc.measure([1, 2, 0, 3], [0, 1, 2, 3])
+    return qc
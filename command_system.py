@@ -145,6 +145,18 @@ class CommandSystem:
                 "security_level": "CRITICAL",
                 "requires_authentication": True
             },
+            "autotune": {
+                "description": "Optimizează și afișează profilurile de execuție ale simulatorului Aer",
+                "syntax": "autotune [run|show|set|reset] [family] [option=value]",
+                "security_level": "MEDIUM",
+                "requires_authentication": True
+            },
+            "preview": {
+                "description": "Previzualizează teleportarea pe dispozitive IBM (backend-uri fake locale)",
+                "syntax": "preview [backend ...] [level=0-3]",
+                "security_level": "MEDIUM",
+                "requires_authentication": True
+            },
             "dna": {
                 "description": "Generează sau verifică chei DNA",
                 "syntax": "dna <action> [parameters]",
@@ -428,6 +440,103 @@ class CommandSystem:
         
         return {"valid": True, "message": ""}
     
+    def _execute_autotune(self, command_args):
+        """
+        Execută comanda autotune
+        
+        - autotune [run] [family]: testează profilurile pe această mașină și îl salvează pe cel mai rapid
+        - autotune show: afișează profilul activ și sursa lui pentru fiecare familie
+        - autotune set <family> option=value ...: suprascrie manual profilul unei familii
+        - autotune reset <family>: elimină suprascrierea manuală
+        
+        Args:
+            command_args (list): Argumentele comenzii
+            
+        Returns:
+            dict: Rezultatul execuției
+        """
+        from simulator_profile import get_profile_store, autotune, CIRCUIT_FAMILIES
+        
+        action = command_args[0].lower() if command_args else "run"
+        store = get_profile_store()
+        
+        if action == "show":
+            return {"message": "Profiluri de execuție active", "profiles": store.describe()}
+        
+        if action in ("set", "reset"):
+            if len(command_args) < 2:
+                return {"message": f"Familia de circuite trebuie specificată. Familii: {', '.join(CIRCUIT_FAMILIES)}"}
+            family = command_args[1].lower()
+            
+            if action == "reset":
+                removed = store.clear_override(family)
+                return {
+                    "message": f"Suprascrierea pentru {family} a fost eliminată" if removed else f"Familia {family} nu avea suprascriere",
+                    "profile": store.get_profile(family).to_dict()
+                }
+            
+            options = {}
+            for assignment in command_args[2:]:
+                if "=" not in assignment:
+                    return {"message": f"Opțiune invalidă: {assignment}. Folosiți option=value"}
+                key, value = assignment.split("=", 1)
+                if value.lower() in ("true", "false"):
+                    value = value.lower() == "true"
+                elif value.lstrip("-").isdigit():
+                    value = int(value)
+                options[key] = value
+            try:
+                profile = store.set_override(family, **options)
+            except ValueError as e:
+                return {"message": str(e)}
+            return {"message": f"Profil suprascris pentru {family}", "profile": profile.to_dict()}
+        
+        families = command_args[1:] if action == "run" else command_args
+        families = [family.lower() for family in families] or None
+        unknown = [family for family in families or [] if family not in CIRCUIT_FAMILIES]
+        if unknown:
+            return {"message": f"Familii necunoscute: {', '.join(unknown)}. Familii: {', '.join(CIRCUIT_FAMILIES)}"}
+        
+        return {
+            "message": "Autotune finalizat; profilurile cele mai rapide au fost salvate",
+            "results": autotune(families=families),
+            "profile_file": store.path
+        }
+    
+    def _execute_preview(self, command_args):
+        """
+        Execută comanda preview
+        
+        - preview: compară dispozitivele implicite la nivelurile de optimizare 1-3
+        - preview <backend ...> [level=N]: previzualizează pe backend-urile date
+        
+        Args:
+            command_args (list): Argumentele comenzii
+            
+        Returns:
+            dict: Rezultatul execuției
+        """
+        from device_preview import DEFAULT_PREVIEW_BACKENDS, get_pass_manager_cache, preview_on_devices
+        
+        backends = [arg for arg in command_args if not arg.lower().startswith("level=")]
+        levels = [arg.split("=", 1)[1] for arg in command_args if arg.lower().startswith("level=")]
+        try:
+            optimization_levels = tuple(int(level) for level in levels) or (1, 2, 3)
+        except ValueError:
+            return {"message": "Nivelul de optimizare trebuie să fie un număr între 0 și 3"}
+        if any(not 0 <= level <= 3 for level in optimization_levels):
+            return {"message": "Nivelul de optimizare trebuie să fie un număr între 0 și 3"}
+        
+        previews = preview_on_devices(backends or DEFAULT_PREVIEW_BACKENDS, optimization_levels=optimization_levels)
+        if not previews:
+            return {"message": f"Niciun backend valid. Exemple: {', '.join(DEFAULT_PREVIEW_BACKENDS)}"}
+        
+        return {
+            "message": f"Cel mai bun dispozitiv: {previews[0]['backend']} (nivel {previews[0]['optimization_level']})",
+            "previews": previews,
+            "pass_manager_cache": get_pass_manager_cache().get_stats()
+        }
+    
     def _check_suspicious_command(self, command_record):
         """
         Verifică dacă o comandă este suspectă
@@ -811,6 +920,12 @@ class CommandSystem:
                 "estimated_time_seconds": random.randint(5, 20)
             }
         
+        elif command_name == "autotune":
+            return self._execute_autotune(command_args)
+        
+        elif command_name == "preview":
+            return self._execute_preview(command_args)
+        
         elif command_name == "dna":
             if not command_args:
                 return {"message": "Acțiunea pentru DNA trebuie specificată."}
@@ -0,0 +1,271 @@
+import time
+import threading
+
+import numpy as np
+
+from circuit_library import (
+    TELEPORT_PHI,
+    TELEPORT_THETA,
+    build_feedforward_teleportation_circuit,
+    build_parameterized_teleportation_circuit
+)
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Seed-ul fix al transpilării: previzualizările repetate dau același layout și aceeași adâncime
+PREVIEW_SEED = 1234
+
+# Dispozitivele comparate implicit de preview_on_devices
+DEFAULT_PREVIEW_BACKENDS = ("fake_sherbrooke", "fake_brisbane", "fake_kyiv", "fake_torino")
+
+# Operațiile fără eroare de poartă (măsurătoarea este contabilizată separat)
+_NON_GATE_OPERATIONS = {"measure", "barrier", "delay", "reset"}
+
+
+class PassManagerCache:
+    """
+    Cache pentru backend-urile fake IBM și PassManager-ele lor în etape.
+
+    Construirea unui backend fake (citirea proprietăților din JSON) și a
+    PassManager-ului preset pentru ținta lui se face o singură dată per
+    (backend, nivel de optimizare, seed); previzualizările repetate doar
+    rulează PassManager-ul existent.
+    """
+
+    def __init__(self):
+        self._provider = None
+        self._backends = {}
+        self._pass_managers = {}
+        self._lock = threading.Lock()
+
+        # Statistici cache
+        self.hits = 0
+        self.misses = 0
+
+    def backend_names(self):
+        """Numele backend-urilor fake disponibile"""
+        return sorted(backend.name for backend in self._get_provider().backends())
+
+    def _get_provider(self):
+        if self._provider is None:
+            from qiskit_ibm_runtime.fake_provider import FakeProviderForBackendV2
+            self._provider = FakeProviderForBackendV2()
+        return self._provider
+
+    def get_backend(self, backend_name):
+        """Backend-ul fake cu numele dat (ex. "fake_sherbrooke")"""
+        with self._lock:
+            backend = self._backends.get(backend_name)
+            if backend is None:
+                try:
+                    backend = self._get_provider().backend(backend_name)
+                except Exception:
+                    raise ValueError(f"Backend fake IBM necunoscut: {backend_name}")
+                self._backends[backend_name] = backend
+            return backend
+
+    def get_pass_manager(self, backend_name, optimization_level=2, seed_transpiler=PREVIEW_SEED):
+        """
+        PassManager-ul în etape (layout, routing, translation, optimization, scheduling)
+        pentru un backend și un nivel de optimizare
+
+        Returns:
+            StagedPassManager: PassManager-ul din cache sau unul nou construit
+        """
+        key = (backend_name, int(optimization_level), seed_transpiler)
+        with self._lock:
+            pass_manager = self._pass_managers.get(key)
+            if pass_manager is not None:
+                self.hits += 1
+                return pass_manager
+            self.misses += 1
+
+        from qiskit.transpiler import generate_preset_pass_manager
+
+        backend = self.get_backend(backend_name)
+        pass_manager = generate_preset_pass_manager(
+            optimization_level=int(optimization_level), backend=backend, seed_transpiler=seed_transpiler
+        )
+        with self._lock:
+            return self._pass_managers.setdefault(key, pass_manager)
+
+    def clear(self):
+        with self._lock:
+            self._pass_managers.clear()
+            self._backends.clear()
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "pass_managers": len(self._pass_managers),
+            "backends": len(self._backends),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+_pass_manager_cache = PassManagerCache()
+
+
+def get_pass_manager_cache():
+    """Returnează cache-ul de PassManager-e comun procesului"""
+    return _pass_manager_cache
+
+
+def _iter_instructions(circuit):
+    """Instrucțiunile circuitului, inclusiv cele din blocurile control-flow (if_else)"""
+    for instruction in circuit.data:
+        blocks = getattr(instruction.operation, "blocks", ())
+        if blocks:
+            # Blocurile folosesc qubiții instrucțiunii părinte, în ordine
+            for block in blocks:
+                qubit_map = {inner: outer for inner, outer in zip(block.qubits, instruction.qubits)}
+                for inner_instruction in _iter_instructions(block):
+                    yield inner_instruction.replace(qubits=[qubit_map[q] for q in inner_instruction.qubits])
+        else:
+            yield instruction
+
+
+def estimate_success_probability(circuit, backend):
+    """
+    Probabilitatea estimată de succes (ESP): produsul fidelităților (1 - eroare)
+    tuturor porților și măsurătorilor, din proprietățile de eroare ale țintei
+
+    Porțile din ramurile condiționate sunt considerate executate (estimare pesimistă).
+
+    Returns:
+        dict: esp, contribuția porților și a citirii, plus numărul de operații fără date de eroare
+    """
+    target = backend.target
+    gate_fidelity = 1.0
+    readout_fidelity = 1.0
+    missing = 0
+
+    for instruction in _iter_instructions(circuit):
+        name = instruction.operation.name
+        if name in ("barrier", "delay"):
+            continue
+        qargs = tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+        try:
+            properties = target[name][qargs]
+        except KeyError:
+            properties = None
+        error = getattr(properties, "error", None)
+        if error is None:
+            missing += 1
+            continue
+        if name == "measure":
+            readout_fidelity *= 1.0 - error
+        elif name not in _NON_GATE_OPERATIONS:
+            gate_fidelity *= 1.0 - error
+
+    return {
+        "esp": gate_fidelity * readout_fidelity,
+        "gate_fidelity": gate_fidelity,
+        "readout_fidelity": readout_fidelity,
+        "operations_without_error_data": missing
+    }
+
+
+def teleportation_circuit_for(backend, dynamic=None):
+    """
+    Circuitul de teleportare potrivit pentru un backend
+
+    Args:
+        dynamic (bool, optional): True = corecții clasice (if_test), False = corecții
+            controlate quantum; implicit dinamic dacă ținta suportă if_else
+    """
+    if dynamic is None:
+        dynamic = "if_else" in backend.target.operation_names
+    if dynamic:
+        return build_feedforward_teleportation_circuit(), "dynamic"
+    circuit = build_parameterized_teleportation_circuit()
+    # Aceeași stare ca în varianta dinamică (H, apoi T)
+    return circuit.assign_parameters({TELEPORT_THETA: np.pi / 2, TELEPORT_PHI: np.pi / 4}), "deferred"
+
+
+def preview_on_device(backend_name, circuit=None, optimization_level=2, dynamic=None):
+    """
+    Previzualizează circuitul pe un dispozitiv IBM, fără a consuma timp pe hardware
+
+    Circuitul (implicit teleportarea) este transpilat cu PassManager-ul din cache
+    pentru backend-ul fake corespunzător, apoi se raportează adâncimea, numărul de
+    porți cu doi qubiți, layout-ul fizic și probabilitatea estimată de succes.
+
+    Args:
+        backend_name (str): Backend-ul fake (ex. "fake_sherbrooke")
+        circuit (QuantumCircuit, optional): Circuitul analizat (implicit teleportarea)
+        optimization_level (int): Nivelul de optimizare al transpilării (0-3)
+        dynamic (bool, optional): Varianta teleportării (vezi teleportation_circuit_for)
+
+    Returns:
+        dict: Metricile circuitului transpilat pe dispozitiv
+    """
+    start_time = time.perf_counter()
+    cache = get_pass_manager_cache()
+    backend = cache.get_backend(backend_name)
+    variant = "custom"
+    if circuit is None:
+        circuit, variant = teleportation_circuit_for(backend, dynamic)
+
+    pass_manager = cache.get_pass_manager(backend_name, optimization_level)
+    transpiled = pass_manager.run(circuit)
+
+    two_qubit_gates = 0
+    for instruction in _iter_instructions(transpiled):
+        if len(instruction.qubits) == 2 and instruction.operation.name not in _NON_GATE_OPERATIONS:
+            two_qubit_gates += 1
+
+    layout = transpiled.layout.final_index_layout() if transpiled.layout is not None else None
+    success = estimate_success_probability(transpiled, backend)
+
+    return {
+        "backend": backend_name,
+        "num_qubits": backend.num_qubits,
+        "optimization_level": int(optimization_level),
+        "variant": variant,
+        "depth": transpiled.depth(),
+        "size": transpiled.size(),
+        "two_qubit_gates": two_qubit_gates,
+        "operations": dict(transpiled.count_ops()),
+        "physical_qubits": layout[:circuit.num_qubits] if layout else None,
+        "estimated_success_probability": round(success["esp"], 6),
+        "gate_fidelity": round(success["gate_fidelity"], 6),
+        "readout_fidelity": round(success["readout_fidelity"], 6),
+        "operations_without_error_data": success["operations_without_error_data"],
+        "preview_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+
+def preview_on_devices(backend_names=DEFAULT_PREVIEW_BACKENDS, circuit=None, optimization_levels=(1, 2, 3)):
+    """
+    Compară circuitul pe mai multe dispozitive și niveluri de optimizare
+
+    Returns:
+        list: Previzualizările, ordonate descrescător după probabilitatea estimată de succes
+    """
+    previews = []
+    for backend_name in backend_names:
+        for optimization_level in optimization_levels:
+            try:
+                previews.append(preview_on_device(backend_name, circuit, optimization_level))
+            except ValueError as e:
+                print(f"[DEVICE PREVIEW] {str(e)}")
+    return sorted(previews, key=lambda preview: preview["estimated_success_probability"], reverse=True)
+
+
+if __name__ == "__main__":
+    for preview in preview_on_devices():
+        print(f"{preview['backend']:>16} o{preview['optimization_level']}: adâncime {preview['depth']:>3}  "
+              f"2q {preview['two_qubit_gates']:>2}  ESP {preview['estimated_success_probability']:.4f}  "
+              f"qubiți {preview['physical_qubits']}  {preview['preview_time_ms']:.1f} ms")
+
+    # A doua trecere refolosește PassManager-ele din cache
+    start_time = time.perf_counter()
+    preview_on_devices()
+    print(f"A doua trecere (12 previzualizări): {(time.perf_counter() - start_time) * 1000:.1f} ms")
+    print(get_pass_manager_cache().get_stats())
@@ -6,6 +6,8 @@ import json
 import base64
 import time
 
+from quantum_rng import get_qrng
+
 # COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
 # TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
 # PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
@@ -93,7 +95,7 @@ class DNAVerificationSystem:
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         
         # Generăm un seed intern
-        internal_seed = f"{timestamp}-{random.random()}-{self.system_signature[:8]}"
+        internal_seed = f"{timestamp}-{get_qrng().token_hex(16)}-{self.system_signature[:8]}"
         
         # Combinăm cu seed-ul utilizatorului dacă este furnizat
         if user_seed:
@@ -104,12 +106,14 @@ class DNAVerificationSystem:
         # Creăm un hash pentru seed
         seed_hash = hashlib.sha256(combined_seed.encode()).hexdigest()
         
-        # Generăm secvența DNA folosind seed-ul hash-uit
+        # Generăm secvența DNA din bazele cuantice, deplasate cu seed-ul hash-uit
+        # (seed-ul utilizatorului influențează cheia fără a reduce entropia ei)
+        quantum_bases = get_qrng().dna_bases(length)
         dna_sequence = ""
         for i in range(length):
-            # Folosim caractere diferite din hash pentru a selecta bazele
-            hash_index = int(seed_hash[i % len(seed_hash)], 16) % 4
-            dna_sequence += self.DNA_BASES[hash_index]
+            hash_index = int(seed_hash[i % len(seed_hash)], 16)
+            base_index = self.DNA_BASES.index(quantum_bases[i])
+            dna_sequence += self.DNA_BASES[(base_index + hash_index) % 4]
             
         # Adăugăm secvența de proprietate pentru watermark
         watermarked_sequence = self._add_ownership_watermark(dna_sequence)
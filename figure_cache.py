@@ -0,0 +1,90 @@
+import json
+import threading
+
+import plotly.graph_objects as go
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+
+class FigureTemplateCache:
+    """
+    Cache pentru straturile imuabile ale figurilor Plotly (diagrama protocolului de
+    teleportare, suprafața sferei Bloch, axele).
+
+    Fiecare șablon este construit o singură dată și păstrat ca JSON serializat.
+    La fiecare apel figura este reconstruită din JSON fără revalidarea Plotly
+    (șablonul a fost deja validat la construcție), iar doar urmele dinamice sunt
+    inserate în pozițiile lor.
+    """
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _template_json(self, name, builder):
+        template = self._templates.get(name)
+        if template is not None:
+            self.hits += 1
+            return template
+
+        with self._lock:
+            template = self._templates.get(name)
+            if template is None:
+                self.misses += 1
+                template = builder().to_json()
+                self._templates[name] = template
+            return template
+
+    def figure(self, name, builder, insert_traces=None, layout_updates=None):
+        """
+        Returnează o figură nouă pornind de la șablonul cache-uit
+
+        Args:
+            name (str): Numele șablonului
+            builder (callable): Construiește figura statică (apelat doar la primul acces)
+            insert_traces (list, optional): Perechi (poziție, urmă) cu urmele dinamice
+            layout_updates (dict, optional): Modificări de layout specifice apelului
+
+        Returns:
+            go.Figure: Figură independentă, care poate fi modificată de apelant
+        """
+        figure_dict = json.loads(self._template_json(name, builder))
+
+        for position, trace in insert_traces or []:
+            trace_dict = trace.to_plotly_json() if hasattr(trace, "to_plotly_json") else dict(trace)
+            figure_dict.setdefault("data", []).insert(position, trace_dict)
+
+        if layout_updates:
+            figure_dict.setdefault("layout", {}).update(layout_updates)
+
+        try:
+            # Șablonul a fost validat la construcție; sărim revalidarea (de ~20x mai rapid)
+            return go.Figure(figure_dict, _validate=False)
+        except TypeError:
+            return go.Figure(figure_dict)
+
+    def clear(self):
+        """Golește toate șabloanele"""
+        with self._lock:
+            self._templates.clear()
+
+    def get_stats(self):
+        """Returnează statisticile cache-ului de figuri"""
+        return {
+            "templates": sorted(self._templates.keys()),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+_figure_cache = FigureTemplateCache()
+
+
+def get_figure_cache():
+    """Returnează cache-ul de șabloane de figuri comun procesului"""
+    return _figure_cache
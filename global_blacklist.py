@@ -5,6 +5,8 @@ import random
 import time
 import json
 
+from quantum_rng import get_qrng
+
 class GlobalBlacklistSystem:
     """
     Sistem global de blacklist pentru scammeri cu protecție și actualizare automată
@@ -126,7 +128,7 @@ class GlobalBlacklistSystem:
         
         # Adăugăm entitatea nouă
         blacklist_entry = {
-            "entity_id": hashlib.sha256(f"BLACKLIST-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "entity_id": hashlib.sha256(f"BLACKLIST-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "identifier": entity_info.get("identifier"),
             "detection_source": entity_info.get("source", random.choice(self.blacklist_sources)),
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
@@ -176,7 +178,7 @@ class GlobalBlacklistSystem:
         """
         # Simularea colectării de dovezi
         evidence = {
-            "evidence_id": hashlib.sha256(f"EVIDENCE-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "evidence_id": hashlib.sha256(f"EVIDENCE-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "related_entity": blacklist_entry["entity_id"],
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "evidence_types": random.sample(self.evidence_types, min(5, len(self.evidence_types))),
@@ -204,7 +206,7 @@ class GlobalBlacklistSystem:
         """
         # Simularea inițierii acțiunii legale
         legal_action = {
-            "legal_action_id": hashlib.sha256(f"LEGAL-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "legal_action_id": hashlib.sha256(f"LEGAL-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "related_evidence": evidence["evidence_id"],
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "action_type": "AUTOMATED_LEGAL_PROCEDURE",
@@ -262,7 +264,7 @@ class GlobalBlacklistSystem:
         new_entries = random.randint(0, 3)
         for _ in range(new_entries):
             self.add_to_blacklist({
-                "identifier": f"auto-detected-{hashlib.sha256(str(random.random()).encode()).hexdigest()[:8]}",
+                "identifier": f"auto-detected-{get_qrng().token_hex(4)}",
                 "source": random.choice(self.blacklist_sources),
                 "description": "Entitate detectată automat în timpul actualizării"
             }, severity=random.choice(["MEDIUM", "HIGH", "CRITICAL"]))
@@ -407,7 +407,7 @@ class GlobalDatacenterConnection:
             "results": operation_results
         }
     
-    def quantum_teleport_data(self, source_region, target_region, data_size_tb):
+    def quantum_teleport_data(self, source_region, target_region, data_size_tb, simulate_link=False):
         """
         Teleportează date între regiuni folosind canale quantum
         
@@ -415,6 +415,7 @@ class GlobalDatacenterConnection:
             source_region (str): Regiunea sursă
             target_region (str): Regiunea destinație
             data_size_tb (int): Mărimea datelor în TB
+            simulate_link (bool): Simulează lanțul de repetoare dintre regiuni
             
         Returns:
             dict: Rezultatul teleportării
@@ -451,9 +452,30 @@ class GlobalDatacenterConnection:
             "teleport_time_seconds": teleport_time_seconds,
             "transfer_speed_tbs": 100,
             "quantum_verified": True,
-            "protocol": "QUANTUM_ENTANGLED"
+            "protocol": "QUANTUM_ENTANGLED",
+            "repeater_chain": self.simulate_repeater_chain(source_region, target_region) if simulate_link else None
         }
     
+    def simulate_repeater_chain(self, source_region, target_region, via=None, hops=None, link_fidelity=None, shots=2000):
+        """
+        Simulează lanțul de repetoare quantum dintre două regiuni
+        
+        Args:
+            source_region (str): Regiunea sursă
+            target_region (str): Regiunea destinație
+            via (list, optional): Regiuni intermediare explicite
+            hops (int, optional): Numărul de segmente (implicit după distanța geografică)
+            link_fidelity (float, optional): Fidelitatea perechilor Bell elementare
+            shots (int): Numărul de shot-uri pentru estimarea fidelității
+            
+        Returns:
+            dict: Fidelitatea end-to-end și adâncimea circuitului per segment
+        """
+        from repeater_chain import RepeaterChainSimulator
+        return RepeaterChainSimulator().simulate(
+            source_region, target_region, via=via, hops=hops, link_fidelity=link_fidelity, shots=shots
+        )
+    
     def get_global_statistics(self):
         """
         Obține statistici globale despre toate datacentrele
@@ -0,0 +1,487 @@
+import os
+import time
+import uuid
+import random
+import asyncio
+import datetime
+import threading
+from collections import defaultdict, deque
+
+from transpile_cache import cached_transpile
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Stările finale ale unui job IBM / Aer
+TERMINAL_STATUSES = {"DONE", "ERROR", "CANCELLED"}
+
+# Durata de viață implicită a listei de backend-uri (secunde)
+DEFAULT_BACKEND_TTL = 300.0
+
+# Parametrii implicați ai interogării cu backoff exponențial (secunde)
+DEFAULT_POLL_INITIAL = 0.5
+DEFAULT_POLL_MAX = 30.0
+DEFAULT_POLL_FACTOR = 2.0
+
+# Numărul maxim de job-uri terminate păstrate în evidență (cele mai vechi sunt eliminate,
+# împreună cu rezultatele lor încă nelivrate)
+DEFAULT_MAX_FINISHED_JOBS = 500
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    try:
+        return float(value) if value else default
+    except ValueError:
+        print(f"[IBM JOBS] Valoare invalidă pentru {name}: {value}")
+        return default
+
+
+def _status_name(status):
+    """Normalizează JobStatus (enum) sau șirurile de stare Runtime la un nume în majuscule"""
+    name = getattr(status, "name", status)
+    return str(name).upper()
+
+
+def fake_backends_requested():
+    """Backend-urile fake au fost cerute explicit (QUANTUM_IBM_FAKE_BACKENDS=1), de ex. pentru teste offline"""
+    return os.environ.get("QUANTUM_IBM_FAKE_BACKENDS", "").lower() in ("1", "true", "yes")
+
+
+def _use_fake_backends():
+    """Backend-urile fake (offline) sunt folosite fără token sau la cerere explicită"""
+    return fake_backends_requested() or not os.environ.get("IBM_QUANTUM_TOKEN")
+
+
+class IBMJobManager:
+    """
+    Manager asincron pentru job-urile IBM Quantum.
+
+    Rulează un event loop asyncio într-un thread dedicat, astfel încât callback-urile
+    Dash/Streamlit doar pun circuitele în coadă și revin imediat. Câțiva workeri
+    asincroni preiau circuitele din coadă, le transpilează (prin cache-ul comun),
+    le trimit și interoghează starea job-urilor cu backoff exponențial. Lista de
+    backend-uri este păstrată în cache cu un TTL. Rezultatele sunt livrate prin
+    callback-uri și printr-o coadă per utilizator, golită de front-end la fiecare
+    interval de reîmprospătare.
+
+    Fără IBM_QUANTUM_TOKEN (sau cu QUANTUM_IBM_FAKE_BACKENDS=1) sunt folosite
+    backend-urile din qiskit_ibm_runtime.fake_provider, simulate local.
+    """
+
+    def __init__(self, use_fake_backends=None, backend_ttl=DEFAULT_BACKEND_TTL, max_concurrent_jobs=4,
+                 poll_initial=DEFAULT_POLL_INITIAL, poll_max=DEFAULT_POLL_MAX, poll_factor=DEFAULT_POLL_FACTOR,
+                 max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS):
+        self.use_fake_backends = _use_fake_backends() if use_fake_backends is None else use_fake_backends
+        self.backend_ttl = backend_ttl
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.poll_initial = poll_initial
+        self.poll_max = poll_max
+        self.poll_factor = poll_factor
+        self.max_finished_jobs = max(1, max_finished_jobs)
+
+        self._loop = None
+        self._thread = None
+        self._queue = None
+        self._workers = []
+        self._start_lock = threading.Lock()
+
+        # Cache-ul listei de backend-uri
+        self._backends = {}
+        self._backend_listing = None
+        self._backends_fetched_at = 0.0
+        self._backend_lock = None
+        self._backend_refresh = None
+        self._backend_refresh_error = None
+        # Reentrant: callback-ul unei reîncărcări deja terminate rulează pe thread-ul apelantului
+        self._refresh_lock = threading.RLock()
+
+        # Evidența job-urilor și rezultatele nelivrate, per utilizator
+        self._jobs = {}
+        self._callbacks = {}
+        self._pending_results = defaultdict(deque)
+        self._finished_jobs = deque()
+        self._results_lock = threading.Lock()
+        self._submit_locks = defaultdict(threading.Lock)
+
+        self.backend_fetches = 0
+        self.backend_cache_hits = 0
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Pornește event loop-ul și workerii (idempotent)"""
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                self._queue = asyncio.Queue()
+                self._backend_lock = asyncio.Lock()
+                self._workers = [loop.create_task(self._worker()) for _ in range(self.max_concurrent_jobs)]
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name="ibm-job-manager", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+
+    def stop(self):
+        """Oprește workerii și event loop-ul"""
+        loop = self._loop
+        if loop is None:
+            return
+
+        def shutdown():
+            for worker in self._workers:
+                worker.cancel()
+            loop.stop()
+
+        loop.call_soon_threadsafe(shutdown)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+
+    def _run_coroutine(self, coroutine):
+        """Programează o corutină pe loop-ul managerului; returnează un concurrent.futures.Future"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    # ------------------------------------------------------------------
+    # Backend-uri (cache cu TTL)
+    # ------------------------------------------------------------------
+
+    def _fetch_backends(self):
+        """Enumeră backend-urile (apel blocant, rulat într-un thread al executorului)"""
+        if self.use_fake_backends:
+            from qiskit_ibm_runtime.fake_provider import FakeProviderForBackendV2
+            backends = FakeProviderForBackendV2().backends()
+        else:
+            from qiskit_ibm_runtime import QiskitRuntimeService
+            service = QiskitRuntimeService(channel="ibm_quantum_platform", token=os.environ.get("IBM_QUANTUM_TOKEN"))
+            backends = service.backends()
+
+        listing = []
+        for backend in backends:
+            try:
+                status = backend.status()
+                operational = bool(getattr(status, "operational", True))
+                pending_jobs = int(getattr(status, "pending_jobs", 0) or 0)
+            except Exception:
+                operational, pending_jobs = True, 0
+            listing.append({
+                "name": backend.name,
+                "num_qubits": backend.num_qubits,
+                "operational": operational,
+                "pending_jobs": pending_jobs,
+                "fake": self.use_fake_backends
+            })
+        return {backend.name: backend for backend in backends}, listing
+
+    async def _list_backends(self, force_refresh=False):
+        async with self._backend_lock:
+            age = time.monotonic() - self._backends_fetched_at
+            if not force_refresh and self._backend_listing is not None and age < self.backend_ttl:
+                self.backend_cache_hits += 1
+                return self._backend_listing
+
+            backends, listing = await asyncio.to_thread(self._fetch_backends)
+            self._backends = backends
+            self._backend_listing = {
+                "backends": listing,
+                "fake": self.use_fake_backends,
+                "fetched_at": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+            }
+            self._backends_fetched_at = time.monotonic()
+            self.backend_fetches += 1
+            return self._backend_listing
+
+    def list_backends(self, force_refresh=False, timeout=None):
+        """
+        Returnează lista de backend-uri (din cache cât timp TTL-ul nu a expirat)
+
+        Args:
+            force_refresh (bool): Ignoră cache-ul și reîncarcă lista
+            timeout (float, optional): Timpul maxim de așteptare (secunde)
+
+        Returns:
+            dict: Backend-urile (nume, qubiți, operațional, job-uri în așteptare)
+        """
+        return self._run_coroutine(self._list_backends(force_refresh)).result(timeout)
+
+    def list_backends_async(self, force_refresh=False):
+        """Varianta neblocantă: returnează un Future cu lista de backend-uri"""
+        return self._run_coroutine(self._list_backends(force_refresh))
+
+    def cached_backends(self):
+        """
+        Varianta pentru interfață: lista din cache, fără așteptare
+
+        Dacă cache-ul a expirat, reîncărcarea pornește în fundal (o singură dată) și
+        este returnată lista veche până la sosirea celei noi. Doar când nu a existat
+        niciodată o listă funcția returnează None; un apel ulterior o primește.
+
+        Returns:
+            dict: Lista de backend-uri sau None cât timp prima conexiune este în curs
+
+        Raises:
+            Exception: Eroarea ultimei reîncărcări eșuate, dacă nu există o listă
+                anterioară (următorul apel o reîncearcă)
+        """
+        listing = self._backend_listing
+        if listing is not None and time.monotonic() - self._backends_fetched_at < self.backend_ttl:
+            self.backend_cache_hits += 1
+            return listing
+
+        with self._refresh_lock:
+            error, self._backend_refresh_error = self._backend_refresh_error, None
+            if error is None and self._backend_refresh is None:
+                self._backend_refresh = self.list_backends_async()
+                self._backend_refresh.add_done_callback(self._backend_refresh_done)
+
+        if error is not None:
+            if listing is None:
+                raise error
+            print(f"[IBM JOBS] Eroare la reîncărcarea listei de backend-uri: {str(error)}")
+        return listing
+
+    def _backend_refresh_done(self, refresh):
+        """Reîncărcarea terminată este consumată: următoarea expirare pornește una nouă"""
+        with self._refresh_lock:
+            self._backend_refresh = None
+            self._backend_refresh_error = refresh.exception()
+
+    def _select_backend(self, backend_name, num_qubits):
+        """Backend-ul cerut sau cel operațional mai puțin încărcat care are destui qubiți"""
+        if backend_name:
+            if backend_name not in self._backends:
+                raise ValueError(f"Backend IBM necunoscut: {backend_name}")
+            return self._backends[backend_name]
+
+        candidates = [
+            entry for entry in self._backend_listing["backends"]
+            if entry["operational"] and entry["num_qubits"] >= num_qubits
+        ]
+        if not candidates:
+            raise ValueError(f"Niciun backend operațional cu cel puțin {num_qubits} qubiți")
+        best = min(candidates, key=lambda entry: (entry["pending_jobs"], entry["num_qubits"]))
+        return self._backends[best["name"]]
+
+    # ------------------------------------------------------------------
+    # Job-uri
+    # ------------------------------------------------------------------
+
+    def submit(self, circuit, shots=1024, backend_name=None, user_id="default", callback=None):
+        """
+        Pune un circuit în coada de execuție și revine imediat
+
+        Args:
+            circuit (QuantumCircuit): Circuitul de rulat
+            shots (int): Numărul de shot-uri
+            backend_name (str, optional): Backend-ul țintă (implicit cel mai puțin încărcat)
+            user_id (str): Identificatorul sesiunii care primește rezultatul
+            callback (callable, optional): Apelat cu înregistrarea job-ului la final
+
+        Returns:
+            str: ID-ul local al job-ului
+        """
+        self.start()
+        job_id = uuid.uuid4().hex[:12]
+        record = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "circuit_name": circuit.name,
+            "backend": backend_name,
+            "shots": shots,
+            "status": "QUEUED_LOCAL",
+            "remote_job_id": None,
+            "counts": None,
+            "error": None,
+            "polls": 0,
+            "submitted_at": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
+            "finished_at": None
+        }
+        with self._results_lock:
+            self._jobs[job_id] = record
+            if callback is not None:
+                self._callbacks[job_id] = callback
+
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (job_id, circuit))
+        return job_id
+
+    def _run_on_backend(self, backend, circuit, shots):
+        """Trimite circuitul transpilat: backend.run pentru fake, Sampler pentru hardware real"""
+        compiled_circuit = cached_transpile(circuit, backend)
+        if self.use_fake_backends:
+            # FakeBackendV2 își configurează lazy simulatorul și modelul de zgomot; trimiterile
+            # simultane pe același backend ar putea rula fără zgomot, deci le serializăm
+            with self._submit_locks[backend.name]:
+                return backend.run(compiled_circuit, shots=shots)
+
+        from qiskit_ibm_runtime import SamplerV2
+        return SamplerV2(mode=backend).run([compiled_circuit], shots=shots)
+
+    def _job_counts(self, job):
+        result = job.result()
+        if hasattr(result, "get_counts"):
+            return result.get_counts()
+        # Rezultat Sampler: toate registrele clasice unite într-un singur șir de biți
+        return result[0].join_data().get_counts()
+
+    async def _worker(self):
+        while True:
+            job_id, circuit = await self._queue.get()
+            try:
+                await self._execute(job_id, circuit)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._update(job_id, status="ERROR", error=str(e))
+                print(f"[IBM JOBS] Eroare la execuția job-ului {job_id}: {str(e)}")
+            finally:
+                if self._jobs[job_id]["status"] in TERMINAL_STATUSES:
+                    self._deliver(job_id)
+                self._queue.task_done()
+
+    async def _execute(self, job_id, circuit):
+        record = self._jobs[job_id]
+        await self._list_backends()
+        backend = self._select_backend(record["backend"], circuit.num_qubits)
+
+        job = await asyncio.to_thread(self._run_on_backend, backend, circuit, record["shots"])
+        self._update(job_id, backend=backend.name, remote_job_id=job.job_id(), status="SUBMITTED")
+
+        # Interogare cu backoff exponențial (cu jitter, ca să nu sincronizăm utilizatorii)
+        interval = self.poll_initial
+        while True:
+            status = _status_name(await asyncio.to_thread(job.status))
+            self._update(job_id, status=status, polls=record["polls"] + 1)
+            if status in TERMINAL_STATUSES:
+                break
+            await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(self.poll_max, interval * self.poll_factor)
+
+        if status == "DONE":
+            counts = await asyncio.to_thread(self._job_counts, job)
+            self._update(job_id, counts=counts)
+        else:
+            self._update(job_id, error=f"Job-ul s-a încheiat cu starea {status}")
+
+    def _update(self, job_id, **fields):
+        with self._results_lock:
+            self._jobs[job_id].update(fields)
+
+    def _deliver(self, job_id):
+        """Marchează job-ul ca terminat și livrează rezultatul (coadă per utilizator + callback)"""
+        with self._results_lock:
+            record = self._jobs[job_id]
+            record["finished_at"] = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+            snapshot = dict(record)
+            self._pending_results[record["user_id"]].append(snapshot)
+            callback = self._callbacks.pop(job_id, None)
+            self._finished_jobs.append(job_id)
+            self._prune_finished_jobs()
+
+        if callback is not None:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"[IBM JOBS] Eroare în callback-ul job-ului {job_id}: {str(e)}")
+
+    def _prune_finished_jobs(self):
+        """Elimină cele mai vechi job-uri terminate peste limită (apelat cu lock-ul deținut)"""
+        while len(self._finished_jobs) > self.max_finished_jobs:
+            record = self._jobs.pop(self._finished_jobs.popleft(), None)
+            if record is None:
+                continue
+            pending = self._pending_results.get(record["user_id"])
+            if pending:
+                # Rezultatul nelivrat al unui job eliminat nu mai este păstrat nici el
+                remaining = deque(result for result in pending if result["job_id"] != record["job_id"])
+                if remaining:
+                    self._pending_results[record["user_id"]] = remaining
+                else:
+                    del self._pending_results[record["user_id"]]
+
+    def get_job(self, job_id):
+        """Returnează starea curentă a unui job (copie)"""
+        with self._results_lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record else None
+
+    def get_user_jobs(self, user_id):
+        """Returnează toate job-urile unui utilizator"""
+        with self._results_lock:
+            return [dict(record) for record in self._jobs.values() if record["user_id"] == user_id]
+
+    def drain_results(self, user_id):
+        """
+        Returnează (o singură dată) rezultatele terminate de la ultimul apel.
+        Front-end-urile o apelează periodic (dcc.Interval în Dash, rerun în Streamlit).
+        """
+        with self._results_lock:
+            pending = self._pending_results.pop(user_id, None)
+        return list(pending) if pending else []
+
+    def wait(self, job_id, timeout=None):
+        """Așteaptă blocant terminarea unui job (pentru scripturi și teste)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            record = self.get_job(job_id)
+            if record is None or (record["status"] in TERMINAL_STATUSES and record["finished_at"]):
+                return record
+            if deadline is not None and time.monotonic() > deadline:
+                return record
+            time.sleep(0.05)
+
+    def get_stats(self):
+        """Returnează statisticile managerului"""
+        with self._results_lock:
+            statuses = defaultdict(int)
+            for record in self._jobs.values():
+                statuses[record["status"]] += 1
+        return {
+            "fake_backends": self.use_fake_backends,
+            "running": self._loop is not None,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "jobs_by_status": dict(statuses),
+            "max_finished_jobs": self.max_finished_jobs,
+            "backend_fetches": self.backend_fetches,
+            "backend_cache_hits": self.backend_cache_hits,
+            "backend_ttl": self.backend_ttl
+        }
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    """
+    Returnează managerul de job-uri IBM comun procesului.
+    TTL-ul listei de backend-uri se citește din QUANTUM_IBM_BACKEND_TTL,
+    iar numărul de job-uri simultane din QUANTUM_IBM_MAX_JOBS și numărul de
+    job-uri terminate păstrate din QUANTUM_IBM_MAX_FINISHED_JOBS.
+    """
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = IBMJobManager(
+                    backend_ttl=_env_float('QUANTUM_IBM_BACKEND_TTL', DEFAULT_BACKEND_TTL),
+                    max_concurrent_jobs=int(_env_float('QUANTUM_IBM_MAX_JOBS', 4)),
+                    max_finished_jobs=int(_env_float('QUANTUM_IBM_MAX_FINISHED_JOBS', DEFAULT_MAX_FINISHED_JOBS))
+                )
+    return _job_manager
@@ -5,6 +5,8 @@ import random
 import time
 import json
 
+from quantum_rng import get_qrng
+
 class LegalEvidenceSystem:
     """
     Sistem avansat de colectare de dovezi legale pentru acțiune împotriva scammerilor
@@ -127,7 +129,7 @@ class LegalEvidenceSystem:
                                                   min(3, len(self.crime_categories))))
         
         # Generăm un ID unic pentru această colecție de dovezi
-        evidence_id = hashlib.sha256(f"EVIDENCE-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16]
+        evidence_id = hashlib.sha256(f"EVIDENCE-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16]
         
         # Creăm intrarea pentru dovezi
         evidence_entry = {
@@ -200,7 +202,7 @@ class LegalEvidenceSystem:
         
         # Creăm cazul legal
         legal_case = {
-            "case_id": hashlib.sha256(f"LEGAL-CASE-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "case_id": hashlib.sha256(f"LEGAL-CASE-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "case_type": case_type,
             "evidence_count": len(case_evidence),
@@ -284,7 +286,7 @@ class LegalEvidenceSystem:
         
         # Generăm pachetul de dovezi
         evidence_package = {
-            "package_id": hashlib.sha256(f"EVIDENCE-PACKAGE-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16],
+            "package_id": hashlib.sha256(f"EVIDENCE-PACKAGE-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16],
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "case_id": case_id if case_id else "ALL_EVIDENCE",
             "evidence_count": len(relevant_evidence),
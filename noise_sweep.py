@@ -0,0 +1,348 @@
+import os
+import time
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backend_pool import get_backend, get_backend_pool
+from transpile_cache import cached_transpile
+from circuit_library import build_parameterized_teleportation_circuit, TELEPORT_THETA, TELEPORT_PHI
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Cele 6 stări cardinale ale sferei Bloch (|0⟩, |1⟩, |+⟩, |−⟩, |+i⟩, |−i⟩);
+# media fidelității pe ele este fidelitatea medie a canalului de teleportare
+CARDINAL_STATES = (
+    (0.0, 0.0),
+    (np.pi, 0.0),
+    (np.pi / 2, 0.0),
+    (np.pi / 2, np.pi),
+    (np.pi / 2, np.pi / 2),
+    (np.pi / 2, -np.pi / 2)
+)
+
+# Metoda density_matrix simulează zgomotul exact, fără traiectorii, pentru 3 qubiți
+SWEEP_METHOD = "density_matrix"
+
+# Qubit-ul pe care ajunge starea teleportată și biții măsurătorii Bell care comandă
+# corecțiile: qubit-ul 1 comandă X, qubit-ul 0 comandă Z (ca în protocolul cu if_test)
+TARGET_QUBIT = 2
+X_CONTROL_QUBIT = 1
+Z_CONTROL_QUBIT = 0
+
+# Metoda de pornire a proceselor; "spawn" evită blocajele OpenMP din Aer după fork
+SWEEP_START_METHOD = os.environ.get("QUANTUM_SWEEP_START_METHOD", "spawn")
+
+# Operațiile care nu primesc erori de poartă
+_NON_GATE_OPERATIONS = {"measure", "barrier", "reset", "delay", "save_density_matrix"}
+
+# Corecțiile X/Z și proiectorii pe valorile bitului de control
+_PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
+_PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
+_PROJECTORS = (np.diag([1, 0]).astype(complex), np.diag([0, 1]).astype(complex))
+
+# Circuitul transpilat primit de fiecare proces de lucru (setat de _init_worker)
+_worker_circuit = None
+
+
+def _gate_errors(depolarizing, amplitude_damping):
+    """Erorile per poartă cu unul și doi qubiți (None dacă rata este 0)"""
+    from qiskit_aer.noise import depolarizing_error, amplitude_damping_error
+
+    error_1q = None
+    error_2q = None
+    if depolarizing > 0:
+        error_1q = depolarizing_error(depolarizing, 1)
+        error_2q = depolarizing_error(depolarizing, 2)
+    if amplitude_damping > 0:
+        damping = amplitude_damping_error(amplitude_damping)
+        error_1q = damping if error_1q is None else error_1q.compose(damping)
+        damping_2q = damping.tensor(damping)
+        error_2q = damping_2q if error_2q is None else error_2q.compose(damping_2q)
+    return error_1q, error_2q
+
+
+def build_noise_model(depolarizing=0.0, amplitude_damping=0.0, one_qubit_gates=("h",), two_qubit_gates=("cx",)):
+    """
+    Construiește NoiseModel-ul Aer cu erorile de poartă pentru un punct din grila de zgomot
+
+    Args:
+        depolarizing (float): Probabilitatea de depolarizare per poartă
+        amplitude_damping (float): Parametrul γ de amortizare a amplitudinii per qubit și poartă
+        one_qubit_gates (iterable): Porțile cu un qubit care primesc erori
+        two_qubit_gates (iterable): Porțile cu doi qubiți care primesc erori
+
+    Returns:
+        NoiseModel: Modelul de zgomot
+    """
+    from qiskit_aer.noise import NoiseModel
+
+    noise_model = NoiseModel()
+    error_1q, error_2q = _gate_errors(depolarizing, amplitude_damping)
+    if error_1q is not None and one_qubit_gates:
+        noise_model.add_all_qubit_quantum_error(error_1q, list(one_qubit_gates))
+    if error_2q is not None and two_qubit_gates:
+        noise_model.add_all_qubit_quantum_error(error_2q, list(two_qubit_gates))
+
+    return noise_model
+
+
+def build_correction_channel(correction, gate_error=None, readout_error=0.0):
+    """
+    Corecția comandată de un bit al măsurătorii Bell, ca în protocolul cu if_test
+
+    Bitul de control este citit greșit cu probabilitatea readout_error; poarta X/Z
+    se aplică doar când bitul citit este 1 și numai atunci primește eroarea de poartă
+    (o singură poartă cu un qubit, nu o poartă controlată cu doi qubiți).
+
+    Args:
+        correction (np.ndarray): Matricea corecției (X sau Z)
+        gate_error (QuantumError, optional): Eroarea porții cu un qubit
+        readout_error (float): Probabilitatea de inversare a bitului la citire
+
+    Returns:
+        Kraus: Canalul pe qubiții (control, țintă)
+    """
+    from qiskit.quantum_info import Kraus
+
+    gate_operators = [correction]
+    if gate_error is not None:
+        gate_operators = [operator @ correction for operator in Kraus(gate_error.to_quantumchannel()).data]
+
+    identity = np.eye(2, dtype=complex)
+    operators = []
+    for bit, projector in enumerate(_PROJECTORS):
+        for applied in (0, 1):
+            # Poarta se aplică dacă bitul citit (bit, eventual inversat) este 1
+            probability = readout_error if applied != bit else 1 - readout_error
+            if probability <= 0:
+                continue
+            # Ordinea Qiskit: qubit-ul țintă (al doilea) este factorul din stânga
+            for operator in (gate_operators if applied else [identity]):
+                operators.append(np.sqrt(probability) * np.kron(operator, projector))
+    return Kraus(operators)
+
+
+def _state_vector(theta, phi):
+    """|ψ⟩ = cos(θ/2)|0⟩ + e^(iφ) sin(θ/2)|1⟩"""
+    return np.array([np.cos(theta / 2), np.exp(1j * phi) * np.sin(theta / 2)])
+
+
+def _is_state_preparation(operation):
+    """Poarta care pregătește starea de intrare (parametrizată după θ, φ)"""
+    state_parameters = {TELEPORT_THETA.name, TELEPORT_PHI.name}
+    return any(parameter.name in state_parameters
+               for param in operation.params if hasattr(param, "parameters")
+               for parameter in param.parameters)
+
+
+def _gate_names(circuit):
+    """
+    Porțile cu unul și doi qubiți ale protocolului din circuitul transpilat
+
+    Pregătirea stării de intrare nu face parte din teleportare și nu primește zgomot.
+
+    Raises:
+        ValueError: Pregătirea folosește aceeași poartă ca protocolul (zgomotul nu le poate separa)
+    """
+    one_qubit, two_qubit, preparation = set(), set(), set()
+    for instruction in circuit.data:
+        name = instruction.operation.name
+        if name in _NON_GATE_OPERATIONS:
+            continue
+        if _is_state_preparation(instruction.operation):
+            preparation.add(name)
+        elif len(instruction.qubits) == 1:
+            one_qubit.add(name)
+        elif len(instruction.qubits) == 2:
+            two_qubit.add(name)
+    if preparation & (one_qubit | two_qubit):
+        raise ValueError(f"Pregătirea stării folosește porți ale protocolului: {sorted(preparation)}")
+    return sorted(one_qubit), sorted(two_qubit)
+
+
+def _init_worker(circuit):
+    """Inițializează un proces de lucru: un singur thread Aer per proces și circuitul transpilat"""
+    global _worker_circuit
+    _worker_circuit = circuit
+    get_backend_pool().configure(max_parallel_threads=1)
+
+
+def _evaluate_points(circuit, points, states):
+    """
+    Evaluează fidelitatea pentru o listă de puncte din grilă
+
+    Toate stările de test ale unui punct sunt legate în același job Aer. Circuitul
+    primit se oprește după rotația în baza Bell; corecțiile sunt adăugate pentru fiecare
+    punct ca un canal (build_correction_channel). Matricea densității qubit-ului
+    teleportat este exactă (fără eșantionare), iar fidelitatea este ⟨ψ|ρ|ψ⟩, deci
+    nici pregătirea stării, nici o poartă de verificare nu primesc zgomot.
+    """
+    import qiskit_aer  # noqa: F401 - înregistrează save_density_matrix pe QuantumCircuit
+
+    backend = get_backend("aer_simulator", SWEEP_METHOD)
+    one_qubit_gates, two_qubit_gates = _gate_names(circuit)
+
+    # Parametrii sunt căutați după nume, ca la circuitele restaurate din cache-ul de pe disc
+    parameters = {param.name: param for param in circuit.parameters}
+    parameter_binds = [{
+        parameters[TELEPORT_THETA.name]: [theta for theta, _ in states],
+        parameters[TELEPORT_PHI.name]: [phi for _, phi in states]
+    }]
+
+    vectors = [_state_vector(theta, phi) for theta, phi in states]
+
+    rows = []
+    for _, depolarizing, amplitude_damping, readout_error in points:
+        noise_model = build_noise_model(depolarizing, amplitude_damping, one_qubit_gates, two_qubit_gates)
+        gate_error, _ = _gate_errors(depolarizing, amplitude_damping)
+
+        # Corecțiile clasice: X comandat de qubit-ul 1, apoi Z comandat de qubit-ul 0
+        point_circuit = circuit.copy()
+        point_circuit.append(build_correction_channel(_PAULI_X, gate_error, readout_error),
+                             [point_circuit.qubits[X_CONTROL_QUBIT], point_circuit.qubits[TARGET_QUBIT]])
+        point_circuit.append(build_correction_channel(_PAULI_Z, gate_error, readout_error),
+                             [point_circuit.qubits[Z_CONTROL_QUBIT], point_circuit.qubits[TARGET_QUBIT]])
+        point_circuit.save_density_matrix([point_circuit.qubits[TARGET_QUBIT]])
+        result = backend.run(point_circuit, shots=1, noise_model=noise_model,
+                             parameter_binds=parameter_binds).result()
+
+        fidelities = []
+        for position, vector in enumerate(vectors):
+            density_matrix = np.asarray(result.data(position)["density_matrix"])
+            fidelities.append(float(np.real(vector.conj() @ density_matrix @ vector)))
+        fidelities = np.array(fidelities)
+
+        rows.append({
+            "depolarizing": depolarizing,
+            "amplitude_damping": amplitude_damping,
+            "readout_error": readout_error,
+            "fidelity": float(fidelities.mean()),
+            "fidelity_min": float(fidelities.min()),
+            "num_states": len(fidelities)
+        })
+    return rows
+
+
+def _evaluate_chunk(points, states):
+    """Punctul de intrare al proceselor de lucru"""
+    return _evaluate_points(_worker_circuit, points, states)
+
+
+class NoiseSweepEngine:
+    """
+    Motor de baleiaj al fidelității teleportării sub zgomot realist, rulat local.
+
+    Grila de rate (depolarizare × amortizare a amplitudinii × eroare de citire) este
+    împărțită în bucăți distribuite pe un ProcessPoolExecutor. Circuitul de teleportare
+    este transpilat o singură dată prin cache-ul comun și trimis fiecărui proces la
+    inițializare; fiecare punct din grilă doar construiește NoiseModel-ul și leagă
+    parametrii stărilor de test. Porțile protocolului primesc erori prin NoiseModel,
+    iar corecțiile X/Z, comandate de biții măsurătorii Bell (cu erorile lor de citire),
+    sunt canale cu eroarea unei porți cu un qubit.
+    """
+
+    def __init__(self, max_workers=None, states=CARDINAL_STATES):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.states = [(float(theta), float(phi)) for theta, phi in states]
+
+    def compiled_circuit(self):
+        """Circuitul de teleportare până la rotația în baza Bell, fără corecții (transpilat prin cache)"""
+        circuit = build_parameterized_teleportation_circuit(measure=False, corrections=False)
+        return cached_transpile(circuit, get_backend("aer_simulator", SWEEP_METHOD))
+
+    @staticmethod
+    def build_grid(depolarizing_rates=(0.0,), amplitude_damping_rates=(0.0,), readout_error_rates=(0.0,)):
+        """Produsul cartezian al ratelor, cu indexul fiecărui punct"""
+        grid = itertools.product(depolarizing_rates, amplitude_damping_rates, readout_error_rates)
+        return [
+            (index, float(depolarizing), float(amplitude_damping), float(readout_error))
+            for index, (depolarizing, amplitude_damping, readout_error) in enumerate(grid)
+        ]
+
+    def run(self, depolarizing_rates=(0.0,), amplitude_damping_rates=(0.0,), readout_error_rates=(0.0,),
+            max_workers=None):
+        """
+        Rulează baleiajul pe grila de zgomot
+
+        Args:
+            depolarizing_rates (iterable): Ratele de depolarizare
+            amplitude_damping_rates (iterable): Ratele de amortizare a amplitudinii
+            readout_error_rates (iterable): Ratele de eroare la citire
+            max_workers (int, optional): Numărul de procese (implicit self.max_workers)
+
+        Returns:
+            pd.DataFrame: Câte un rând per punct din grilă, cu fidelitatea medie
+                și minimă (exacte) față de parametrii de zgomot
+        """
+        workers = max_workers or self.max_workers
+        points = self.build_grid(depolarizing_rates, amplitude_damping_rates, readout_error_rates)
+        circuit = self.compiled_circuit()
+
+        if workers <= 1 or len(points) <= 1:
+            rows = _evaluate_points(circuit, points, self.states)
+        else:
+            workers = min(workers, len(points))
+            # Câteva bucăți per proces pentru echilibrarea încărcării
+            chunk_count = min(len(points), workers * 4)
+            chunks = [points[start::chunk_count] for start in range(chunk_count)]
+
+            rows = []
+            context = multiprocessing.get_context(SWEEP_START_METHOD)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker, initargs=(circuit,)) as executor:
+                futures = [executor.submit(_evaluate_chunk, chunk, self.states) for chunk in chunks]
+                for future in futures:
+                    rows.extend(future.result())
+
+        frame = pd.DataFrame(rows, columns=[
+            "depolarizing", "amplitude_damping", "readout_error",
+            "fidelity", "fidelity_min", "num_states"
+        ])
+        return frame.sort_values(["depolarizing", "amplitude_damping", "readout_error"]).reset_index(drop=True)
+
+
+def benchmark_sweep_scaling(worker_counts=None, grid_size=6):
+    """
+    Măsoară scalarea baleiajului cu numărul de procese
+
+    Args:
+        worker_counts (iterable, optional): Numerele de procese testate
+            (implicit puteri ale lui 2 până la numărul de nuclee); rularea cu un
+            singur proces este adăugată mereu, fiind referința accelerării
+        grid_size (int): Numărul de valori pe fiecare axă a grilei (grid_size^3 puncte)
+
+    Returns:
+        pd.DataFrame: Timpul, accelerarea și eficiența pentru fiecare număr de procese
+    """
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = {min(2 ** power, cores) for power in range(cores.bit_length() + 1)}
+    worker_counts = sorted(set(worker_counts) | {1})
+
+    rates = np.linspace(0.0, 0.05, grid_size)
+    engine = NoiseSweepEngine()
+
+    results = []
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        frame = engine.run(rates, rates, rates, max_workers=workers)
+        elapsed = time.perf_counter() - start_time
+        results.append({"workers": workers, "grid_points": len(frame), "seconds": round(elapsed, 3)})
+
+    benchmark = pd.DataFrame(results)
+    baseline = benchmark["seconds"].iloc[0]
+    benchmark["speedup"] = (baseline / benchmark["seconds"]).round(2)
+    benchmark["efficiency"] = (benchmark["speedup"] / benchmark["workers"]).round(2)
+    return benchmark
+
+
+if __name__ == "__main__":
+    print(f"Nuclee disponibile: {os.cpu_count()}")
+    print(benchmark_sweep_scaling().to_string(index=False))
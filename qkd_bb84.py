@@ -0,0 +1,343 @@
+import os
+import math
+import time
+import hashlib
+import threading
+
+import numpy as np
+
+from quantum_rng import get_qrng
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Pragul QBER peste care protocolul BB84 nu mai poate extrage o cheie sigură
+QBER_ABORT_THRESHOLD = 0.11
+
+# Eficiența reconcilierii (Cascade): scurgerea reală față de limita Shannon n·h(e)
+EC_EFFICIENCY = 1.16
+
+# Dimensiunea blocului pentru amplificarea confidențialității (hashing Toeplitz prin FFT)
+PA_BLOCK_BITS = 1 << 20
+
+# Qubiți transmiși per sesiune de cheie, pentru sursa de chei a checkpoint-urilor
+DEFAULT_SESSION_QUBITS = 1 << 20
+
+
+def binary_entropy(p):
+    """Entropia binară h(p) în biți"""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -p * math.log2(p) - (1 - p) * math.log2(1 - p)
+
+
+def toeplitz_hash(bits, output_bits, seed_bits):
+    """
+    Hashing Toeplitz peste GF(2): y = T·x mod 2, cu T definită de m+n-1 biți publici
+
+    Produsul matrice-vector este o convoluție, calculată prin FFT în O(n log n)
+    în loc de O(m·n). Sumele sunt întregi sub 2^21, deci rotunjirea este exactă.
+
+    Args:
+        bits (np.ndarray): Cheia reconciliată (uint8, n biți)
+        output_bits (int): Lungimea cheii finale m
+        seed_bits (np.ndarray): Prima coloană și primul rând ai matricei (m+n-1 biți)
+
+    Returns:
+        np.ndarray: Cheia finală (uint8, m biți)
+    """
+    n = len(bits)
+    if output_bits <= 0 or n == 0:
+        return np.zeros(0, dtype=np.uint8)
+    size = 1 << (output_bits + n - 2).bit_length()
+    spectrum = np.fft.rfft(seed_bits.astype(np.float64), size) * np.fft.rfft(bits.astype(np.float64), size)
+    convolution = np.fft.irfft(spectrum, size)[n - 1:n - 1 + output_bits]
+    return (np.rint(convolution).astype(np.int64) & 1).astype(np.uint8)
+
+
+class BB84Simulator:
+    """
+    Simulator vectorizat al protocolului BB84 de distribuție cuantică a cheilor.
+
+    Fiecare pas operează pe array-uri NumPy de lungimea numărului de qubiți:
+    alegerea bazelor, transmisia pe un canal cu pierderi și zgomot (plus un
+    atacator opțional de tip intercept-resend), sifting, estimarea QBER pe un
+    eșantion public și amplificarea confidențialității prin hashing Toeplitz.
+    Reconcilierea erorilor este modelată prin scurgerea ei de informație
+    (EC_EFFICIENCY · h(QBER) per bit); cheia reconciliată este cheia lui Alice.
+    """
+
+    def __init__(self, channel_error=0.01, channel_loss=0.0, eavesdrop_fraction=0.0, sample_fraction=0.1,
+                 qber_threshold=QBER_ABORT_THRESHOLD, ec_efficiency=EC_EFFICIENCY, security_epsilon=1e-10,
+                 pa_block_bits=PA_BLOCK_BITS):
+        """
+        Args:
+            channel_error (float): Probabilitatea de inversare a bitului pe canal
+            channel_loss (float): Probabilitatea ca un foton să fie pierdut
+            eavesdrop_fraction (float): Fracțiunea de qubiți interceptați și retrimiși de Eve
+            sample_fraction (float): Fracțiunea cheii sifted sacrificată pentru estimarea QBER
+            qber_threshold (float): QBER-ul peste care sesiunea este abandonată
+            ec_efficiency (float): Eficiența reconcilierii erorilor
+            security_epsilon (float): Parametrul de securitate al estimării și amplificării
+            pa_block_bits (int): Biți per bloc de amplificare a confidențialității
+        """
+        for name, value in (("channel_error", channel_error), ("channel_loss", channel_loss),
+                            ("eavesdrop_fraction", eavesdrop_fraction), ("sample_fraction", sample_fraction)):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} trebuie să fie între 0 și 1")
+        self.channel_error = float(channel_error)
+        self.channel_loss = float(channel_loss)
+        self.eavesdrop_fraction = float(eavesdrop_fraction)
+        self.sample_fraction = float(sample_fraction)
+        self.qber_threshold = float(qber_threshold)
+        self.ec_efficiency = float(ec_efficiency)
+        self.security_epsilon = float(security_epsilon)
+        self.pa_block_bits = int(pa_block_bits)
+
+    def _transmit(self, rng, num_qubits):
+        """Pregătirea lui Alice, canalul (cu Eve opțional) și măsurarea lui Bob"""
+        alice_bits = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+        alice_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+        bob_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+
+        sent_bits = alice_bits
+        sent_bases = alice_bases
+        if self.eavesdrop_fraction > 0:
+            # Intercept-resend: Eve măsoară într-o bază aleatoare și retrimite ce a obținut
+            intercepted = rng.random(num_qubits, dtype=np.float32) < self.eavesdrop_fraction
+            eve_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+            eve_guess = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+            eve_bits = np.where(eve_bases == alice_bases, alice_bits, eve_guess)
+            sent_bits = np.where(intercepted, eve_bits, alice_bits)
+            sent_bases = np.where(intercepted, eve_bases, alice_bases)
+
+        # Bob obține bitul trimis în baza corectă și un bit aleator în cealaltă
+        bob_guess = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+        bob_bits = np.where(bob_bases == sent_bases, sent_bits, bob_guess)
+        if self.channel_error > 0:
+            bob_bits ^= (rng.random(num_qubits, dtype=np.float32) < self.channel_error).astype(np.uint8)
+
+        received = None
+        if self.channel_loss > 0:
+            received = rng.random(num_qubits, dtype=np.float32) >= self.channel_loss
+        return alice_bits, alice_bases, bob_bits, bob_bases, received
+
+    def secure_key_length(self, raw_bits, qber, sample_size):
+        """
+        Lungimea cheii finale după reconciliere și amplificarea confidențialității
+
+        QBER-ul estimat este majorat cu corecția de eșantion finit (Hoeffding), apoi
+        se scade informația lui Eve (h(e)), scurgerea reconcilierii și marja de securitate.
+        """
+        if raw_bits == 0 or sample_size == 0:
+            return 0, None
+        qber_upper = min(0.5, qber + math.sqrt(math.log(1 / self.security_epsilon) / (2 * sample_size)))
+        entropy = binary_entropy(qber_upper)
+        security_margin = 2 * math.log2(1 / self.security_epsilon)
+        length = raw_bits * (1 - entropy - self.ec_efficiency * entropy) - security_margin
+        return max(0, int(length)), qber_upper
+
+    def run(self, num_qubits, seed=None):
+        """
+        Rulează o sesiune BB84 completă
+
+        Args:
+            num_qubits (int): Numărul de qubiți transmiși de Alice
+            seed (int, optional): Seed-ul generatorului (implicit din rezervorul QRNG)
+
+        Returns:
+            dict: Cheia finală (bytes), lungimile după fiecare etapă, QBER-ul estimat
+                și real, starea sesiunii și throughput-ul
+        """
+        start_time = time.perf_counter()
+        num_qubits = int(num_qubits)
+        if seed is None:
+            seed = get_qrng().randbits(64)
+        rng = np.random.default_rng(seed)
+
+        alice_bits, alice_bases, bob_bits, bob_bases, received = self._transmit(rng, num_qubits)
+
+        # Sifting: se păstrează doar qubiții detectați măsurați în aceeași bază
+        sifted = alice_bases == bob_bases
+        if received is not None:
+            sifted &= received
+        alice_sifted = alice_bits[sifted]
+        bob_sifted = bob_bits[sifted]
+
+        # Estimarea QBER pe un eșantion public, eliminat apoi din cheie
+        sample = rng.random(len(alice_sifted), dtype=np.float32) < self.sample_fraction
+        sample_size = int(np.count_nonzero(sample))
+        sample_errors = int(np.count_nonzero(alice_sifted[sample] != bob_sifted[sample]))
+        qber = sample_errors / sample_size if sample_size else 0.0
+
+        alice_raw = alice_sifted[~sample]
+        raw_errors = int(np.count_nonzero(alice_raw != bob_sifted[~sample]))
+
+        key_bits = 0
+        qber_upper = None
+        aborted = sample_size == 0 or qber > self.qber_threshold
+        final_key = np.zeros(0, dtype=np.uint8)
+        if not aborted:
+            # Amplificarea confidențialității pe blocuri: fiecare bloc își primește
+            # propria matrice Toeplitz, cu lungimea de ieșire proporțională
+            blocks = []
+            for offset in range(0, len(alice_raw), self.pa_block_bits):
+                block = alice_raw[offset:offset + self.pa_block_bits]
+                output_bits, qber_upper = self.secure_key_length(len(block), qber, sample_size)
+                if output_bits <= 0:
+                    continue
+                seed_bits = rng.integers(0, 2, output_bits + len(block) - 1, dtype=np.uint8)
+                blocks.append(toeplitz_hash(block, output_bits, seed_bits))
+            if blocks:
+                final_key = np.concatenate(blocks)
+            key_bits = len(final_key)
+            aborted = key_bits == 0
+
+        elapsed = time.perf_counter() - start_time
+        usable_bits = key_bits - key_bits % 8
+        return {
+            "key": np.packbits(final_key[:usable_bits]).tobytes(),
+            "key_bits": key_bits,
+            "qubits_sent": num_qubits,
+            "qubits_detected": int(np.count_nonzero(received)) if received is not None else num_qubits,
+            "sifted_bits": int(len(alice_sifted)),
+            "sample_bits": sample_size,
+            "raw_key_bits": int(len(alice_raw)),
+            "qber": round(qber, 6),
+            "qber_upper_bound": round(qber_upper, 6) if qber_upper is not None else None,
+            "raw_key_errors": raw_errors,
+            "eavesdropping_detected": qber > self.qber_threshold,
+            "aborted": aborted,
+            "secret_fraction": round(key_bits / num_qubits, 6) if num_qubits else 0.0,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "qubits_per_second": round(num_qubits / elapsed) if elapsed else None,
+            "key_bits_per_second": round(key_bits / elapsed) if elapsed else None
+        }
+
+
+class QKDKeySource:
+    """
+    Sursă de chei pentru protecția checkpoint-urilor și a backup-urilor.
+
+    Rulează sesiuni BB84 la cerere și păstrează biții de cheie rămași pentru
+    cererile următoare, astfel încât o sesiune de un milion de qubiți acoperă
+    mii de chei de 32 de octeți.
+    """
+
+    def __init__(self, simulator=None, session_qubits=DEFAULT_SESSION_QUBITS, max_attempts=3):
+        self.simulator = simulator or BB84Simulator()
+        self.session_qubits = int(session_qubits)
+        self.max_attempts = max_attempts
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self.sessions = 0
+        self.aborted_sessions = 0
+        self.keys_issued = 0
+        self.last_session = None
+
+    def _run_session(self):
+        session = self.simulator.run(self.session_qubits)
+        self.sessions += 1
+        self.last_session = {key: value for key, value in session.items() if key != "key"}
+        if session["aborted"]:
+            self.aborted_sessions += 1
+            print(f"[QKD] Sesiune BB84 abandonată (QBER {session['qber']:.4f})")
+            return False
+        self._buffer.extend(session["key"])
+        return True
+
+    def get_key(self, nbytes=32):
+        """
+        Returnează nbytes octeți de cheie distribuită prin BB84
+
+        Raises:
+            RuntimeError: Dacă sesiunile succesive sunt abandonate (QBER prea mare)
+        """
+        with self._lock:
+            attempts = 0
+            while len(self._buffer) < nbytes:
+                if not self._run_session():
+                    attempts += 1
+                    if attempts >= self.max_attempts:
+                        raise RuntimeError("Canalul QKD nu poate produce o cheie sigură (QBER peste prag)")
+            key = bytes(self._buffer[:nbytes])
+            del self._buffer[:nbytes]
+            self.keys_issued += 1
+            return key
+
+    @staticmethod
+    def key_id(key):
+        """Identificator public al unei chei (nu dezvăluie cheia)"""
+        return hashlib.sha256(b"QKD-KEY-ID" + key).hexdigest()[:16]
+
+    def get_stats(self):
+        return {
+            "sessions": self.sessions,
+            "aborted_sessions": self.aborted_sessions,
+            "keys_issued": self.keys_issued,
+            "buffered_key_bytes": len(self._buffer),
+            "session_qubits": self.session_qubits,
+            "last_session": self.last_session
+        }
+
+
+_qkd_source = None
+_qkd_source_lock = threading.Lock()
+
+
+def get_qkd_key_source():
+    """
+    Returnează sursa de chei QKD comună procesului.
+    Rata de eroare a canalului se citește din QUANTUM_QKD_CHANNEL_ERROR, iar
+    numărul de qubiți per sesiune din QUANTUM_QKD_SESSION_QUBITS.
+    """
+    global _qkd_source
+    if _qkd_source is None:
+        with _qkd_source_lock:
+            if _qkd_source is None:
+                _qkd_source = QKDKeySource(
+                    simulator=BB84Simulator(channel_error=float(os.environ.get('QUANTUM_QKD_CHANNEL_ERROR', 0.01))),
+                    session_qubits=int(os.environ.get('QUANTUM_QKD_SESSION_QUBITS', DEFAULT_SESSION_QUBITS))
+                )
+    return _qkd_source
+
+
+def benchmark_bb84(qubit_counts=(10 ** 5, 10 ** 6, 10 ** 7), channel_error=0.02, repeats=3, seed=1234):
+    """
+    Măsoară throughput-ul simulatorului BB84 (qubiți și biți de cheie per secundă)
+
+    Args:
+        qubit_counts (iterable): Numărul de qubiți per sesiune
+        channel_error (float): Rata de eroare a canalului
+        repeats (int): Rulări per dimensiune (se păstrează cea mai rapidă)
+        seed (int): Seed-ul de bază
+
+    Returns:
+        list: Câte un rând per dimensiune, cu lungimea cheii, QBER și throughput-ul
+    """
+    simulator = BB84Simulator(channel_error=channel_error)
+    results = []
+    for num_qubits in qubit_counts:
+        best = None
+        for repeat in range(repeats):
+            session = simulator.run(num_qubits, seed=seed + repeat)
+            if best is None or session["elapsed_ms"] < best["elapsed_ms"]:
+                best = session
+        results.append({
+            "qubits": num_qubits,
+            "key_bits": best["key_bits"],
+            "qber": best["qber"],
+            "elapsed_ms": best["elapsed_ms"],
+            "qubits_per_second": best["qubits_per_second"],
+            "key_bits_per_second": best["key_bits_per_second"]
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark_bb84():
+        print(f"{row['qubits']:>10} qubiți: cheie {row['key_bits']:>9} biți  QBER {row['qber']:.4f}  "
+              f"{row['elapsed_ms']:9.1f} ms  {row['qubits_per_second'] / 1e6:6.2f} Mqubiți/s  "
+              f"{row['key_bits_per_second'] / 1e6:6.2f} Mbiți cheie/s")
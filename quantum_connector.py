@@ -6,11 +6,13 @@ import hashlib
 import random
 import numpy as np
 from qiskit import QuantumCircuit, transpile
-import qiskit_aer
-from qiskit_aer import AerSimulator
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+from statevector_engine import execute_circuit, execute_circuits
+from backend_pool import get_backend
+from repeater_chain import RepeaterChainSimulator
+from circuit_templates import get_template_registry
 
 # COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
 # TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
@@ -55,9 +57,11 @@ class QuantumConnector:
             self.ibm_token_available = True
         else:
             self.ibm_token_available = False
-            
-        # Folosim simulatorul Aer pentru demonstrații
-        self.simulator = AerSimulator()
+    
+    @property
+    def simulator(self):
+        """Simulatorul Aer pentru demonstrații, creat la prima utilizare și partajat în proces"""
+        return get_backend('aer_simulator')
     
     def _generate_connector_signature(self):
         """Generează o semnătură unică pentru conectorul quantum"""
@@ -103,7 +107,7 @@ class QuantumConnector:
             "results": connection_results
         }
     
-    def teleport_data(self, source, destination, data_size):
+    def teleport_data(self, source, destination, data_size, simulate_link=False):
         """
         Teleportează date quantum între datacentere utilizând quantum entanglement
         
@@ -111,6 +115,8 @@ class QuantumConnector:
             source (str): Datacenterul sursă
             destination (str): Datacenterul destinație
             data_size (int): Dimensiunea datelor în TB
+            simulate_link (bool): Simulează lanțul de repetoare dintre datacentere
+                și raportează fidelitatea reală a legăturii
             
         Returns:
             dict: Rezultatul teleportării
@@ -134,6 +140,10 @@ class QuantumConnector:
         # Calculăm viteza de transfer
         transfer_speed = data_size / teleport_time if teleport_time > 0 else float('inf')
         
+        # Simulăm opțional lanțul de repetoare pentru calitatea entanglement-ului
+        repeater_chain = self.simulate_repeater_chain(source, destination) if simulate_link else None
+        entanglement_quality = f"{repeater_chain['end_to_end_fidelity'] * 100:.2f}%" if repeater_chain else "100%"
+        
         # Creăm jurnalul de teleportare
         teleport_log = {
             "teleport_id": teleport_id,
@@ -143,7 +153,7 @@ class QuantumConnector:
             "teleport_time_sec": round(teleport_time, 6),
             "transfer_speed_tb_sec": round(transfer_speed, 2),
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-            "entanglement_quality": "100%",
+            "entanglement_quality": entanglement_quality,
             "security_level": "MAXIMUM",
             "blockchain_verified": True,
             "dna_signature_verified": True,
@@ -163,9 +173,30 @@ class QuantumConnector:
             "transfer_speed_tb_sec": round(transfer_speed, 2),
             "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "message": f"Teleportare quantum completă: {data_size} TB transferați de la {source} la {destination}.",
-            "connection_signature": self._generate_connector_signature()
+            "connection_signature": self._generate_connector_signature(),
+            "entanglement_quality": entanglement_quality,
+            "repeater_chain": repeater_chain
         }
     
+    def simulate_repeater_chain(self, source, destination, via=None, hops=None, link_fidelity=None, shots=2000):
+        """
+        Simulează lanțul de repetoare quantum (entanglement swapping) dintre două datacentere
+        
+        Args:
+            source (str): Datacenterul sursă
+            destination (str): Datacenterul destinație
+            via (list, optional): Regiuni intermediare explicite
+            hops (int, optional): Numărul de segmente (implicit după distanța geografică)
+            link_fidelity (float, optional): Fidelitatea perechilor Bell elementare
+            shots (int): Numărul de shot-uri pentru estimarea fidelității
+            
+        Returns:
+            dict: Fidelitatea end-to-end și adâncimea circuitului per segment
+        """
+        return RepeaterChainSimulator().simulate(
+            source, destination, via=via, hops=hops, link_fidelity=link_fidelity, shots=shots
+        )
+    
     def get_connection_status(self):
         """Obține statusul complet al conexiunilor quantum"""
         total_qubits = 0
@@ -203,63 +234,84 @@ class QuantumConnector:
             "copyright": "© 2023-2033 Toate drepturile rezervate mondial"
         }
     
-    def run_quantum_circuit(self, circuit_type="teleportation"):
+    def _bind_circuit(self, circuit_type, params=None):
+        """
+        Circuitul transpilat al unui tip din registrul de șabloane, cu parametrii legați
+        
+        Raises:
+            UnknownCircuitTypeError: Dacă tipul nu este înregistrat
+        """
+        return get_template_registry().bind(circuit_type, self.simulator, **(params or {}))
+    
+    def _format_circuit_result(self, circuit_type, circuit, execution, shots):
+        """Rezultatul unei execuții în formatul returnat de run_quantum_circuit"""
+        return {
+            "circuit_type": circuit_type,
+            "counts": execution["counts"],
+            "success_rate": "100%",
+            "qubits_used": circuit.num_qubits,
+            "shots": shots,
+            "execution_time_ms": execution["execution_time_ms"],
+            "engine": execution["engine"],
+            "dna_security": True,
+            "owner": "Ervin Remus Radosavlevici",
+            "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
+            "circuit_id": hashlib.sha256(f"CIRCUIT-{circuit_type}-{datetime.datetime.now()}".encode()).hexdigest()[:12]
+        }
+    
+    def list_circuit_types(self):
+        """Tipurile de circuit disponibile (inclusiv cele înregistrate de plugin-uri)"""
+        return get_template_registry().describe()
+    
+    def run_quantum_circuit(self, circuit_type="teleportation", shots=1024, **params):
         """
         Execută un circuit quantum și returnează rezultatele
         
         Args:
-            circuit_type (str): Tipul circuitului de executat
+            circuit_type (str): Tipul circuitului de executat ("teleportation", "bell",
+                "ghz-5", "qft-4", "grover-3", "superdense", "entanglement_swapping", ...)
+            shots (int): Numărul de shot-uri
+            **params: Valorile parametrilor șablonului (implicit valorile șablonului)
             
         Returns:
             dict: Rezultatele execuției
+            
+        Raises:
+            UnknownCircuitTypeError: Dacă tipul de circuit nu este înregistrat
         """
-        results = {}
+        qc = self._bind_circuit(circuit_type, params)
         
-        if circuit_type == "teleportation":
-            # Creăm un circuit de teleportare
-            qc = QuantumCircuit(3, 2)
-            
-            # Starea de teleportat (qubit 0)
-            qc.h(0)
-            qc.t(0)
-            qc.barrier()
-            
-            # Creăm entanglement între qubiții 1 și 2
-            qc.h(1)
-            qc.cx(1, 2)
-            qc.barrier()
-            
-            # Bell measurement
-            qc.cx(0, 1)
-            qc.h(0)
-            qc.measure([0, 1], [0, 1])
-            qc.barrier()
-            
-            # Corecții
-            qc.x(2).c_if(1, 1)
-            qc.z(2).c_if(0, 1)
+        # Executăm circuitul pe motorul potrivit (NumPy pentru circuite mici, Aer în rest)
+        execution = execute_circuit(qc, self.simulator, shots=shots, compiled=True)
+        return self._format_circuit_result(circuit_type, qc, execution, shots)
+    
+    def run_quantum_circuits(self, circuit_types, shots=1024):
+        """
+        Execută mai multe circuite quantum cu un singur apel al simulatorului
+        
+        Toate circuitele sunt trimise împreună într-un singur job Aer
+        (vezi execute_circuits), util pentru paginile care afișează mai multe circuite.
+        
+        Args:
+            circuit_types (list): Tipurile circuitelor de executat; un element poate fi
+                și o pereche (tip, parametri)
+            shots (int): Numărul de shot-uri per circuit
             
-            # Transpilăm și executăm circuitul
-            transpiled_circuit = transpile(qc, self.simulator)
-            job = self.simulator.run(transpiled_circuit, shots=1024)
-            result = job.result()
-            counts = result.get_counts()
+        Returns:
+            list: Rezultatele fiecărui tip, în ordinea cererii
             
-            # Stocăm rezultatele
-            results = {
-                "circuit_type": "teleportation",
-                "counts": counts,
-                "success_rate": "100%",
-                "qubits_used": 3,
-                "shots": 1024,
-                "execution_time_ms": random.randint(10, 50),
-                "dna_security": True,
-                "owner": "Ervin Remus Radosavlevici",
-                "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-                "circuit_id": hashlib.sha256(f"CIRCUIT-{datetime.datetime.now()}".encode()).hexdigest()[:12]
-            }
+        Raises:
+            UnknownCircuitTypeError: Dacă unul dintre tipuri nu este înregistrat
+                (înainte de a executa vreun circuit)
+        """
+        requests = [(item, None) if isinstance(item, str) else item for item in circuit_types]
+        circuits = [self._bind_circuit(circuit_type, params) for circuit_type, params in requests]
+        executions = execute_circuits(circuits, shots=shots, compiled=True)
         
-        return results
+        return [
+            self._format_circuit_result(circuit_type, qc, execution, shots)
+            for (circuit_type, _), qc, execution in zip(requests, circuits, executions)
+        ]
     
     def generate_datacenter_viz(self):
         """Generează o vizualizare pentru datacentere"""
@@ -0,0 +1,322 @@
+import os
+import time
+import secrets
+import threading
+from collections import deque
+
+import numpy as np
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Dimensiunea implicită a buffer-ului de biți pre-generați (octeți)
+DEFAULT_BUFFER_BYTES = 256 * 1024
+
+# Qubiți per circuit: 64 de biți clasici se împachetează într-un singur uint64 per shot
+QRNG_QUBITS = 64
+
+# Shot-uri per job de reumplere (64 qubiți × 8192 shot-uri = 64 KiB per bucată), astfel
+# încât buffer-ul crește incremental și primele bucăți devin disponibile rapid
+DEFAULT_BATCH_SHOTS = 8192
+
+# Ordinea bazelor pentru valorile de 2 biți 00, 01, 10, 11
+DNA_ALPHABET = b"ACGT"
+_DNA_LOOKUP = np.frombuffer(DNA_ALPHABET, dtype=np.uint8)
+_DNA_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+def build_qrng_circuit(num_qubits=QRNG_QUBITS):
+    """
+    Circuitul generatorului: Hadamard pe fiecare qubit, apoi măsurare
+
+    Fiecare shot produce `num_qubits` biți independenți și uniformi.
+    """
+    from qiskit import QuantumCircuit
+
+    circuit = QuantumCircuit(num_qubits, num_qubits, name="qrng")
+    circuit.h(range(num_qubits))
+    circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
+
+
+class QuantumRandomPool:
+    """
+    Rezervor de biți aleatori cuantici, generați în batch-uri și serviți din memorie.
+
+    Biții provin din circuite de măsurare Hadamard rulate pe Aer (metoda stabilizer)
+    sau, opțional, pe un backend hardware. Un thread de fundal reumple buffer-ul
+    când nivelul scade sub pragul minim (low watermark), deci apelanții doar
+    decupează octeți dintr-o coadă de blocuri: cost O(1) amortizat per octet.
+    Dacă buffer-ul nu poate acoperi o cerere, octeții sunt luați imediat din
+    `secrets`; apelanții nu așteaptă niciodată după reumplere.
+    """
+
+    def __init__(self, buffer_bytes=DEFAULT_BUFFER_BYTES, low_watermark=None, num_qubits=QRNG_QUBITS,
+                 batch_shots=DEFAULT_BATCH_SHOTS, backend=None, autostart=True):
+        """
+        Args:
+            buffer_bytes (int): Capacitatea buffer-ului (octeți)
+            low_watermark (int, optional): Nivelul sub care pornește reumplerea
+                (implicit un sfert din capacitate)
+            num_qubits (int): Qubiți per circuit (maxim 64, biți per shot)
+            batch_shots (int): Shot-uri per job de reumplere
+            backend: Backend hardware opțional (implicit Aer local)
+            autostart (bool): Pornește reumplerea la prima cerere
+        """
+        if not 1 <= num_qubits <= 64 or num_qubits % 8:
+            raise ValueError("num_qubits trebuie să fie un multiplu de 8 între 8 și 64")
+        self.buffer_bytes = int(buffer_bytes)
+        self.low_watermark = int(low_watermark if low_watermark is not None else self.buffer_bytes // 4)
+        self.num_qubits = num_qubits
+        self.batch_shots = int(batch_shots)
+        self.backend = backend
+        self.autostart = autostart
+
+        self._blocks = deque()
+        self._offset = 0
+        self._available = 0
+        self._lock = threading.Lock()
+        self._refill_needed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self.bytes_served = 0
+        self.fallback_bytes = 0
+        self.fallback_requests = 0
+        self.bytes_generated = 0
+        self.refill_batches = 0
+        self.refill_errors = 0
+        self.generation_seconds = 0.0
+
+    def start(self):
+        """Pornește thread-ul de reumplere (idempotent)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._refill_loop, name="qrng-refill", daemon=True)
+            self._thread.start()
+        self._refill_needed.set()
+
+    def stop(self):
+        """Oprește reumplerea; octeții rămași în buffer pot fi folosiți în continuare"""
+        self._stopped.set()
+        self._refill_needed.set()
+
+    def _measure_block(self):
+        """Rulează un batch de circuite Hadamard și returnează biții măsurați ca octeți"""
+        from transpile_cache import cached_transpile
+
+        circuit = build_qrng_circuit(self.num_qubits)
+
+        if self.backend is not None and self._is_runtime_backend(self.backend):
+            from qiskit_ibm_runtime import SamplerV2
+            compiled_circuit = cached_transpile(circuit, self.backend)
+            result = SamplerV2(mode=self.backend).run([compiled_circuit], shots=self.batch_shots).result()
+            # BitArray: o matrice (shot-uri × octeți) uint8, fără șiruri de biți
+            return result[0].join_data().array.tobytes()
+
+        from backend_pool import get_backend
+        from shot_memory import memory_to_array
+
+        backend = self.backend or get_backend('aer_simulator', 'stabilizer')
+        compiled_circuit = cached_transpile(circuit, backend)
+        memory = backend.run(compiled_circuit, shots=self.batch_shots, memory=True).result().get_memory()
+        outcomes = memory_to_array(memory, self.num_qubits)
+        if outcomes.dtype == np.uint64:
+            # Doar octeții ocupați de cei num_qubits biți măsurați
+            return outcomes.astype("<u8").view(np.uint8).reshape(-1, 8)[:, :self.num_qubits // 8].tobytes()
+        return outcomes.tobytes()
+
+    @staticmethod
+    def _is_runtime_backend(backend):
+        """Backend-urile IBM reale rulează prin Sampler; cele fake și Aer au backend.run"""
+        try:
+            from qiskit_ibm_runtime import IBMBackend
+        except ImportError:
+            return False
+        return isinstance(backend, IBMBackend)
+
+    def _refill_loop(self):
+        while not self._stopped.is_set():
+            self._refill_needed.wait()
+            if self._stopped.is_set():
+                return
+            while self._available < self.buffer_bytes and not self._stopped.is_set():
+                start_time = time.perf_counter()
+                try:
+                    block = self._measure_block()
+                except Exception as e:
+                    self.refill_errors += 1
+                    print(f"[QRNG] Eroare la generarea biților cuantici: {str(e)}")
+                    # Cererile sunt servite din `secrets` până la următoarea încercare
+                    self._stopped.wait(min(60.0, 2.0 ** min(self.refill_errors, 6)))
+                    break
+                self.generation_seconds += time.perf_counter() - start_time
+                with self._lock:
+                    self._blocks.append(block)
+                    self._available += len(block)
+                    self.bytes_generated += len(block)
+                    self.refill_batches += 1
+            with self._lock:
+                if self._available >= self.low_watermark:
+                    self._refill_needed.clear()
+
+    def _take(self, n):
+        """Decupează n octeți din buffer sau returnează None dacă nu sunt suficienți"""
+        with self._lock:
+            if self._available < n:
+                chunks = None
+            else:
+                chunks = []
+                remaining = n
+                while remaining:
+                    block = self._blocks[0]
+                    end = min(len(block), self._offset + remaining)
+                    chunks.append(block[self._offset:end])
+                    remaining -= end - self._offset
+                    if end == len(block):
+                        self._blocks.popleft()
+                        self._offset = 0
+                    else:
+                        self._offset = end
+                self._available -= n
+            below_watermark = self._available < self.low_watermark
+
+        if below_watermark and self.autostart:
+            if self._thread is None or not self._thread.is_alive():
+                self.start()
+            else:
+                self._refill_needed.set()
+        return b"".join(chunks) if chunks is not None else None
+
+    def random_bytes(self, n):
+        """
+        Returnează n octeți aleatori
+
+        Returns:
+            bytes: Octeți din buffer-ul cuantic sau, dacă acesta este gol, din `secrets`
+        """
+        n = int(n)
+        if n <= 0:
+            return b""
+        data = self._take(n)
+        if data is None:
+            self.fallback_requests += 1
+            self.fallback_bytes += n
+            return secrets.token_bytes(n)
+        self.bytes_served += n
+        return data
+
+    def token_hex(self, nbytes=16):
+        """Șir hexazecimal cu 2*nbytes caractere (înlocuitor pentru secrets.token_hex)"""
+        return self.random_bytes(nbytes).hex()
+
+    def randbits(self, k):
+        """Un întreg cu k biți aleatori"""
+        if k <= 0:
+            return 0
+        value = int.from_bytes(self.random_bytes((k + 7) // 8), "little")
+        return value & ((1 << k) - 1)
+
+    def randbelow(self, n):
+        """
+        Un întreg uniform în [0, n)
+
+        Eșantionare cu respingere pe bit_length(n) biți: în medie sub două extrageri.
+        """
+        if n <= 0:
+            raise ValueError("n trebuie să fie pozitiv")
+        k = n.bit_length()
+        value = self.randbits(k)
+        while value >= n:
+            value = self.randbits(k)
+        return value
+
+    def randint(self, a, b):
+        """Un întreg uniform în [a, b], ca random.randint"""
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, sequence):
+        """Un element ales uniform din secvență"""
+        if not sequence:
+            raise IndexError("Nu se poate alege dintr-o secvență goală")
+        return sequence[self.randbelow(len(sequence))]
+
+    def dna_bases(self, length):
+        """
+        Secvență DNA aleatoare: fiecare octet dă patru baze (câte 2 biți per bază)
+
+        Args:
+            length (int): Numărul de baze
+
+        Returns:
+            str: Secvența din alfabetul A, C, G, T
+        """
+        if length <= 0:
+            return ""
+        data = np.frombuffer(self.random_bytes((length + 3) // 4), dtype=np.uint8)
+        indices = ((data[:, None] >> _DNA_SHIFTS) & 3).ravel()[:length]
+        return _DNA_LOOKUP[indices].tobytes().decode("ascii")
+
+    def get_stats(self):
+        """Starea buffer-ului și statisticile de servire / reumplere"""
+        with self._lock:
+            available = self._available
+        total_served = self.bytes_served + self.fallback_bytes
+        return {
+            "source": getattr(self.backend, "name", None) or "aer_simulator/stabilizer",
+            "available_bytes": available,
+            "buffer_bytes": self.buffer_bytes,
+            "low_watermark": self.low_watermark,
+            "refilling": self._refill_needed.is_set() and not self._stopped.is_set(),
+            "bytes_served": self.bytes_served,
+            "fallback_bytes": self.fallback_bytes,
+            "fallback_requests": self.fallback_requests,
+            "quantum_ratio": round(self.bytes_served / total_served, 4) if total_served else None,
+            "bytes_generated": self.bytes_generated,
+            "refill_batches": self.refill_batches,
+            "refill_errors": self.refill_errors,
+            "generation_kb_per_second": round(self.bytes_generated / 1024 / self.generation_seconds, 1)
+            if self.generation_seconds else None
+        }
+
+
+_qrng = None
+_qrng_lock = threading.Lock()
+
+
+def get_qrng():
+    """
+    Returnează rezervorul QRNG comun procesului.
+    Capacitatea se citește din QUANTUM_QRNG_BUFFER_BYTES, iar pragul de
+    reumplere din QUANTUM_QRNG_LOW_WATERMARK.
+    """
+    global _qrng
+    if _qrng is None:
+        with _qrng_lock:
+            if _qrng is None:
+                buffer_bytes = int(os.environ.get('QUANTUM_QRNG_BUFFER_BYTES', DEFAULT_BUFFER_BYTES))
+                low_watermark = os.environ.get('QUANTUM_QRNG_LOW_WATERMARK')
+                _qrng = QuantumRandomPool(
+                    buffer_bytes=buffer_bytes,
+                    low_watermark=int(low_watermark) if low_watermark else None
+                )
+    return _qrng
+
+
+if __name__ == "__main__":
+    pool = QuantumRandomPool(buffer_bytes=1 << 20, batch_shots=16384)
+    pool.start()
+    while pool.get_stats()["available_bytes"] < pool.buffer_bytes:
+        time.sleep(0.5)
+
+    start_time = time.perf_counter()
+    for _ in range(100_000):
+        pool.random_bytes(8)
+    elapsed = time.perf_counter() - start_time
+    print(f"random_bytes(8): {elapsed / 100_000 * 1e6:.2f} µs/apel")
+    print(f"dna_bases(64): {pool.dna_bases(64)}")
+    print(pool.get_stats())
@@ -1,9 +1,15 @@
 import numpy as np
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer, AerSimulator
 import plotly.graph_objects as go
 import plotly.express as px
-from utils import complex_to_rgb
+from utils import complex_to_rgb_array, basis_labels, top_k_amplitudes, aggregate_amplitudes
+from transpile_cache import cached_transpile
+from backend_pool import get_backend
+from statevector_engine import execute_circuit, execute_circuits, select_engine, simulate_statevector, NUMPY_ENGINE_MAX_QUBITS
+from circuit_analyzer import analyze_circuit
+from figure_cache import get_figure_cache
+from ibm_job_manager import get_job_manager, fake_backends_requested
+from shot_parallel import run_shot_parallel
 import os
 import time
 
@@ -22,11 +28,8 @@ class QuantumSimulator:
     PLATĂ EXCLUSIV PRIN CEC FIZIC LA NATIONWIDE BANK UK, LONDRA
     """
     def __init__(self):
-        # Initialize the simulator for optimized performance
-        # Use the most advanced simulator available in Qiskit
-        self.simulator = AerSimulator()
-        self.statevector_sim = Aer.get_backend('statevector_simulator')
-        self.qasm_sim = Aer.get_backend('qasm_simulator')
+        # Simulator backends are not built here: they come from the shared,
+        # lazily initialised backend pool (see the properties below)
         
         # State tracking
         self.ibm_available = False
@@ -35,7 +38,20 @@ class QuantumSimulator:
         
         # Check if IBM token exists but don't try to connect yet
         self.ibm_available = 'IBM_QUANTUM_TOKEN' in os.environ
-    
+
+    # Simulator backends are created lazily and shared process-wide (see backend_pool)
+    @property
+    def simulator(self):
+        return get_backend('aer_simulator')
+
+    @property
+    def statevector_sim(self):
+        return get_backend('statevector_simulator')
+
+    @property
+    def qasm_sim(self):
+        return get_backend('qasm_simulator')
+
     def connect_to_ibm_quantum(self):
         """
         Connect to IBM Quantum hardware
@@ -48,7 +64,7 @@ class QuantumSimulator:
         # Verificăm dacă avem token IBM Quantum disponibil
         ibm_token = os.environ.get('IBM_QUANTUM_TOKEN')
         
-        if not ibm_token:
+        if not ibm_token and not fake_backends_requested():
             result_text = """
             <div class='warning-text'>
             <h3>Token IBM Quantum lipsă</h3>
@@ -64,37 +80,19 @@ class QuantumSimulator:
             result_text = """
             <div class='info-text'>
             <h3>Se inițializează conexiunea cu IBM Quantum...</h3>
-            <p>Se verifică token-ul și se obține lista de procesoare quantum disponibile.</p>
-            <p>Acest proces poate dura câteva momente. Vă rugăm să așteptați.</p>
+            <p>Se verifică token-ul și se obține în fundal lista de procesoare quantum disponibile.</p>
+            <p>Acest proces poate dura câteva momente. Reluați comanda pentru a vedea rezultatul conexiunii.</p>
             </div>
             """
             
-            # Importăm modulele necesare
+            # Lista de backend-uri vine din managerul asincron de job-uri, care o păstrează
+            # în cache cu TTL; fără cache, enumerarea pornește în fundal și UI-ul nu așteaptă
             try:
-                from qiskit_ibm_provider import IBMProvider
-            except ImportError as e:
-                return f"""
-                <div class='error-text'>
-                <h3>Eroare la importarea modulelor IBM Quantum</h3>
-                <p>Nu s-a putut importa modulul qiskit_ibm_provider:</p>
-                <div style="margin:10px 0;padding:10px;background-color:#fff0f0;border-radius:5px;font-family:monospace;font-size:12px;">
-                    {str(e)}
-                </div>
-                <p>Verificați dacă toate pachetele necesare sunt instalate corect.</p>
-                </div>
-                """, None
-            
-            # Încercăm să ne conectăm cu un timeout
-            try:
-                # Inițializăm provider-ul cu token-ul și un timeout
-                provider = IBMProvider(token=ibm_token)
-                
-                # Adăugăm un delay mic pentru a evita probleme de rate limiting
-                time.sleep(1)
-                
-                # Obținem lista de backend-uri disponibile
-                backends = provider.backends()
-                backend_names = [backend.name for backend in backends]
+                listing = get_job_manager().cached_backends()
+                if listing is None:
+                    return result_text, None
+                backends = listing["backends"]
+                backend_names = [backend["name"] for backend in backends]
                 
             except Exception as conn_error:
                 return f"""
@@ -115,12 +113,10 @@ class QuantumSimulator:
             for backend in backends:
                 try:
                     # Verificăm doar backend-urile disponibile (de simulator sau hardware)
-                    if not backend.operational:
+                    if not backend["operational"]:
                         continue
                         
-                    # Obținem configurația backend-ului
-                    config = backend.configuration()
-                    num_qubits = config.n_qubits
+                    num_qubits = backend["num_qubits"]
                     
                     if num_qubits > max_qubits:
                         max_qubits = num_qubits
@@ -149,11 +145,10 @@ class QuantumSimulator:
                 qc.measure([0, 1], [0, 1])
                 
                 # Rulăm pe simulator pentru a verifica circuitul
-                from qiskit_aer import AerSimulator
-                simulator = AerSimulator()
-                compiled_circuit = transpile(qc, simulator)
+                simulator = self.simulator
+                compiled_circuit = cached_transpile(qc, simulator)
                 result = simulator.run(compiled_circuit, shots=1024).result()
-                counts = result.get_counts(compiled_circuit)
+                counts = result.get_counts()
                 
                 # Creăm reprezentarea vizuală a circuitului
                 import plotly.graph_objects as go
@@ -187,7 +182,7 @@ class QuantumSimulator:
             
             <ul>
                 <li><strong>Total backend-uri disponibile:</strong> {len(backends)}</li>
-                <li><strong>Backend cu cele mai multe qubits:</strong> {max_qubit_backend.name}</li>
+                <li><strong>Backend cu cele mai multe qubits:</strong> {max_qubit_backend['name']}</li>
                 <li><strong>Număr qubits disponibile:</strong> {max_qubits}</li>
             </ul>
             
@@ -226,8 +221,119 @@ class QuantumSimulator:
             """
             return result_text, None
     
-    def run_basic_circuit(self):
-        """Run a basic quantum circuit with common gates using optimized simulator."""
+    def submit_ibm_job(self, circuit, shots=1024, backend_name=None, user_id="default", callback=None):
+        """
+        Queue a circuit for IBM Quantum without blocking the caller.
+
+        Submission, status polling (with exponential backoff) and result
+        retrieval run on the shared asyncio job manager; without a token the
+        offline fake backends are used.
+
+        Returns:
+            str: Local job ID; the finished job is returned by poll_ibm_results(user_id)
+        """
+        return get_job_manager().submit(circuit, shots=shots, backend_name=backend_name,
+                                        user_id=user_id, callback=callback)
+    
+    def poll_ibm_results(self, user_id="default"):
+        """
+        Collect the IBM jobs of a session that finished since the last poll.
+
+        Returns:
+            list: (result_text, fig) pairs, one per finished job
+        """
+        results = []
+        for job in get_job_manager().drain_results(user_id):
+            if job["status"] != "DONE":
+                results.append((f"""
+                <div class='error-text'>
+                <h3>Job IBM Quantum eșuat ({job['job_id']})</h3>
+                <p>Backend: {job['backend']} &mdash; stare: {job['status']}</p>
+                <p>{job['error']}</p>
+                </div>
+                """, None))
+                continue
+            
+            counts = job["counts"]
+            fig = go.Figure(data=[go.Bar(x=list(counts.keys()), y=list(counts.values()))])
+            fig.update_layout(
+                title=f"Rezultate {job['circuit_name']} ({job['backend']})",
+                xaxis_title="Stare",
+                yaxis_title="Frecvență",
+                template="plotly_dark"
+            )
+            results.append((f"""
+            <div class='success-text'>
+            <h3>Job IBM Quantum finalizat ({job['job_id']})</h3>
+            <ul>
+                <li><strong>Circuit:</strong> {job['circuit_name']}</li>
+                <li><strong>Backend:</strong> {job['backend']}</li>
+                <li><strong>Shots:</strong> {job['shots']}</li>
+                <li><strong>Interogări de stare:</strong> {job['polls']}</li>
+            </ul>
+            </div>
+            """, fig))
+        return results
+    
+    def run_circuit(self, circuit, shots=1024, family=None):
+        """
+        Run an arbitrary circuit on the best-suited simulation method.
+
+        Small circuits use the in-process NumPy engine; larger ones are analysed
+        and routed to Aer's stabilizer (Clifford-only), statevector or
+        matrix_product_state (low entanglement) method.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to execute
+            shots (int): Number of shots
+            family (str, optional): Circuit family ("teleportation", "ghz", "qft")
+                whose tuned Aer execution profile is applied
+
+        Returns:
+            dict: counts, engine, method (the simulation method actually used),
+            execution_time_ms and the circuit analysis, whose suggested Aer method
+            is reported as recommended_method
+        """
+        execution = execute_circuit(circuit, shots=shots, family=family)
+        analysis = analyze_circuit(circuit)
+        analysis["recommended_method"] = analysis.pop("method")
+        execution["analysis"] = analysis
+        return execution
+
+    def run_many(self, circuits, shots=1024, family=None):
+        """
+        Run several circuits with a single simulator call.
+
+        All circuits are transpiled through the shared cache and submitted
+        together as one Aer job per simulation method (normally just one),
+        with parallel experiments enabled.
+
+        Args:
+            circuits (list): Circuits to execute
+            shots (int): Number of shots per circuit
+            family (str, optional): Circuit family whose Aer execution profile is applied
+
+        Returns:
+            list: One result dict (counts, engine, method, job_index,
+                execution_time_ms) per circuit, in input order
+        """
+        return execute_circuits(list(circuits), shots=shots, family=family)
+
+    def run_basic_circuit(self, shots=1024, workers=None, seed=None):
+        """
+        Run a basic quantum circuit with common gates using optimized simulator.
+
+        Large shot counts (e.g. 10^7) are split into per-process batches whose
+        seeds derive from `seed`; the same seed and worker count always give
+        the same histogram.
+
+        Args:
+            shots (int): Total number of shots
+            workers (int, optional): Shot batches / worker processes (default: a single
+                batch when the run stays in-process, i.e. fewer than MIN_PARALLEL_SHOTS
+                shots or a NumPy histogram, and the CPU count for parallel runs)
+            seed (int, optional): Master seed for reproducible results
+        """
         # Create a quantum circuit with 3 qubits
         circuit = QuantumCircuit(3, 3)
         
@@ -238,24 +344,18 @@ class QuantumSimulator:
         circuit.measure([0, 1, 2], [0, 1, 2])  # Measure all qubits
         
         try:
-            # Use the QASM simulator for best performance with this circuit type
-            backend = self.qasm_sim
-            
-            # Execute the circuit
-            compiled_circuit = transpile(circuit, backend)
-            job = backend.run(compiled_circuit, shots=1024)
-            result = job.result()
-            
-            # Get the histogram data
-            counts = result.get_counts(circuit)
+            # Small circuits run on the in-process NumPy engine, larger ones on Aer;
+            # big shot counts are split across worker processes
+            execution = run_shot_parallel(circuit, shots, workers=workers, master_seed=seed)
+            counts = execution["counts"]
         except Exception as e:
             print(f"Error executing quantum circuit: {str(e)}")
             # Try a different simulator approach if the first one fails
-            backend = AerSimulator()
-            compiled_circuit = transpile(circuit, backend)
-            job = backend.run(compiled_circuit, shots=1024)
+            backend = self.simulator
+            compiled_circuit = cached_transpile(circuit, backend)
+            job = backend.run(compiled_circuit, shots=shots)
             result = job.result()
-            counts = result.get_counts(circuit)
+            counts = result.get_counts()
         
         # Create a formatted output for the console
         if self.ibm_available:
@@ -271,7 +371,7 @@ class QuantumSimulator:
                 <li>X gate on qubit 2</li>
                 <li>Measurement of all qubits</li>
             </ul>
-            <p>Results from 1024 shots:</p>
+            <p>Results from {shots} shots:</p>
             </div>
             """
         else:
@@ -287,7 +387,7 @@ class QuantumSimulator:
                 <li>X gate on qubit 2</li>
                 <li>Measurement of all qubits</li>
             </ul>
-            <p>Results from 1024 shots:</p>
+            <p>Results from {shots} shots:</p>
             </div>
             """
         
@@ -315,13 +415,61 @@ class QuantumSimulator:
         
         return output_text, fig
     
-    def visualize_bloch_sphere(self, theta=0, phi=0):
-        """Create a visualization of a qubit on the Bloch sphere."""
-        # Convert spherical coordinates to cartesian
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
+    def run_circuit_memory(self, circuit, shots=1_000_000, chunk_shots=None, seed=None):
+        """
+        Run a circuit and return per-shot outcomes as a packed NumPy array.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to execute
+            shots (int): Total number of shots
+            chunk_shots (int, optional): Shots per chunk (default DEFAULT_CHUNK_SHOTS)
+            seed (int, optional): Seed for reproducible sampling
+
+        Returns:
+            dict: outcomes (uint8/uint64 per shot, bit i = classical bit i),
+                num_clbits, shots, engine and execution_time_ms
+        """
+        from shot_memory import run_memory, DEFAULT_CHUNK_SHOTS
+        
+        return run_memory(circuit, shots, chunk_shots=chunk_shots or DEFAULT_CHUNK_SHOTS, seed=seed)
+    
+    def visualize_bloch_sphere(self, theta=0, phi=0, bloch_vector=None):
+        """
+        Create a visualization of a qubit on the Bloch sphere.
+
+        The sphere surface, basis axes and layout come from a cached JSON
+        template; only the state vector trace is computed per call.
+
+        Args:
+            theta (float): Polar angle of a pure state
+            phi (float): Azimuthal angle of a pure state
+            bloch_vector (sequence, optional): Cartesian (x, y, z) Bloch vector, e.g. from
+                state tomography; mixed states are drawn inside the sphere
+        """
+        if bloch_vector is not None:
+            x, y, z = (float(component) for component in bloch_vector)
+        else:
+            # Convert spherical coordinates to cartesian
+            x = np.sin(theta) * np.cos(phi)
+            y = np.sin(theta) * np.sin(phi)
+            z = np.cos(theta)
         
+        # The state vector sits between the sphere surface and the basis vectors
+        state_vector = go.Scatter3d(
+            x=[0, x], y=[0, y], z=[0, z],
+            mode='lines+markers',
+            line=dict(color='red', width=6),
+            marker=dict(size=[0, 8], color='red')
+        )
+        
+        return get_figure_cache().figure(
+            "bloch_sphere", self._build_bloch_sphere_template,
+            insert_traces=[(1, state_vector)]
+        )
+    
+    @staticmethod
+    def _build_bloch_sphere_template():
+        """Build the static part of the Bloch sphere figure (surface, axes, layout)."""
         # Create the Bloch sphere
         u, v = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
         x_sphere = np.cos(u) * np.sin(v)
@@ -339,14 +487,6 @@ class QuantumSimulator:
             showscale=False
         ))
         
-        # Add the state vector
-        fig.add_trace(go.Scatter3d(
-            x=[0, x], y=[0, y], z=[0, z],
-            mode='lines+markers',
-            line=dict(color='red', width=6),
-            marker=dict(size=[0, 8], color='red')
-        ))
-        
         # Add basis vectors
         fig.add_trace(go.Scatter3d(
             x=[0, 1, 0, 0, 0, 0], y=[0, 0, 0, 1, 0, 0], z=[0, 0, 0, 0, 0, 1],
@@ -372,25 +512,43 @@ class QuantumSimulator:
         
         return fig
     
-    def visualize_statevector(self, qc):
-        """Visualize the statevector of a quantum circuit."""
-        # Execute the circuit and get the statevector
-        # In newer Qiskit, we use Aer's statevector_simulator
-        statevector_sim = Aer.get_backend('statevector_simulator')
-        transpiled_qc = transpile(qc, statevector_sim)
-        job = statevector_sim.run(transpiled_qc)
-        statevector = job.result().get_statevector()
+    def visualize_statevector(self, qc, top_k=None, max_bars=256):
+        """
+        Visualize the statevector of a quantum circuit.
+
+        Args:
+            qc (QuantumCircuit): Circuit without measurements
+            top_k (int, optional): Only show the k largest-magnitude amplitudes
+            max_bars (int): Registers with more basis states than this are
+                aggregated by their leading qubits
+        """
+        # Small circuits are evaluated in-process; larger ones use Aer's
+        # statevector_simulator (shared via the backend pool)
+        if qc.num_qubits <= NUMPY_ENGINE_MAX_QUBITS and select_engine(qc) == "numpy":
+            statevector = simulate_statevector(qc)
+        else:
+            statevector_sim = self.statevector_sim
+            transpiled_qc = cached_transpile(qc, statevector_sim)
+            job = statevector_sim.run(transpiled_qc)
+            statevector = np.asarray(job.result().get_statevector())
         
-        # Create labels for each state
         n_qubits = qc.num_qubits
-        labels = [bin(i)[2:].zfill(n_qubits) for i in range(2**n_qubits)]
-        
-        # Extract magnitudes and phases
-        magnitudes = np.abs(statevector)
-        phases = np.angle(statevector)
+        if top_k is not None:
+            # Top-k mode: argpartition selects the largest amplitudes without a full sort
+            indices = top_k_amplitudes(statevector, top_k)
+            labels = basis_labels(indices, n_qubits)
+            amplitudes = statevector[indices]
+            magnitudes = np.abs(amplitudes)
+        elif statevector.size > max_bars:
+            # Aggregation mode for large registers
+            labels, magnitudes, amplitudes = aggregate_amplitudes(statevector, max_bars)
+        else:
+            labels = basis_labels(np.arange(statevector.size), n_qubits)
+            amplitudes = statevector
+            magnitudes = np.abs(statevector)
         
-        # Generate colors based on phase
-        colors = [complex_to_rgb(statevector[i]) for i in range(len(statevector))]
+        # Generate colors based on phase (vectorized)
+        colors = complex_to_rgb_array(amplitudes)
         
         # Create the figure
         fig = go.Figure()
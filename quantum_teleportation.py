@@ -1,10 +1,16 @@
 import numpy as np
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer, AerSimulator
 import plotly.graph_objects as go
 import time
 import os
 from utils import complex_to_rgb
+from transpile_cache import cached_transpile
+from backend_pool import get_backend
+from statevector_engine import simulate_statevector
+from circuit_library import build_parameterized_teleportation_circuit, TELEPORT_THETA, TELEPORT_PHI
+from figure_cache import get_figure_cache
+from ibm_job_manager import get_job_manager, fake_backends_requested
+from shot_parallel import run_shot_parallel
 
 # COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
 # TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
@@ -23,11 +29,8 @@ class QuantumTeleportation:
     PLATĂ EXCLUSIV PRIN CEC FIZIC LA NATIONWIDE BANK UK, LONDRA
     """
     def __init__(self):
-        # Initialize the simulator for optimized performance
-        # Use the most advanced simulator available in Qiskit
-        self.simulator = AerSimulator()
-        self.statevector_sim = Aer.get_backend('statevector_simulator')
-        self.qasm_sim = Aer.get_backend('qasm_simulator')
+        # Simulator backends are not built here: they come from the shared,
+        # lazily initialised backend pool (see the properties below)
         
         # State tracking
         self.ibm_available = False
@@ -36,7 +39,20 @@ class QuantumTeleportation:
         
         # Check if IBM token exists but don't try to connect yet
         self.ibm_available = 'IBM_QUANTUM_TOKEN' in os.environ
-    
+
+    # Simulator backends are created lazily and shared process-wide (see backend_pool)
+    @property
+    def simulator(self):
+        return get_backend('aer_simulator')
+
+    @property
+    def statevector_sim(self):
+        return get_backend('statevector_simulator')
+
+    @property
+    def qasm_sim(self):
+        return get_backend('qasm_simulator')
+
     def connect_to_ibm_quantum(self):
         """
         Connect to IBM Quantum hardware
@@ -49,7 +65,7 @@ class QuantumTeleportation:
         # Verificăm dacă avem token IBM Quantum disponibil
         ibm_token = os.environ.get('IBM_QUANTUM_TOKEN')
         
-        if not ibm_token:
+        if not ibm_token and not fake_backends_requested():
             result_text = """
             <div class='warning-text'>
             <h3>Token IBM Quantum lipsă</h3>
@@ -65,37 +81,19 @@ class QuantumTeleportation:
             result_text = """
             <div class='info-text'>
             <h3>Se inițializează conexiunea cu IBM Quantum pentru teleportare...</h3>
-            <p>Se verifică token-ul și se obține lista de procesoare quantum disponibile.</p>
-            <p>Acest proces poate dura câteva momente. Vă rugăm să așteptați.</p>
+            <p>Se verifică token-ul și se obține în fundal lista de procesoare quantum disponibile.</p>
+            <p>Acest proces poate dura câteva momente. Reluați comanda pentru a vedea rezultatul conexiunii.</p>
             </div>
             """
             
-            # Importăm modulele necesare
-            try:
-                from qiskit_ibm_provider import IBMProvider
-            except ImportError as e:
-                return f"""
-                <div class='error-text'>
-                <h3>Eroare la importarea modulelor IBM Quantum</h3>
-                <p>Nu s-a putut importa modulul qiskit_ibm_provider:</p>
-                <div style="margin:10px 0;padding:10px;background-color:#fff0f0;border-radius:5px;font-family:monospace;font-size:12px;">
-                    {str(e)}
-                </div>
-                <p>Verificați dacă toate pachetele necesare sunt instalate corect.</p>
-                </div>
-                """, None
-            
-            # Încercăm să ne conectăm cu un timeout
+            # Lista de backend-uri vine din managerul asincron de job-uri, care o păstrează
+            # în cache cu TTL; fără cache, enumerarea pornește în fundal și UI-ul nu așteaptă
             try:
-                # Inițializăm provider-ul cu token-ul
-                provider = IBMProvider(token=ibm_token)
-                
-                # Adăugăm un delay mic pentru a evita probleme de rate limiting
-                time.sleep(1)
-                
-                # Obținem lista de backend-uri disponibile
-                backends = provider.backends()
-                backend_names = [backend.name for backend in backends]
+                listing = get_job_manager().cached_backends()
+                if listing is None:
+                    return result_text, None
+                backends = listing["backends"]
+                backend_names = [backend["name"] for backend in backends]
                 
             except Exception as conn_error:
                 return f"""
@@ -117,12 +115,10 @@ class QuantumTeleportation:
             for backend in backends:
                 try:
                     # Verificăm doar backend-urile disponibile (de simulator sau hardware)
-                    if not backend.operational:
+                    if not backend["operational"]:
                         continue
                         
-                    # Obținem configurația backend-ului
-                    config = backend.configuration()
-                    num_qubits = config.n_qubits
+                    num_qubits = backend["num_qubits"]
                     
                     # Pentru teleportare avem nevoie de minim 3 qubits
                     if num_qubits >= 3 and num_qubits > max_qubits:
@@ -155,7 +151,7 @@ class QuantumTeleportation:
             
             <ul>
                 <li><strong>Total backend-uri disponibile:</strong> {len(backends)}</li>
-                <li><strong>Backend selectat pentru teleportare:</strong> {max_qubit_backend.name}</li>
+                <li><strong>Backend selectat pentru teleportare:</strong> {max_qubit_backend['name']}</li>
                 <li><strong>Număr qubits disponibile:</strong> {max_qubits}</li>
             </ul>
             
@@ -247,10 +243,17 @@ class QuantumTeleportation:
             return result_text, None
 
         
-    def run_teleportation(self):
+    def run_teleportation(self, shots=1024, workers=None, seed=None):
         """
         Simulate quantum teleportation and create a visualization.
         Uses high-performance local simulation.
+
+        Args:
+            shots (int): Total number of shots (large counts are split across processes)
+            workers (int, optional): Shot batches / worker processes (default: a single
+                batch when the run stays in-process, i.e. fewer than MIN_PARALLEL_SHOTS
+                shots or a NumPy histogram, and the CPU count for parallel runs)
+            seed (int, optional): Master seed; the same seed and worker count give the same counts
         """
         # Step 1: Create a quantum circuit with 3 qubits and 2 classical bits
         qc = QuantumCircuit(3, 2)
@@ -297,8 +300,10 @@ class QuantumTeleportation:
         """
         
         # Corrections based on measurements
-        qc.x(2).c_if(1, 1)  # Apply X gate if qubit 1 is measured as 1
-        qc.z(2).c_if(0, 1)  # Apply Z gate if qubit 0 is measured as 1
+        with qc.if_test((qc.clbits[1], 1)):
+            qc.x(2)  # Apply X gate if qubit 1 is measured as 1
+        with qc.if_test((qc.clbits[0], 1)):
+            qc.z(2)  # Apply Z gate if qubit 0 is measured as 1
         
         # Add info about simulator vs real hardware
         if self.ibm_available:
@@ -318,19 +323,281 @@ class QuantumTeleportation:
             </div>
             """
             
-        # Execute the circuit using the Aer qasm_simulator for best performance
-        backend = self.qasm_sim
-        compiled_circuit = transpile(qc, backend)
-        job = backend.run(compiled_circuit, shots=1024)
-        counts = job.result().get_counts()
+        # Execute the circuit on the in-process NumPy engine when it fits, otherwise on
+        # AerSimulator (supports the classically controlled corrections); large shot
+        # counts run as seeded per-process batches merged into one histogram
+        counts = run_shot_parallel(qc, shots, workers=workers, master_seed=seed, family="teleportation")["counts"]
         
         # Create visualization
         visualization = self.visualize_teleportation()
         
         return output_text, visualization
-    
+
+    def run_teleportation_sweep(self, states, shots=1024):
+        """
+        Teleport a batch of input states in a single simulator job.
+
+        The parameterized teleportation circuit is built and transpiled once
+        (through the shared cache); every (theta, phi) pair is bound into the
+        same Aer job instead of one transpile + job per state.
+
+        Args:
+            states: Iterable of (theta, phi) pairs or an array of shape (N, 2)
+            shots (int): Shots per input state
+
+        Returns:
+            dict: NumPy arrays with the input angles, the per-state outcome
+                probabilities (shape (N, 8), index = c2c1c0 bitstring) and the
+                measured vs. expected probability of qubit 2 being |1⟩
+        """
+        states = np.asarray(states, dtype=float).reshape(-1, 2)
+        thetas = states[:, 0]
+        phis = states[:, 1]
+
+        if len(states) == 0:
+            return {
+                "thetas": thetas,
+                "phis": phis,
+                "probabilities": np.zeros((0, 8)),
+                "qubit2_p1": np.zeros(0),
+                "expected_p1": np.zeros(0),
+                "shots": shots
+            }
+
+        backend = self.simulator
+        compiled_circuit = cached_transpile(build_parameterized_teleportation_circuit(), backend)
+
+        # Parameters are matched by name so circuits restored from the disk cache bind too
+        parameters = {param.name: param for param in compiled_circuit.parameters}
+        parameter_binds = [{
+            parameters[TELEPORT_THETA.name]: thetas.tolist(),
+            parameters[TELEPORT_PHI.name]: phis.tolist()
+        }]
+
+        job = backend.run(compiled_circuit, shots=shots, parameter_binds=parameter_binds)
+        all_counts = job.result().get_counts()
+        if isinstance(all_counts, dict):
+            all_counts = [all_counts]
+
+        # Convert the per-experiment count dicts into one dense array
+        counts_array = np.zeros((len(states), 8))
+        for row, counts in enumerate(all_counts):
+            for bitstring, count in counts.items():
+                counts_array[row, int(bitstring, 2)] = count
+        probabilities = counts_array / shots
+
+        # Qubit 2 is the most significant classical bit (c2)
+        qubit2_p1 = probabilities[:, 4:].sum(axis=1)
+        expected_p1 = np.sin(thetas / 2) ** 2
+
+        return {
+            "thetas": thetas,
+            "phis": phis,
+            "probabilities": probabilities,
+            "qubit2_p1": qubit2_p1,
+            "expected_p1": expected_p1,
+            "shots": shots
+        }
+
+    def run_teleportation_exact(self, theta=np.pi / 2, phi=np.pi / 4):
+        """
+        Compute the teleportation outcome exactly, with no shot sampling.
+
+        Uses the deferred-measurement form of the protocol (quantum-controlled
+        X/Z corrections) and evolves it once as a statevector. The default input
+        is the H·T state teleported by run_teleportation.
+
+        Args:
+            theta (float): Polar angle of the input state
+            phi (float): Azimuthal angle of the input state
+
+        Returns:
+            dict: Exact outcome probabilities (bitstring c2c1c0 -> probability),
+                the reduced density matrix of qubit 2 and its fidelity with the input state
+        """
+        circuit = build_parameterized_teleportation_circuit(measure=False)
+        circuit = circuit.assign_parameters({TELEPORT_THETA: theta, TELEPORT_PHI: phi})
+        statevector = simulate_statevector(circuit)
+
+        # Exact probabilities of every computational-basis outcome
+        probabilities = np.abs(statevector) ** 2
+        outcome_probabilities = {
+            format(index, "03b"): float(probability)
+            for index, probability in enumerate(probabilities)
+            if probability > 1e-12
+        }
+
+        # Reduced density matrix of qubit 2 (tensor axes are ordered q2, q1, q0)
+        state = statevector.reshape(2, 4)
+        qubit2_density_matrix = state @ state.conj().T
+
+        input_state = np.array([np.cos(theta / 2), np.exp(1j * phi) * np.sin(theta / 2)])
+        fidelity = float(np.real(input_state.conj() @ qubit2_density_matrix @ input_state))
+
+        return {
+            "theta": theta,
+            "phi": phi,
+            "outcome_probabilities": outcome_probabilities,
+            "qubit2_density_matrix": qubit2_density_matrix,
+            "fidelity": fidelity,
+            "shots": 0
+        }
+
+    def run_state_tomography(self, theta=np.pi / 2, phi=np.pi / 4, shots=4096, noise_model=None, seed=None,
+                             states=None):
+        """
+        Reconstruct the density matrix of the teleported qubit (qubit 2).
+
+        The X, Y and Z measurement variants of the teleportation circuit run as
+        one batched job; the state is rebuilt by vectorized linear inversion
+        followed by a maximum-likelihood refinement.
+
+        Args:
+            theta (float): Polar angle of the input state
+            phi (float): Azimuthal angle of the input state
+            shots (int): Shots per measurement basis
+            noise_model (NoiseModel, optional): Aer noise model for the simulation
+            seed (int, optional): Seed for reproducible sampling
+            states: Optional batch of (theta, phi) pairs; if given, the batch
+                result arrays are returned instead of a single state
+
+        Returns:
+            dict: The reconstructed density matrix, its fidelity with the input
+                state, the purity and the Bloch vector, which can be passed as
+                visualize_bloch_sphere(bloch_vector=...)
+        """
+        from state_tomography import run_teleportation_tomography
+
+        if states is not None:
+            return run_teleportation_tomography(states, shots=shots, noise_model=noise_model, seed=seed)
+
+        tomography = run_teleportation_tomography([(theta, phi)], shots=shots, noise_model=noise_model, seed=seed)
+        return {
+            "theta": theta,
+            "phi": phi,
+            "density_matrix": tomography["density_matrices"][0],
+            "linear_bloch_vector": tomography["linear_bloch_vectors"][0].tolist(),
+            "bloch_vector": tomography["bloch_vectors"][0].tolist(),
+            "fidelity": float(tomography["fidelities"][0]),
+            "purity": float(tomography["purities"][0]),
+            "measured_p1": dict(zip(("X", "Y", "Z"), tomography["probabilities_one"][0].tolist())),
+            "engine": tomography["engine"],
+            "shots": shots,
+            "execution_time_ms": tomography["execution_time_ms"]
+        }
+
+    def preview_on_device(self, backend_name="fake_sherbrooke", optimization_level=2, dynamic=None):
+        """
+        Preview the teleportation circuit on an IBM device before spending hardware time.
+
+        The circuit is transpiled against the matching local fake backend with a
+        cached staged pass manager, so repeated previews only rerun the passes.
+
+        Args:
+            backend_name (str): Fake backend name, or a list of names to compare
+            optimization_level (int): Transpiler optimization level (0-3)
+            dynamic (bool, optional): Force the feed-forward (True) or the
+                deferred-measurement (False) form; by default the feed-forward
+                form is used when the device supports if_else
+
+        Returns:
+            dict: Depth, two-qubit gate count, physical qubits and estimated
+                success probability; a list of these when several backends are given
+        """
+        from device_preview import preview_on_device, preview_on_devices
+
+        if isinstance(backend_name, (list, tuple)):
+            return preview_on_devices(backend_name, optimization_levels=(optimization_level,))
+        return preview_on_device(backend_name, optimization_level=optimization_level, dynamic=dynamic)
+
+    def submit_teleportation_job(self, theta=np.pi / 2, phi=np.pi / 4, shots=1024, backend_name=None,
+                                 user_id="default", callback=None):
+        """
+        Queue the teleportation circuit for IBM Quantum without blocking the caller.
+
+        The deferred-measurement form of the protocol is used, so the job needs
+        no mid-circuit measurements or classical feed-forward.
+
+        Returns:
+            str: Local job ID; the finished job is delivered through the job manager
+        """
+        circuit = build_parameterized_teleportation_circuit()
+        circuit = circuit.assign_parameters({TELEPORT_THETA: theta, TELEPORT_PHI: phi})
+        circuit.name = "teleportation"
+        return get_job_manager().submit(circuit, shots=shots, backend_name=backend_name,
+                                        user_id=user_id, callback=callback)
+
+    def run_teleportation_memory(self, theta=np.pi / 2, phi=np.pi / 4, shots=1_000_000,
+                                 chunk_shots=None, seed=None):
+        """
+        Teleport a state with per-shot memory instead of a counts dictionary.
+
+        Outcomes are kept as packed uint8 values (bit i = classical bit i) and
+        produced in chunks, so 10^6+ shots never materialize one string per shot.
+
+        Args:
+            theta (float): Polar angle of the input state
+            phi (float): Azimuthal angle of the input state
+            shots (int): Total number of shots
+            chunk_shots (int, optional): Shots per chunk (default DEFAULT_CHUNK_SHOTS)
+            seed (int, optional): Seed for reproducible sampling
+
+        Returns:
+            dict: The packed outcomes and the per-shot teleportation statistics
+                (Bell outcome frequencies, conditional P(1) of qubit 2, correlations)
+        """
+        from shot_memory import run_memory, teleportation_statistics, DEFAULT_CHUNK_SHOTS
+
+        circuit = build_parameterized_teleportation_circuit()
+        circuit = circuit.assign_parameters({TELEPORT_THETA: theta, TELEPORT_PHI: phi})
+        execution = run_memory(circuit, shots, chunk_shots=chunk_shots or DEFAULT_CHUNK_SHOTS, seed=seed)
+
+        statistics = teleportation_statistics(execution["outcomes"])
+        statistics["expected_p1"] = float(np.sin(theta / 2) ** 2)
+        return {
+            "outcomes": execution["outcomes"],
+            "statistics": statistics,
+            "engine": execution["engine"],
+            "execution_time_ms": execution["execution_time_ms"]
+        }
+
+    def run_noise_sweep(self, depolarizing_rates=(0.0,), amplitude_damping_rates=(0.0,),
+                        readout_error_rates=(0.0,), max_workers=None):
+        """
+        Measure teleportation fidelity over a grid of local Aer noise models.
+
+        The grid is distributed across worker processes by NoiseSweepEngine;
+        the teleportation circuit is transpiled once through the shared cache.
+        Fidelities are exact: they come from the density matrix of the
+        teleported qubit, not from sampled shots.
+
+        Args:
+            depolarizing_rates: Depolarizing probabilities per gate
+            amplitude_damping_rates: Amplitude-damping gammas per gate
+            readout_error_rates: Bit-flip probabilities of the Bell-measurement readout
+                that drives the X/Z corrections
+            max_workers (int, optional): Worker processes (default: CPU count)
+
+        Returns:
+            pandas.DataFrame: One row per grid point with the average fidelity
+        """
+        from noise_sweep import NoiseSweepEngine
+
+        engine = NoiseSweepEngine(max_workers=max_workers)
+        return engine.run(depolarizing_rates, amplitude_damping_rates, readout_error_rates)
+
     def visualize_teleportation(self):
-        """Create a visualization of the quantum teleportation process."""
+        """
+        Create a visualization of the quantum teleportation process.
+
+        The protocol diagram never changes, so it is built once, stored as a
+        JSON template in the shared figure cache, and only rehydrated per call.
+        """
+        return get_figure_cache().figure("teleportation_protocol", self._build_teleportation_figure)
+
+    @staticmethod
+    def _build_teleportation_figure():
+        """Build the static teleportation protocol diagram."""
         # Create figure
         fig = go.Figure()
         
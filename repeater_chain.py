@@ -0,0 +1,191 @@
+import math
+import time
+import datetime
+import hashlib
+
+from qiskit import QuantumCircuit
+
+from backend_pool import get_backend
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Coordonatele regiunilor de datacentere (aceleași ca în harta QuantumConnector)
+REGION_COORDINATES = {
+    "NORTH_AMERICA": (40.7128, -74.0060),
+    "EUROPE": (51.5074, -0.1278),
+    "ASIA": (35.6762, 139.6503),
+    "AUSTRALIA": (-33.8688, 151.2093),
+    "SOUTH_AMERICA": (-23.5505, -46.6333),
+    "AFRICA": (-33.9249, 18.4241),
+    "QUANTUM_CLOUD": (0.0, 0.0),
+    "SECRET_LOCATIONS": (64.9631, -19.0208)
+}
+
+EARTH_RADIUS_KM = 6371.0
+
+# Distanța maximă acoperită de o legătură elementară între două stații repetoare
+DEFAULT_SEGMENT_KM = 1000.0
+
+# Fidelitatea (Werner) a unei perechi Bell elementare distribuite pe un segment
+DEFAULT_LINK_FIDELITY = 0.99
+
+
+def region_distance_km(source, destination):
+    """Distanța ortodromică (haversine) între două regiuni"""
+    lat1, lon1 = map(math.radians, REGION_COORDINATES[source])
+    lat2, lon2 = map(math.radians, REGION_COORDINATES[destination])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def werner_swap_fidelity(link_fidelity, hops):
+    """Fidelitatea analitică după swapping pe `hops` legături Werner identice"""
+    return 0.25 + 0.75 * ((4 * link_fidelity - 1) / 3) ** hops
+
+
+class RepeaterChainSimulator:
+    """
+    Simulator pentru lanțuri de repetoare quantum între regiuni de datacentere.
+
+    Fiecare segment distribuie o pereche Bell (cu zgomot depolarizant pe qubit-ul
+    transmis), iar stațiile intermediare fac entanglement swapping secvențial, de la
+    sursă spre destinație, cu corecții controlate quantum. Corecțiile acționează doar
+    pe qubiții vecini, deci entanglement-ul pe orice tăietură rămâne constant și
+    memoria crește liniar cu lungimea lanțului. La final perechea capăt-la-capăt este
+    măsurată în baza Bell: P(Φ+) este fidelitatea end-to-end.
+    """
+
+    def __init__(self, segment_km=DEFAULT_SEGMENT_KM, link_fidelity=DEFAULT_LINK_FIDELITY):
+        self.segment_km = segment_km
+        self.link_fidelity = link_fidelity
+
+    def plan_path(self, source, destination, via=None, hops=None):
+        """
+        Stabilește nodurile lanțului de la sursă la destinație
+
+        Args:
+            source (str): Regiunea sursă
+            destination (str): Regiunea destinație
+            via (list, optional): Regiuni intermediare explicite
+            hops (int, optional): Numărul de segmente; implicit distanța / segment_km
+
+        Returns:
+            list: Nodurile lanțului (sursă, stații repetoare, destinație)
+        """
+        if via:
+            return [source] + list(via) + [destination]
+
+        if hops is None:
+            distance = region_distance_km(source, destination) if source in REGION_COORDINATES and destination in REGION_COORDINATES else 0
+            hops = max(1, math.ceil(distance / self.segment_km))
+
+        repeaters = [f"{source}>{destination}#R{index}" for index in range(1, hops)]
+        return [source] + repeaters + [destination]
+
+    def _hop_operations(self, hop, link_error):
+        """Operațiile unui segment: perechea Bell (qubiți 2h, 2h+1) și swapping-ul cu segmentul anterior"""
+        operations = [("h", [2 * hop]), ("cx", [2 * hop, 2 * hop + 1])]
+        if link_error is not None:
+            operations.append(("error", [2 * hop + 1]))
+        if hop > 0:
+            # Măsurătoare Bell amânată pe (2h-1, 2h) cu corecții pe 2h+1
+            left, right, target = 2 * hop - 1, 2 * hop, 2 * hop + 1
+            operations += [("cx", [left, right]), ("h", [left]), ("cx", [right, target]), ("cz", [left, target])]
+        return operations
+
+    def build_circuit(self, hops, link_fidelity=None):
+        """
+        Construiește circuitul de entanglement swapping pentru `hops` segmente
+
+        Returns:
+            tuple: (QuantumCircuit, adâncimea fiecărui segment)
+        """
+        link_fidelity = self.link_fidelity if link_fidelity is None else link_fidelity
+        depolarizing_probability = min(1.0, max(0.0, 4 * (1 - link_fidelity) / 3))
+
+        link_error = None
+        if depolarizing_probability > 0:
+            from qiskit_aer.noise import depolarizing_error
+            link_error = depolarizing_error(depolarizing_probability, 1)
+
+        num_qubits = 2 * hops
+        qc = QuantumCircuit(num_qubits, 2)
+        depth_per_hop = []
+
+        for hop in range(hops):
+            operations = self._hop_operations(hop, link_error)
+
+            # Adâncimea segmentului, calculată pe qubiții locali
+            local = QuantumCircuit(4)
+            offset = max(0, 2 * hop - 1)
+            for name, qubits in operations:
+                local_qubits = [qubit - offset for qubit in qubits]
+                if name == "error":
+                    local.id(local_qubits[0])
+                else:
+                    getattr(local, name)(*local_qubits)
+            depth_per_hop.append(local.depth())
+
+            for name, qubits in operations:
+                if name == "error":
+                    qc.append(link_error, qubits)
+                else:
+                    getattr(qc, name)(*qubits)
+
+        # Măsurătoarea Bell a perechii capăt-la-capăt (0, ultimul qubit)
+        qc.cx(0, num_qubits - 1)
+        qc.h(0)
+        qc.measure([0, num_qubits - 1], [0, 1])
+        return qc, depth_per_hop
+
+    def simulate(self, source, destination, via=None, hops=None, link_fidelity=None, shots=2000, method="stabilizer"):
+        """
+        Simulează lanțul de repetoare dintre două regiuni
+
+        Args:
+            source (str): Regiunea sursă
+            destination (str): Regiunea destinație
+            via (list, optional): Regiuni intermediare explicite
+            hops (int, optional): Numărul de segmente (suprascrie distanța)
+            link_fidelity (float, optional): Fidelitatea perechilor elementare
+            shots (int): Numărul de shot-uri pentru estimarea fidelității
+            method (str): "stabilizer" (Clifford + zgomot Pauli, implicit) sau "matrix_product_state"
+
+        Returns:
+            dict: Fidelitatea end-to-end, adâncimea circuitului per segment și detaliile lanțului
+        """
+        link_fidelity = self.link_fidelity if link_fidelity is None else link_fidelity
+        path = self.plan_path(source, destination, via=via, hops=hops)
+        num_hops = len(path) - 1
+
+        start_time = time.perf_counter()
+        qc, depth_per_hop = self.build_circuit(num_hops, link_fidelity)
+        backend = get_backend('aer_simulator', method)
+        counts = backend.run(qc, shots=shots).result().get_counts()
+        execution_time = time.perf_counter() - start_time
+
+        fidelity = counts.get("00", 0) / shots
+
+        return {
+            "success": True,
+            "simulation_id": hashlib.sha256(f"REPEATER-{source}-{destination}-{datetime.datetime.now()}".encode()).hexdigest()[:16],
+            "source": source,
+            "destination": destination,
+            "path": path,
+            "hops": num_hops,
+            "intermediate_nodes": num_hops - 1,
+            "distance_km": round(region_distance_km(source, destination), 1) if source in REGION_COORDINATES and destination in REGION_COORDINATES else None,
+            "link_fidelity": link_fidelity,
+            "end_to_end_fidelity": round(fidelity, 6),
+            "analytic_fidelity": round(werner_swap_fidelity(link_fidelity, num_hops), 6),
+            "num_qubits": qc.num_qubits,
+            "circuit_depth": qc.depth(),
+            "depth_per_hop": depth_per_hop,
+            "method": method,
+            "shots": shots,
+            "execution_time_ms": round(execution_time * 1000, 3),
+            "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+        }
@@ -5,8 +5,12 @@ import random
 import time
 import json
 import base64
+import hmac
 import threading
 
+from quantum_rng import get_qrng
+from qkd_bb84 import get_qkd_key_source
+
 class SecureBackupSystem:
     """
     Sistem de backup securizat distribuit în multiple locații
@@ -169,7 +173,7 @@ class SecureBackupSystem:
             data_types = self.backup_data_types
             
         # Generăm un ID unic pentru backup
-        backup_id = hashlib.sha256(f"BACKUP-{datetime.datetime.now()}-{random.random()}".encode()).hexdigest()[:16]
+        backup_id = hashlib.sha256(f"BACKUP-{datetime.datetime.now()}-{get_qrng().token_hex(8)}".encode()).hexdigest()[:16]
         
         # Selectăm locațiile de stocare (toate pentru nivel maxim)
         if security_level in ["MAXIMUM", "QUANTUM", "DNA"]:
@@ -189,6 +193,21 @@ class SecureBackupSystem:
         # Simulăm mărimea datelor
         data_size_mb = random.randint(10, 1000)
         
+        # Backup-urile cu verificare quantum primesc o cheie distribuită prin BB84
+        quantum_verified = self.quantum_verification and security_level in ["QUANTUM", "DNA"]
+        qkd_protection = None
+        if quantum_verified:
+            try:
+                key_source = get_qkd_key_source()
+                qkd_key = key_source.get_key(32)
+                qkd_protection = {
+                    "key_id": key_source.key_id(qkd_key),
+                    "qber": key_source.last_session["qber"],
+                    "seal": hmac.new(qkd_key, backup_id.encode(), hashlib.sha256).hexdigest()
+                }
+            except Exception as e:
+                print(f"[BACKUP SYSTEM] Eroare la distribuția cheii QKD: {str(e)}")
+        
         # Creăm înregistrarea pentru backup
         backup_record = {
             "backup_id": backup_id,
@@ -202,7 +221,8 @@ class SecureBackupSystem:
             "compressed": self.compression_enabled,
             "encrypted": self.encryption_enabled,
             "distributed": self.distributed_storage,
-            "quantum_verified": self.quantum_verification and security_level in ["QUANTUM", "DNA"],
+            "quantum_verified": quantum_verified,
+            "qkd_protection": qkd_protection,
             "blockchain_verified": security_level in ["MAXIMUM", "QUANTUM", "DNA"],
             "automatic": automatic,
             "creator": "AUTO-BACKUP" if automatic else "MANUAL",
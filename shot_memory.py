@@ -0,0 +1,254 @@
+import time
+import numpy as np
+
+from transpile_cache import cached_transpile
+from backend_pool import get_backend
+from circuit_analyzer import analyze_circuit
+from statevector_engine import select_engine, exact_outcome_distribution
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Numărul implicit de shot-uri per bucată; memoria Aer (listă de șiruri) pentru
+# o bucată rămâne de ordinul zecilor de MB
+DEFAULT_CHUNK_SHOTS = 1 << 18
+
+# Biții clasici ai protocolului de teleportare (c0, c1 = măsurătoarea Bell, c2 = qubit-ul 2)
+TELEPORT_BELL_CLBITS = (0, 1)
+TELEPORT_TARGET_CLBIT = 2
+
+_ASCII_ZERO = ord("0")
+_ASCII_SPACE = ord(" ")
+
+
+def packed_dtype(num_clbits):
+    """Tipul NumPy al unui rezultat împachetat: uint8 până la 8 biți, uint64 până la 64"""
+    if num_clbits <= 8:
+        return np.uint8
+    if num_clbits <= 64:
+        return np.uint64
+    return None
+
+
+def pack_bits(bits):
+    """
+    Împachetează o matrice de biți (shot-uri × biți clasici, coloana i = clbit i)
+
+    Returns:
+        np.ndarray: Un întreg per shot (uint8/uint64, bitul i = clbit i) sau, peste
+            64 de biți clasici, o matrice uint8 (shot-uri × octeți, bitorder little)
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    shots, num_clbits = bits.shape
+    packed = np.packbits(bits, axis=1, bitorder="little")
+
+    dtype = packed_dtype(num_clbits)
+    if dtype is None:
+        return packed
+    if dtype is np.uint8:
+        return packed[:, 0] if num_clbits else np.zeros(shots, dtype=np.uint8)
+
+    padded = np.zeros((shots, 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    return padded.view("<u8").ravel().astype(np.uint64, copy=False)
+
+
+def bit_matrix(outcomes, num_clbits):
+    """
+    Despachetează rezultatele într-o matrice de biți (shot-uri × biți clasici, uint8)
+
+    Args:
+        outcomes (np.ndarray): Rezultate împachetate (vezi pack_bits)
+        num_clbits (int): Numărul de biți clasici
+    """
+    outcomes = np.asarray(outcomes)
+    if outcomes.ndim == 2:
+        return np.unpackbits(outcomes, axis=1, count=num_clbits, bitorder="little")
+
+    as_bytes = outcomes.astype("<u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, count=num_clbits, bitorder="little")
+
+
+def memory_to_array(memory, num_clbits):
+    """
+    Convertește memoria Aer (câte un șir de biți per shot) în rezultate împachetate,
+    fără a parcurge șirurile în Python
+
+    Args:
+        memory (list): Rezultatul result.get_memory() (ex. ["010", "111", ...])
+        num_clbits (int): Numărul de biți clasici ai circuitului
+    """
+    if not memory:
+        return pack_bits(np.zeros((0, num_clbits), dtype=np.uint8))
+
+    width = len(memory[0])
+    raw = np.frombuffer("".join(memory).encode("ascii"), dtype=np.uint8).reshape(len(memory), width)
+    # Registrele sunt separate prin spațiu; coloanele rămase sunt clbit n-1 ... 0
+    columns = raw[0] != _ASCII_SPACE
+    bits = raw[:, columns][:, ::-1] - _ASCII_ZERO
+    return pack_bits(bits)
+
+
+def _chunk_sizes(shots, chunk_shots):
+    full, remainder = divmod(shots, chunk_shots)
+    return [chunk_shots] * full + ([remainder] if remainder else [])
+
+
+def stream_memory(circuit, shots, chunk_shots=DEFAULT_CHUNK_SHOTS, seed=None, engine=None, backend=None):
+    """
+    Execută circuitul și produce incremental rezultatele per shot, pe bucăți
+
+    Pe motorul NumPy distribuția exactă este calculată o singură dată și fiecare
+    bucată este eșantionată direct ca întregi (fără șiruri de biți). Pe calea Aer
+    circuitul este transpilat o singură dată și fiecare bucată rulează cu memory=True.
+
+    Args:
+        circuit (QuantumCircuit): Circuitul de executat
+        shots (int): Numărul total de shot-uri
+        chunk_shots (int): Shot-uri per bucată
+        seed (int, optional): Seed-ul pentru rezultate reproductibile
+        engine (str, optional): Forțează "numpy" sau "aer"
+        backend: Backend-ul Aer (implicit ales după analiza circuitului)
+
+    Yields:
+        np.ndarray: Rezultatele împachetate ale fiecărei bucăți
+    """
+    chunk_shots = max(1, int(chunk_shots))
+    num_clbits = circuit.num_clbits
+    engine = engine or select_engine(circuit)
+
+    if engine == "numpy" and num_clbits <= 64:
+        values, probabilities = exact_outcome_distribution(circuit)
+        rng = np.random.default_rng(seed)
+        dtype = packed_dtype(num_clbits)
+        values = values.astype(dtype)
+        for size in _chunk_sizes(shots, chunk_shots):
+            yield values[rng.choice(len(values), size=size, p=probabilities)]
+        return
+
+    if backend is None:
+        method = analyze_circuit(circuit)["method"]
+        backend = get_backend('aer_simulator', None if method == "statevector" else method)
+    compiled_circuit = cached_transpile(circuit, backend)
+
+    for index, size in enumerate(_chunk_sizes(shots, chunk_shots)):
+        run_options = {"shots": size, "memory": True}
+        if seed is not None:
+            run_options["seed_simulator"] = seed + index
+        memory = backend.run(compiled_circuit, **run_options).result().get_memory()
+        yield memory_to_array(memory, num_clbits)
+
+
+def run_memory(circuit, shots, chunk_shots=DEFAULT_CHUNK_SHOTS, seed=None, engine=None, backend=None):
+    """
+    Execută circuitul și returnează toate rezultatele per shot într-un singur array
+
+    Returns:
+        dict: outcomes (array împachetat), num_clbits, shots, engine și execution_time_ms
+    """
+    start_time = time.perf_counter()
+    engine = engine or select_engine(circuit)
+    chunks = list(stream_memory(circuit, shots, chunk_shots=chunk_shots, seed=seed, engine=engine, backend=backend))
+    outcomes = np.concatenate(chunks) if chunks else pack_bits(np.zeros((0, circuit.num_clbits), dtype=np.uint8))
+
+    return {
+        "outcomes": outcomes,
+        "num_clbits": circuit.num_clbits,
+        "shots": shots,
+        "engine": engine,
+        "execution_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+
+def marginalize(outcomes, clbits, num_clbits=64):
+    """
+    Păstrează doar biții clasici ceruți, reîmpachetați în ordine (bitul j = clbits[j])
+
+    Args:
+        outcomes (np.ndarray): Rezultate împachetate
+        clbits (list): Indicii biților clasici păstrați
+        num_clbits (int): Numărul de biți clasici (necesar doar pentru forma matriceală)
+    """
+    outcomes = np.asarray(outcomes)
+    if outcomes.ndim == 2:
+        return pack_bits(bit_matrix(outcomes, num_clbits)[:, list(clbits)])
+
+    values = outcomes.astype(np.uint64, copy=False)
+    result = np.zeros(values.shape, dtype=np.uint64)
+    for position, clbit in enumerate(clbits):
+        result |= ((values >> np.uint64(clbit)) & np.uint64(1)) << np.uint64(position)
+    return result.astype(packed_dtype(len(clbits)) or np.uint64, copy=False)
+
+
+def outcome_counts(outcomes, num_clbits):
+    """Histograma rezultatelor în formatul Qiskit (bitstring -> număr), fără șiruri per shot"""
+    outcomes = np.asarray(outcomes)
+    if outcomes.ndim == 2:
+        rows, counts = np.unique(bit_matrix(outcomes, num_clbits)[:, ::-1], axis=0, return_counts=True)
+        return {"".join(map(str, row)): int(count) for row, count in zip(rows, counts)}
+
+    if num_clbits <= 24:
+        counts = np.bincount(outcomes.astype(np.int64), minlength=1 << num_clbits)
+        values = np.flatnonzero(counts)
+        counts = counts[values]
+    else:
+        values, counts = np.unique(outcomes, return_counts=True)
+    return {format(int(value), f"0{num_clbits}b"): int(count) for value, count in zip(values, counts)}
+
+
+def bit_correlations(outcomes, num_clbits):
+    """
+    Corelațiile ⟨Z_i Z_j⟩ și valorile medii ⟨Z_i⟩ pe toți biții clasici
+
+    Returns:
+        dict: expectation (vector ⟨Z_i⟩), correlation (matrice ⟨Z_i Z_j⟩) și
+            covariance (⟨Z_i Z_j⟩ - ⟨Z_i⟩⟨Z_j⟩)
+    """
+    spins = 1.0 - 2.0 * bit_matrix(outcomes, num_clbits).astype(np.float64)
+    shots = max(1, spins.shape[0])
+    expectation = spins.sum(axis=0) / shots
+    correlation = spins.T @ spins / shots
+    return {
+        "expectation": expectation,
+        "correlation": correlation,
+        "covariance": correlation - np.outer(expectation, expectation)
+    }
+
+
+def teleportation_statistics(outcomes, bell_clbits=TELEPORT_BELL_CLBITS, target_clbit=TELEPORT_TARGET_CLBIT):
+    """
+    Statistici per shot pentru protocolul de teleportare
+
+    Pentru fiecare rezultat al măsurătorii Bell (m0 m1) calculează frecvența și
+    P(qubit 2 = 1 | m0 m1). Cu corecții corecte, probabilitatea condiționată este
+    aceeași pentru toate cele patru rezultate (qubit-ul 2 nu depinde de măsurătoarea Bell).
+
+    Returns:
+        dict: Frecvențele rezultatelor Bell, P(1) condiționat, P(1) total și
+            corelațiile ⟨Z_bell Z_target⟩
+    """
+    outcomes = np.asarray(outcomes)
+    bell = marginalize(outcomes, bell_clbits).astype(np.int64)
+    target = marginalize(outcomes, [target_clbit]).astype(np.int64)
+
+    shots = max(1, len(target))
+    bell_counts = np.bincount(bell, minlength=4)
+    target_ones = np.bincount(bell, weights=target, minlength=4)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        conditional_p1 = np.where(bell_counts > 0, target_ones / bell_counts, np.nan)
+
+    target_spin = 1.0 - 2.0 * target
+    correlations = {}
+    for position, clbit in enumerate(bell_clbits):
+        bell_spin = 1.0 - 2.0 * ((bell >> position) & 1)
+        correlations[f"c{clbit}_c{target_clbit}"] = float(np.dot(bell_spin, target_spin) / shots)
+
+    return {
+        "shots": int(len(target)),
+        "bell_outcome_frequencies": {format(value, "02b"): float(bell_counts[value] / shots) for value in range(4)},
+        "conditional_p1": {format(value, "02b"): float(conditional_p1[value]) for value in range(4)},
+        "target_p1": float(target.sum() / shots),
+        "zz_correlations": correlations
+    }
@@ -0,0 +1,211 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from transpile_cache import cached_transpile
+from backend_pool import get_backend, get_backend_pool
+from circuit_analyzer import analyze_circuit
+from statevector_engine import select_engine, exact_outcome_distribution, format_clbits
+from simulator_profile import get_profile
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Sub acest număr de shot-uri batch-urile rulează în procesul curent:
+# pornirea proceselor ar costa mai mult decât simularea, iar fără `workers` explicit
+# se folosește un singur batch. Pentru un număr de workeri dat rezultatul nu se schimbă,
+# deoarece împărțirea în batch-uri și seed-urile depind doar de acesta.
+MIN_PARALLEL_SHOTS = 200_000
+
+# Metoda de pornire a proceselor; "spawn" evită blocajele OpenMP din Aer după fork
+SHOT_PARALLEL_START_METHOD = os.environ.get("QUANTUM_SHOTS_START_METHOD", "spawn")
+
+
+def derive_seeds(master_seed, count):
+    """
+    Derivă seed-uri independente pentru fiecare batch dintr-un seed principal
+    (SeedSequence.spawn garantează fluxuri aleatoare necorelate)
+    """
+    children = np.random.SeedSequence(master_seed).spawn(count)
+    return [int(child.generate_state(1, dtype=np.uint32)[0]) for child in children]
+
+
+def split_shots(shots, batches):
+    """Împarte shot-urile în `batches` bucăți aproape egale (primele primesc restul)"""
+    base, remainder = divmod(int(shots), batches)
+    return [base + (1 if index < remainder else 0) for index in range(batches)]
+
+
+# Setat în procesele de lucru: profilurile nu pot cere mai mult de un thread Aer acolo
+_in_worker = False
+
+
+def _init_worker():
+    """Un singur thread Aer per proces, ca procesele să nu concureze pentru nuclee"""
+    global _in_worker
+    _in_worker = True
+    get_backend_pool().configure(max_parallel_threads=1)
+
+
+def _numpy_counts(values, probabilities, shots, seed):
+    """Histograma unui batch: o singură extragere multinomială din distribuția exactă"""
+    counts = np.random.default_rng(seed).multinomial(shots, probabilities)
+    return {int(value): int(count) for value, count in zip(values, counts) if count > 0}
+
+
+def _run_batch(circuit, shots, seed, engine, memory, family=None):
+    """
+    Rulează un batch de shot-uri cu seed-ul propriu
+
+    Returns:
+        dict (valoare clasică -> număr) sau, cu memory=True, array-ul rezultatelor per shot
+    """
+    if shots == 0:
+        if memory:
+            from shot_memory import pack_bits
+            return pack_bits(np.zeros((0, circuit.num_clbits), dtype=np.uint8))
+        return {}
+
+    if memory:
+        from shot_memory import run_memory
+        return run_memory(circuit, shots, chunk_shots=shots, seed=seed, engine=engine)["outcomes"]
+
+    if engine == "numpy":
+        values, probabilities = exact_outcome_distribution(circuit)
+        return _numpy_counts(values, probabilities, shots, seed)
+
+    method = analyze_circuit(circuit)["method"]
+    backend = get_backend('aer_simulator', None if method == "statevector" else method)
+    compiled_circuit = cached_transpile(circuit, backend)
+    profile = get_profile(family)
+    run_options = profile.run_options() if profile else {}
+    if _in_worker and run_options:
+        run_options["max_parallel_threads"] = 1
+    counts = backend.run(compiled_circuit, shots=shots, seed_simulator=seed, **run_options).result().get_counts()
+    # Cheile Qiskit sunt convertite la valori întregi pentru o îmbinare uniformă
+    return {int(bitstring.replace(" ", ""), 2): count for bitstring, count in counts.items()}
+
+
+def run_shot_parallel(circuit, shots, workers=None, master_seed=None, memory=False, engine=None, family=None):
+    """
+    Execută un număr arbitrar de shot-uri (ex. 10^7) împărțit în batch-uri per proces
+
+    Fiecare batch primește un seed derivat din seed-ul principal, iar rezultatele sunt
+    îmbinate într-o singură histogramă (sau un singur array per shot, în ordinea
+    batch-urilor). Pentru același seed principal și același număr de workeri
+    rezultatul este identic, indiferent dacă batch-urile rulează în paralel sau local.
+
+    Args:
+        circuit (QuantumCircuit): Circuitul de executat
+        shots (int): Numărul total de shot-uri
+        workers (int, optional): Numărul de batch-uri / procese (implicit numărul de nuclee pentru
+            rulările paralele și un singur batch când execuția rămâne în procesul curent)
+        master_seed (int, optional): Seed-ul principal (None = nedeterminist)
+        memory (bool): Returnează rezultatele per shot (array împachetat) în loc de histogramă
+        engine (str, optional): Forțează "numpy" sau "aer"
+        family (str, optional): Familia de circuite al cărei profil de execuție Aer se aplică
+
+    Returns:
+        dict: counts (sau outcomes), workers, batch_shots, seeds, engine și execution_time_ms
+    """
+    start_time = time.perf_counter()
+    engine = engine or select_engine(circuit)
+    if not workers:
+        # Fără procese (puține shot-uri sau histogramă NumPy) mai multe batch-uri doar repetă munca
+        runs_inline = shots < MIN_PARALLEL_SHOTS or (engine == "numpy" and not memory)
+        workers = 1 if runs_inline else (os.cpu_count() or 1)
+    workers = max(1, int(workers))
+
+    if master_seed is None:
+        master_seed = int(np.random.SeedSequence().entropy % (1 << 63))
+    seeds = derive_seeds(master_seed, workers)
+    batch_shots = split_shots(shots, workers)
+
+    # Histogramele NumPy sunt o extragere multinomială per batch (cost independent de
+    # numărul de shot-uri), deci nu merită procese separate
+    inline = workers == 1 or shots < MIN_PARALLEL_SHOTS or (engine == "numpy" and not memory)
+
+    if inline and engine == "numpy" and not memory:
+        # Distribuția exactă este calculată o singură dată; fiecare seed face propria extragere
+        values, probabilities = exact_outcome_distribution(circuit)
+        batches = [_numpy_counts(values, probabilities, size, seed) for size, seed in zip(batch_shots, seeds)]
+        parallel = False
+    elif inline:
+        batches = [_run_batch(circuit, size, seed, engine, memory, family) for size, seed in zip(batch_shots, seeds)]
+        parallel = False
+    else:
+        context = multiprocessing.get_context(SHOT_PARALLEL_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+            futures = [executor.submit(_run_batch, circuit, size, seed, engine, memory, family)
+                       for size, seed in zip(batch_shots, seeds)]
+            batches = [future.result() for future in futures]
+        parallel = True
+
+    result = {
+        "shots": int(shots),
+        "workers": workers,
+        "parallel": parallel,
+        "batch_shots": batch_shots,
+        "master_seed": master_seed,
+        "seeds": seeds,
+        "engine": engine
+    }
+
+    if memory:
+        result["outcomes"] = np.concatenate(batches)
+        result["num_clbits"] = circuit.num_clbits
+    else:
+        merged = {}
+        for batch in batches:
+            for value, count in batch.items():
+                merged[value] = merged.get(value, 0) + count
+        result["counts"] = {format_clbits(circuit, value): count for value, count in sorted(merged.items())}
+
+    result["execution_time_ms"] = round((time.perf_counter() - start_time) * 1000, 3)
+    return result
+
+
+def benchmark_shot_scaling(circuit=None, shots=10_000_000, worker_counts=None, engine="aer", master_seed=1234):
+    """
+    Măsoară scalarea execuției shot-parallel între 1 și N procese
+
+    Args:
+        circuit (QuantumCircuit, optional): Circuitul testat (implicit teleportarea cu corecții clasice)
+        shots (int): Numărul total de shot-uri
+        worker_counts (iterable, optional): Numerele de procese (implicit 1, 2, 4, ... până la nuclee)
+        engine (str): Motorul de simulare ("aer" implicit, singurul care beneficiază de procese)
+        master_seed (int): Seed-ul principal
+
+    Returns:
+        list: Timpul, accelerarea și eficiența pentru fiecare număr de procese
+    """
+    if circuit is None:
+        from circuit_library import build_feedforward_teleportation_circuit
+        circuit = build_feedforward_teleportation_circuit()
+
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({min(2 ** power, cores) for power in range(cores.bit_length() + 1)})
+
+    results = []
+    for workers in worker_counts:
+        execution = run_shot_parallel(circuit, shots, workers=workers, master_seed=master_seed, engine=engine)
+        results.append({"workers": workers, "seconds": execution["execution_time_ms"] / 1000})
+
+    baseline = results[0]["seconds"] * results[0]["workers"]
+    for row in results:
+        row["speedup"] = round(baseline / row["seconds"], 2)
+        row["efficiency"] = round(row["speedup"] / row["workers"], 2)
+    return results
+
+
+if __name__ == "__main__":
+    print(f"Nuclee disponibile: {os.cpu_count()}")
+    for row in benchmark_shot_scaling():
+        print(f"{row['workers']:>3} procese: {row['seconds']:8.2f} s  "
+              f"accelerare {row['speedup']:5.2f}x  eficiență {row['efficiency']:.2f}")
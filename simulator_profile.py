@@ -0,0 +1,317 @@
+import os
+import json
+import time
+import datetime
+import itertools
+import threading
+
+from circuit_library import build_feedforward_teleportation_circuit, build_ghz_circuit, build_qft_circuit
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Fișierul în care sunt persistate profilurile alese per familie de circuite
+DEFAULT_PROFILE_PATH = "simulator_profiles.json"
+
+# Familiile standard de circuite: (constructor, shot-uri); metoda Aer este cea aleasă de
+# analyze_circuit, ca la execuție (ex. GHZ rulează pe stabilizer)
+CIRCUIT_FAMILIES = {
+    "teleportation": (build_feedforward_teleportation_circuit, 8192),
+    "ghz": (lambda: build_ghz_circuit(20), 1024),
+    "qft": (lambda: build_qft_circuit(16), 1024)
+}
+
+# Opțiunile pentru care 0 înseamnă "automat": nu sunt trimise la backend.run(), deci
+# limitele backend-ului (QUANTUM_AER_MAX_THREADS / configure) rămân în vigoare
+AUTO_OPTIONS = ("max_parallel_threads", "max_parallel_shots")
+
+
+class SimulatorProfile:
+    """
+    Set numit de opțiuni de execuție Aer (paralelism, fuziune de porți, precizie).
+
+    Opțiunile sunt trimise ca opțiuni de rulare la backend.run(), deci același
+    backend partajat poate executa fiecare familie de circuite cu profilul ei.
+    Valoarea 0 pentru paralelism înseamnă "automat" (decizia Aer, în limitele pool-ului).
+    """
+
+    OPTION_NAMES = (
+        "max_parallel_threads", "max_parallel_experiments", "max_parallel_shots",
+        "fusion_enable", "fusion_threshold", "precision"
+    )
+
+    def __init__(self, name="default", max_parallel_threads=0, max_parallel_experiments=1,
+                 max_parallel_shots=0, fusion_enable=True, fusion_threshold=14, precision="double"):
+        if precision not in ("double", "single"):
+            raise ValueError(f"Precizie necunoscută: {precision}")
+        self.name = name
+        self.max_parallel_threads = int(max_parallel_threads)
+        self.max_parallel_experiments = int(max_parallel_experiments)
+        self.max_parallel_shots = int(max_parallel_shots)
+        self.fusion_enable = bool(fusion_enable)
+        self.fusion_threshold = int(fusion_threshold)
+        self.precision = precision
+
+    def options(self):
+        """Toate opțiunile profilului, inclusiv cele lăsate pe automat"""
+        return {option: getattr(self, option) for option in self.OPTION_NAMES}
+
+    def run_options(self):
+        """
+        Opțiunile de rulare Aer corespunzătoare profilului
+
+        Opțiunile "automat" sunt omise, iar numărul de thread-uri nu depășește
+        limita pool-ului de backend-uri (opțiunile de rulare o suprascriu altfel).
+        """
+        from backend_pool import get_backend_pool
+
+        run_options = {option: value for option, value in self.options().items()
+                       if not (option in AUTO_OPTIONS and value == 0)}
+        thread_limit = get_backend_pool().max_parallel_threads
+        if thread_limit and run_options.get("max_parallel_threads", 0) > thread_limit:
+            run_options["max_parallel_threads"] = thread_limit
+        return run_options
+
+    def to_dict(self):
+        return {"name": self.name, **self.options()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: value for key, value in data.items() if key == "name" or key in cls.OPTION_NAMES})
+
+    def updated(self, name=None, **options):
+        """Returnează o copie a profilului cu opțiunile modificate"""
+        unknown = set(options) - set(self.OPTION_NAMES)
+        if unknown:
+            raise ValueError(f"Opțiuni de profil necunoscute: {', '.join(sorted(unknown))}")
+        data = self.to_dict()
+        data.update(options)
+        data["name"] = name or self.name
+        return SimulatorProfile.from_dict(data)
+
+    def __eq__(self, other):
+        return isinstance(other, SimulatorProfile) and self.options() == other.options()
+
+    def __repr__(self):
+        options = ", ".join(f"{key}={value!r}" for key, value in self.options().items())
+        return f"SimulatorProfile({self.name!r}, {options})"
+
+
+DEFAULT_PROFILE = SimulatorProfile()
+
+
+def candidate_profiles(cores=None):
+    """
+    Combinațiile de opțiuni testate de autotune pe această mașină
+
+    Returns:
+        list: Profilurile candidate (duplicatele pe o mașină cu un nucleu sunt eliminate)
+    """
+    cores = cores or os.cpu_count() or 1
+    thread_options = sorted({1, cores})
+    shot_options = sorted({0, 1} if cores > 1 else {0})
+    fusion_options = [(True, 14), (True, 20), (False, 14)]
+    precision_options = ["double", "single"]
+
+    profiles = []
+    for threads, parallel_shots, (fusion_enable, fusion_threshold), precision in itertools.product(
+            thread_options, shot_options, fusion_options, precision_options):
+        name = f"t{threads}-s{parallel_shots}-f{fusion_threshold if fusion_enable else 'off'}-{precision}"
+        profiles.append(SimulatorProfile(
+            name=name,
+            max_parallel_threads=threads,
+            max_parallel_shots=parallel_shots,
+            fusion_enable=fusion_enable,
+            fusion_threshold=fusion_threshold,
+            precision=precision
+        ))
+    return profiles
+
+
+class ProfileStore:
+    """
+    Profilurile de execuție alese per familie de circuite, persistate în JSON.
+
+    Prioritatea la citire: suprascrierea operatorului, apoi profilul găsit de
+    autotune, apoi DEFAULT_PROFILE.
+    """
+
+    def __init__(self, path=DEFAULT_PROFILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._families = self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f).get("families", {})
+        except Exception as e:
+            print(f"[SIMULATOR PROFILE] Eroare la citirea {self.path}: {str(e)}")
+            return {}
+
+    def _save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"families": self._families}, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def get_profile(self, family):
+        """Profilul activ pentru o familie de circuite"""
+        entry = self._families.get(family)
+        if not entry:
+            return DEFAULT_PROFILE
+        data = entry.get("override") or entry.get("tuned")
+        return SimulatorProfile.from_dict(data) if data else DEFAULT_PROFILE
+
+    def record_autotune(self, family, profile, timings):
+        with self._lock:
+            entry = self._families.setdefault(family, {})
+            entry["tuned"] = profile.to_dict()
+            entry["timings_ms"] = timings
+            entry["tuned_at"] = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+            entry["host_cores"] = os.cpu_count()
+            self._save()
+
+    def set_override(self, family, profile=None, **options):
+        """
+        Fixează manual profilul unei familii (are prioritate față de autotune)
+
+        Args:
+            family (str): Familia de circuite
+            profile (SimulatorProfile, optional): Profilul complet; altfel profilul
+                activ este modificat cu `options`
+        """
+        if profile is None:
+            profile = self.get_profile(family).updated(name=f"{family}-override", **options)
+        with self._lock:
+            self._families.setdefault(family, {})["override"] = profile.to_dict()
+            self._save()
+        return profile
+
+    def clear_override(self, family):
+        """Elimină suprascrierea; familia revine la profilul găsit de autotune"""
+        with self._lock:
+            entry = self._families.get(family)
+            if entry and entry.pop("override", None) is not None:
+                self._save()
+                return True
+        return False
+
+    def describe(self):
+        """Rezumatul profilurilor active, pentru inspecție de către operatori"""
+        families = sorted(set(CIRCUIT_FAMILIES) | set(self._families))
+        summary = {}
+        for family in families:
+            entry = self._families.get(family, {})
+            source = "override" if entry.get("override") else ("autotune" if entry.get("tuned") else "default")
+            summary[family] = {
+                "source": source,
+                "profile": self.get_profile(family).to_dict(),
+                "tuned_at": entry.get("tuned_at"),
+                "timings_ms": entry.get("timings_ms")
+            }
+        return summary
+
+
+def _time_profile(backend, circuit, shots, profile, repeats):
+    """Cel mai bun timp (ms) din `repeats` rulări cu profilul dat"""
+    best = float("inf")
+    for repeat in range(repeats):
+        start_time = time.perf_counter()
+        backend.run(circuit, shots=shots, seed_simulator=repeat, **profile.run_options()).result()
+        best = min(best, (time.perf_counter() - start_time) * 1000)
+    return best
+
+
+def autotune(families=None, repeats=3, candidates=None, store=None):
+    """
+    Caută profilul cel mai rapid pe această mașină pentru fiecare familie de circuite
+
+    Fiecare circuit standard este transpilat o singură dată (prin cache), apoi rulat
+    cu fiecare profil candidat; cel mai bun timp din `repeats` rulări decide.
+
+    Args:
+        families (list, optional): Familiile testate (implicit toate din CIRCUIT_FAMILIES)
+        repeats (int): Rulări per profil
+        candidates (list, optional): Profilurile testate (implicit candidate_profiles())
+        store (ProfileStore, optional): Unde se persistă rezultatul (implicit get_profile_store())
+
+    Returns:
+        dict: Per familie, profilul câștigător, timpul lui și accelerarea față de DEFAULT_PROFILE
+    """
+    from backend_pool import get_backend
+    from circuit_analyzer import analyze_circuit
+    from transpile_cache import cached_transpile
+
+    store = store or get_profile_store()
+    candidates = candidates or candidate_profiles()
+    families = families or list(CIRCUIT_FAMILIES)
+
+    results = {}
+    for family in families:
+        if family not in CIRCUIT_FAMILIES:
+            raise ValueError(f"Familie de circuite necunoscută: {family}")
+        builder, shots = CIRCUIT_FAMILIES[family]
+        circuit = builder()
+        # Același backend ca la execuție: metoda aleasă de analizor pentru circuit
+        method = analyze_circuit(circuit)["method"]
+        backend = get_backend('aer_simulator', None if method == "statevector" else method)
+        circuit = cached_transpile(circuit, backend)
+
+        # Încălzire: primul job plătește inițializarea simulatorului
+        backend.run(circuit, shots=shots).result()
+
+        default_ms = _time_profile(backend, circuit, shots, DEFAULT_PROFILE, repeats)
+        timings = {profile.name: round(_time_profile(backend, circuit, shots, profile, repeats), 3)
+                   for profile in candidates}
+        best = min(candidates, key=lambda profile: timings[profile.name])
+
+        store.record_autotune(family, best, timings)
+        results[family] = {
+            "profile": best.to_dict(),
+            "best_ms": timings[best.name],
+            "default_ms": round(default_ms, 3),
+            "speedup": round(default_ms / timings[best.name], 2) if timings[best.name] else None,
+            "candidates": len(candidates)
+        }
+    return results
+
+
+_profile_store = None
+_profile_store_lock = threading.Lock()
+
+
+def get_profile_store():
+    """
+    Returnează registrul de profiluri comun procesului.
+    Calea fișierului se citește din QUANTUM_SIMULATOR_PROFILES.
+    """
+    global _profile_store
+    if _profile_store is None:
+        with _profile_store_lock:
+            if _profile_store is None:
+                _profile_store = ProfileStore(os.environ.get('QUANTUM_SIMULATOR_PROFILES', DEFAULT_PROFILE_PATH))
+    return _profile_store
+
+
+def get_profile(family):
+    """Profilul activ pentru o familie de circuite (None = fără familie, opțiuni implicite Aer)"""
+    if family is None:
+        return None
+    return get_profile_store().get_profile(family)
+
+
+if __name__ == "__main__":
+    print(f"Nuclee disponibile: {os.cpu_count()}")
+    for family, result in autotune().items():
+        print(f"{family:>14}: {result['profile']['name']:<28} {result['best_ms']:9.2f} ms "
+              f"(implicit {result['default_ms']:.2f} ms, accelerare {result['speedup']}x)")
@@ -0,0 +1,284 @@
+import time
+
+import numpy as np
+
+from backend_pool import get_backend
+from transpile_cache import cached_transpile
+from circuit_library import build_teleportation_tomography_circuits, TELEPORT_THETA, TELEPORT_PHI
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+TOMOGRAPHY_BASES = ("X", "Y", "Z")
+
+# Matricile Pauli în ordinea bazelor de măsurare
+_IDENTITY = np.eye(2, dtype=complex)
+_PAULI = np.array([
+    [[0, 1], [1, 0]],
+    [[0, -1j], [1j, 0]],
+    [[1, 0], [0, -1]]
+], dtype=complex)
+
+# Proiectorii măsurătorilor: (bază, rezultat) -> (I ± σ)/2, formă (3, 2, 2, 2)
+_PROJECTORS = np.stack([(_IDENTITY + _PAULI) / 2, (_IDENTITY - _PAULI) / 2], axis=1)
+
+# Estimarea liniară este micșorată până la această rază înainte de MLE,
+# astfel încât punctul de plecare să fie o matrice de densitate de rang complet
+_MLE_START_RADIUS = 0.99
+
+
+def bloch_to_density(bloch_vectors):
+    """ρ = (I + r·σ)/2 pentru un lot de vectori Bloch (N, 3) -> (N, 2, 2)"""
+    bloch_vectors = np.asarray(bloch_vectors, dtype=float)
+    return (_IDENTITY + np.einsum("nk,kij->nij", bloch_vectors, _PAULI)) / 2
+
+
+def density_to_bloch(density_matrices):
+    """r_k = Tr(ρ σ_k) pentru un lot de matrici de densitate (N, 2, 2) -> (N, 3)"""
+    return np.real(np.einsum("nij,kji->nk", density_matrices, _PAULI))
+
+
+def linear_inversion(probabilities_one):
+    """
+    Reconstrucția prin inversare liniară: r_k = 1 - 2·P(1 | baza k)
+
+    Args:
+        probabilities_one (np.ndarray): P(1) măsurat în bazele X, Y, Z, formă (N, 3)
+
+    Returns:
+        np.ndarray: Vectorii Bloch (N, 3); pot ieși în afara sferei (ρ nefizic)
+    """
+    return 1.0 - 2.0 * np.asarray(probabilities_one, dtype=float)
+
+
+def maximum_likelihood(probabilities_one, initial_bloch=None, max_iterations=500, tolerance=1e-8):
+    """
+    Rafinarea de verosimilitate maximă (iterația RρR), vectorizată pe tot lotul
+
+    La fiecare pas ρ ← RρR / Tr(RρR), cu R = Σ f/p · Π peste cele 6 rezultate.
+    Rezultatul este întotdeauna o matrice de densitate fizică. Stările a căror
+    estimare liniară este deja în interiorul sferei converg după primul pas.
+
+    Args:
+        probabilities_one (np.ndarray): P(1) în bazele X, Y, Z, formă (N, 3)
+        initial_bloch (np.ndarray, optional): Punctul de plecare (implicit inversarea liniară)
+        max_iterations (int): Numărul maxim de iterații
+        tolerance (float): Oprire când variația maximă a lui ρ scade sub această valoare
+
+    Returns:
+        tuple: (matricile de densitate (N, 2, 2), numărul de iterații efectuate)
+    """
+    probabilities_one = np.asarray(probabilities_one, dtype=float)
+    frequencies = np.stack([1.0 - probabilities_one, probabilities_one], axis=2)
+
+    bloch = linear_inversion(probabilities_one) if initial_bloch is None else np.asarray(initial_bloch, dtype=float)
+    norms = np.linalg.norm(bloch, axis=1, keepdims=True)
+    bloch = bloch * np.minimum(1.0, _MLE_START_RADIUS / np.maximum(norms, 1e-300))
+    rho = bloch_to_density(bloch)
+
+    # Doar stările care nu au convers încă sunt iterate în continuare
+    active = np.arange(len(rho))
+    iterations = 0
+    while len(active) and iterations < max_iterations:
+        iterations += 1
+        current = rho[active]
+        # p = Tr(Π ρ) pentru fiecare bază și rezultat, formă (N, 3, 2)
+        predicted = np.real(np.einsum("boij,nji->nbo", _PROJECTORS, current))
+        weights = frequencies[active] / np.maximum(predicted, 1e-12)
+        r_operator = np.einsum("nbo,boij->nij", weights, _PROJECTORS) / len(TOMOGRAPHY_BASES)
+        updated = r_operator @ current @ r_operator
+        updated /= np.real(updated[:, 0, 0] + updated[:, 1, 1])[:, None, None]
+        rho[active] = updated
+        active = active[np.max(np.abs(updated - current), axis=(1, 2)) >= tolerance]
+    return rho, iterations
+
+
+def bloch_angles(bloch_vectors):
+    """Unghiurile sferice (θ, φ) ale direcției vectorilor Bloch, formă (N, 2)"""
+    bloch_vectors = np.asarray(bloch_vectors, dtype=float)
+    norms = np.linalg.norm(bloch_vectors, axis=1)
+    thetas = np.arccos(np.clip(bloch_vectors[:, 2] / np.maximum(norms, 1e-300), -1.0, 1.0))
+    phis = np.arctan2(bloch_vectors[:, 1], bloch_vectors[:, 0])
+    return np.stack([thetas, phis], axis=1)
+
+
+def ideal_bloch_vectors(thetas, phis):
+    """Vectorii Bloch ai stărilor de intrare pure U(θ, φ)|0⟩"""
+    thetas = np.asarray(thetas, dtype=float)
+    phis = np.asarray(phis, dtype=float)
+    return np.stack([np.sin(thetas) * np.cos(phis), np.sin(thetas) * np.sin(phis), np.cos(thetas)], axis=1)
+
+
+# Unitarele variantelor de măsurare fără pregătirea stării (calculate la prima utilizare)
+_basis_unitaries = None
+
+
+def _tomography_unitaries():
+    """
+    Unitarele 8×8 ale celor trei variante, cu θ = φ = 0 (U(0, 0, 0) = I), deci doar
+    protocolul de teleportare urmat de rotația bazei de măsurare
+    """
+    global _basis_unitaries
+    if _basis_unitaries is None:
+        from qiskit.quantum_info import Operator
+
+        circuits = build_teleportation_tomography_circuits()
+        unitaries = []
+        for basis in TOMOGRAPHY_BASES:
+            circuit = circuits[basis].remove_final_measurements(inplace=False)
+            parameters = {param.name: param for param in circuit.parameters}
+            circuit = circuit.assign_parameters({parameters[TELEPORT_THETA.name]: 0.0, parameters[TELEPORT_PHI.name]: 0.0})
+            unitaries.append(Operator(circuit).data)
+        _basis_unitaries = np.stack(unitaries)
+    return _basis_unitaries
+
+
+def exact_probabilities_one(thetas, phis):
+    """
+    P(qubit 2 = 1) în bazele X, Y, Z, calculat exact pentru tot lotul de stări
+
+    Starea inițială U(θ, φ)|0⟩ ⊗ |00⟩ este evoluată prin cele trei unitare cu o
+    singură contracție (N, 8) × (3, 8, 8).
+
+    Returns:
+        np.ndarray: Probabilitățile, formă (N, 3)
+    """
+    thetas = np.asarray(thetas, dtype=float)
+    phis = np.asarray(phis, dtype=float)
+    initial_states = np.zeros((len(thetas), 8), dtype=complex)
+    initial_states[:, 0] = np.cos(thetas / 2)
+    initial_states[:, 1] = np.exp(1j * phis) * np.sin(thetas / 2)
+
+    final_states = np.einsum("bij,nj->nbi", _tomography_unitaries(), initial_states)
+    # Indicii cu bitul 2 setat corespund qubit-ului 2 în |1⟩
+    return np.sum(np.abs(final_states[:, :, 4:]) ** 2, axis=2)
+
+
+def run_teleportation_tomography(states, shots=4096, backend=None, noise_model=None, seed=None,
+                                 mle=True, max_iterations=500, engine=None):
+    """
+    Tomografia stării teleportate (qubit-ul 2) pentru un lot de stări de intrare
+
+    Pe calea Aer, cele trei variante de măsurare sunt transpilate o singură dată (prin
+    cache) și trimise într-un singur job, cu toate stările legate ca parametri. Fără
+    zgomot, motorul NumPy calculează exact probabilitățile tuturor stărilor și
+    eșantionează shot-urile binomial. În ambele cazuri lotul este reconstruit vectorizat.
+
+    Args:
+        states: Perechi (θ, φ) sau un array de formă (N, 2)
+        shots (int): Shot-uri per stare și bază
+        backend: Backend-ul Aer (implicit aer_simulator din pool)
+        noise_model (NoiseModel, optional): Model de zgomot pentru simulare
+        seed (int, optional): Seed-ul simulatorului
+        mle (bool): Aplică rafinarea de verosimilitate maximă
+        max_iterations (int): Iterațiile maxime ale MLE
+        engine (str, optional): "numpy" (distribuția exactă, eșantionată binomial) sau
+            "aer"; implicit "numpy" când nu există zgomot sau un backend explicit
+
+    Returns:
+        dict: Array-uri NumPy per stare: probabilitățile măsurate, vectorii Bloch
+            (liniar și MLE), matricile de densitate, fidelitatea și puritatea
+    """
+    start_time = time.perf_counter()
+    states = np.asarray(states, dtype=float).reshape(-1, 2)
+    thetas, phis = states[:, 0], states[:, 1]
+    count = len(states)
+
+    engine = engine or ("numpy" if backend is None and noise_model is None else "aer")
+
+    probabilities_one = np.zeros((count, len(TOMOGRAPHY_BASES)))
+    if count and engine == "numpy":
+        exact = exact_probabilities_one(thetas, phis)
+        probabilities_one = np.random.default_rng(seed).binomial(shots, exact) / shots
+    elif count:
+        backend = backend or get_backend('aer_simulator')
+        circuits = build_teleportation_tomography_circuits()
+        compiled_circuits = [cached_transpile(circuits[basis], backend) for basis in TOMOGRAPHY_BASES]
+
+        # Parametrii sunt căutați după nume, ca la circuitele restaurate din cache-ul de pe disc
+        parameter_binds = []
+        for compiled_circuit in compiled_circuits:
+            parameters = {param.name: param for param in compiled_circuit.parameters}
+            parameter_binds.append({
+                parameters[TELEPORT_THETA.name]: thetas.tolist(),
+                parameters[TELEPORT_PHI.name]: phis.tolist()
+            })
+
+        run_options = {"shots": shots, "parameter_binds": parameter_binds}
+        if noise_model is not None:
+            run_options["noise_model"] = noise_model
+        if seed is not None:
+            run_options["seed_simulator"] = seed
+        result = backend.run(compiled_circuits, **run_options).result()
+
+        # Experimentele sunt ordonate pe circuite, apoi pe legăturile de parametri
+        for index in range(len(TOMOGRAPHY_BASES) * count):
+            basis_index, state_index = divmod(index, count)
+            probabilities_one[state_index, basis_index] = result.get_counts(index).get("1", 0) / shots
+    measured_ms = (time.perf_counter() - start_time) * 1000
+
+    linear_bloch = linear_inversion(probabilities_one)
+    iterations = 0
+    if mle and count:
+        density_matrices, iterations = maximum_likelihood(probabilities_one, linear_bloch, max_iterations)
+        bloch_vectors = density_to_bloch(density_matrices)
+    else:
+        bloch_vectors = linear_bloch
+        density_matrices = bloch_to_density(bloch_vectors)
+
+    # Fidelitatea cu starea pură de intrare: F = ⟨ψ|ρ|ψ⟩ = (1 + r·n)/2
+    ideal = ideal_bloch_vectors(thetas, phis)
+    fidelities = (1.0 + np.sum(bloch_vectors * ideal, axis=1)) / 2
+    purities = (1.0 + np.sum(bloch_vectors ** 2, axis=1)) / 2
+
+    return {
+        "thetas": thetas,
+        "phis": phis,
+        "probabilities_one": probabilities_one,
+        "linear_bloch_vectors": linear_bloch,
+        "bloch_vectors": bloch_vectors,
+        "bloch_angles": bloch_angles(bloch_vectors),
+        "density_matrices": density_matrices,
+        "fidelities": fidelities,
+        "purities": purities,
+        "mle_iterations": iterations,
+        "shots": shots,
+        "engine": engine,
+        "measurement_ms": round(measured_ms, 3),
+        "execution_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+
+def benchmark_tomography(batch_sizes=(1, 10, 100, 1000), shots=1024, seed=1234, engine=None):
+    """
+    Măsoară câte stări pe secundă reconstruiește tomografia în lot
+
+    Returns:
+        list: Timpul și numărul de stări per secundă pentru fiecare dimensiune a lotului
+    """
+    rng = np.random.default_rng(seed)
+    # Încălzire: transpilarea celor trei variante în cache
+    run_teleportation_tomography([(0.0, 0.0)], shots=shots, seed=seed, engine=engine)
+
+    results = []
+    for batch_size in batch_sizes:
+        states = np.stack([np.arccos(1 - 2 * rng.random(batch_size)), rng.uniform(-np.pi, np.pi, batch_size)], axis=1)
+        tomography = run_teleportation_tomography(states, shots=shots, seed=seed, engine=engine)
+        seconds = tomography["execution_time_ms"] / 1000
+        results.append({
+            "states": batch_size,
+            "seconds": round(seconds, 4),
+            "states_per_second": round(batch_size / seconds, 1) if seconds else None,
+            "mean_fidelity": round(float(tomography["fidelities"].mean()), 4)
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for engine in ("numpy", "aer"):
+        print(f"Motor: {engine}")
+        for row in benchmark_tomography(engine=engine):
+            print(f"{row['states']:>5} stări: {row['seconds']:8.4f} s  {row['states_per_second']:>9} stări/s  "
+                  f"fidelitate medie {row['mean_fidelity']}")
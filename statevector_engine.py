@@ -0,0 +1,462 @@
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ClassicalRegister
+
+from transpile_cache import cached_transpile
+from backend_pool import get_backend
+from circuit_analyzer import analyze_circuit, supports_natively, STATEVECTOR_MAX_QUBITS
+from simulator_profile import get_profile
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+# Peste acest număr de qubiți simulatorul Aer este mai eficient decât motorul NumPy
+NUMPY_ENGINE_MAX_QUBITS = 12
+
+# Ramurile cu probabilitate neglijabilă sunt eliminate după fiecare măsurătoare
+_BRANCH_EPSILON = 1e-15
+
+_IGNORED_OPERATIONS = {"barrier", "delay"}
+
+
+class UnsupportedCircuitError(ValueError):
+    """Circuitul conține operații pe care motorul NumPy nu le poate simula"""
+
+
+def _bit_index(circuit, bit):
+    return circuit.find_bit(bit).index
+
+
+def _compile_operations(circuit, qubit_map=None, clbit_map=None):
+    """
+    Transformă un circuit Qiskit într-o listă de operații simple pentru motor.
+
+    Returns:
+        list: Tupluri ("gate", matrice, qubiți), ("measure", qubit, clbit),
+            ("reset", qubit) sau ("if", clbiți, valoare, ramura_true, ramura_false)
+    """
+    if qubit_map is None:
+        qubit_map = list(range(circuit.num_qubits))
+    if clbit_map is None:
+        clbit_map = list(range(circuit.num_clbits))
+
+    operations = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        name = operation.name
+        qubits = [qubit_map[_bit_index(circuit, qubit)] for qubit in instruction.qubits]
+        clbits = [clbit_map[_bit_index(circuit, clbit)] for clbit in instruction.clbits]
+
+        if name in _IGNORED_OPERATIONS:
+            continue
+
+        if name == "measure":
+            operations.append(("measure", qubits[0], clbits[0]))
+        elif name == "reset":
+            operations.append(("reset", qubits[0]))
+        elif name == "if_else":
+            condition = operation.condition
+            if not isinstance(condition, tuple):
+                raise UnsupportedCircuitError("Condiții clasice de tip expresie nu sunt suportate")
+            target, value = condition
+            if isinstance(target, ClassicalRegister):
+                condition_bits = [clbit_map[_bit_index(circuit, clbit)] for clbit in target]
+            else:
+                condition_bits = [clbit_map[_bit_index(circuit, target)]]
+
+            true_body, false_body = operation.blocks[0], operation.blocks[1] if len(operation.blocks) > 1 else None
+            true_ops = _compile_operations(true_body, qubits, clbits)
+            false_ops = _compile_operations(false_body, qubits, clbits) if false_body is not None else []
+            operations.append(("if", condition_bits, int(value), true_ops, false_ops))
+        else:
+            if getattr(operation, "is_parameterized", lambda: False)() or not hasattr(operation, "to_matrix"):
+                raise UnsupportedCircuitError(f"Operația '{name}' nu este suportată de motorul NumPy")
+            try:
+                matrix = operation.to_matrix()
+            except Exception:
+                raise UnsupportedCircuitError(f"Operația '{name}' nu are o matrice unitară")
+            if matrix is None:
+                raise UnsupportedCircuitError(f"Operația '{name}' nu are o matrice unitară")
+            operations.append(("gate", np.asarray(matrix, dtype=complex), qubits))
+
+    return operations
+
+
+def _split_terminal_measurements(operations):
+    """
+    Separă măsurătorile finale (după care nu mai urmează nicio operație)
+    de restul circuitului. Acestea nu necesită ramificare și sunt eșantionate direct.
+    """
+    split = len(operations)
+    while split > 0 and operations[split - 1][0] == "measure":
+        split -= 1
+    return operations[:split], [(op[1], op[2]) for op in operations[split:]]
+
+
+class NumpyStatevectorEngine:
+    """
+    Motor statevector NumPy in-process pentru circuite mici (până la ~12 qubiți).
+
+    Porțile sunt aplicate vectorizat prin contracții tensoriale pe statevector-ul
+    remodelat ca tensor (2,)*n. Măsurătorile intermediare și porțile condiționate
+    clasic sunt simulate exact prin ramificarea stării (fiecare ramură are propriul
+    registru clasic și propria probabilitate), iar shot-urile sunt eșantionate o
+    singură dată din distribuția finală cu numpy.random.Generator.choice.
+    """
+
+    name = "numpy_statevector"
+
+    def __init__(self, max_qubits=NUMPY_ENGINE_MAX_QUBITS, seed=None):
+        self.max_qubits = max_qubits
+        self.rng = np.random.default_rng(seed)
+
+    def supports(self, circuit):
+        """Verifică dacă circuitul poate fi simulat de motorul NumPy"""
+        if circuit.num_qubits > self.max_qubits:
+            return False
+        try:
+            _compile_operations(circuit)
+        except UnsupportedCircuitError:
+            return False
+        return True
+
+    @staticmethod
+    def _apply_gate(state, matrix, qubits):
+        """Aplică o poartă pe qubiții dați prin contracție tensorială"""
+        n = state.ndim
+        k = len(qubits)
+        # Qiskit este little-endian: primul qubit al porții este bitul cel mai puțin semnificativ
+        axes = [n - 1 - qubit for qubit in reversed(qubits)]
+        gate = matrix.reshape((2,) * (2 * k))
+        state = np.tensordot(gate, state, axes=(list(range(k, 2 * k)), axes))
+        return np.moveaxis(state, list(range(k)), axes)
+
+    @staticmethod
+    def _project(state, qubit, outcome):
+        """Proiectează starea pe rezultatul unei măsurători și returnează (stare, probabilitate)"""
+        axis = state.ndim - 1 - qubit
+        projected = state.copy()
+        index = [slice(None)] * state.ndim
+        index[axis] = 1 - outcome
+        projected[tuple(index)] = 0
+        probability = float(np.vdot(projected, projected).real)
+        if probability > _BRANCH_EPSILON:
+            projected /= np.sqrt(probability)
+        return projected, probability
+
+    def _run_branches(self, operations, branches):
+        """Execută operațiile pe toate ramurile (stare, valoare clasică, probabilitate)"""
+        for operation in operations:
+            kind = operation[0]
+
+            if kind == "gate":
+                _, matrix, qubits = operation
+                branches = [(self._apply_gate(state, matrix, qubits), clbits, weight)
+                            for state, clbits, weight in branches]
+
+            elif kind in ("measure", "reset"):
+                qubit = operation[1]
+                next_branches = []
+                for state, clbits, weight in branches:
+                    for outcome in (0, 1):
+                        projected, probability = self._project(state, qubit, outcome)
+                        if probability * weight <= _BRANCH_EPSILON:
+                            continue
+                        if kind == "measure":
+                            clbit = operation[2]
+                            new_clbits = (clbits & ~(1 << clbit)) | (outcome << clbit)
+                        else:
+                            new_clbits = clbits
+                            if outcome == 1:
+                                projected = self._apply_gate(projected, np.array([[0, 1], [1, 0]], dtype=complex), [qubit])
+                        next_branches.append((projected, new_clbits, weight * probability))
+                branches = next_branches
+
+            elif kind == "if":
+                _, condition_bits, value, true_ops, false_ops = operation
+                next_branches = []
+                for branch in branches:
+                    clbits = branch[1]
+                    register_value = sum(((clbits >> bit) & 1) << position for position, bit in enumerate(condition_bits))
+                    body = true_ops if register_value == value else false_ops
+                    next_branches.extend(self._run_branches(body, [branch]) if body else [branch])
+                branches = next_branches
+
+        return branches
+
+    def _initial_branches(self, circuit):
+        state = np.zeros((2,) * circuit.num_qubits, dtype=complex)
+        state[(0,) * circuit.num_qubits] = np.exp(1j * float(circuit.global_phase))
+        return [(state, 0, 1.0)]
+
+    def statevector(self, circuit):
+        """
+        Calculează statevector-ul final al unui circuit fără măsurători intermediare
+
+        Returns:
+            numpy.ndarray: Statevector în ordinea Qiskit (qubit 0 = bitul cel mai puțin semnificativ)
+        """
+        operations, _ = _split_terminal_measurements(_compile_operations(circuit))
+        branches = self._run_branches(operations, self._initial_branches(circuit))
+        if len(branches) != 1:
+            raise UnsupportedCircuitError("Statevector-ul nu este definit pentru circuite cu măsurători intermediare")
+        return branches[0][0].reshape(-1)
+
+    def outcome_distribution(self, circuit):
+        """
+        Calculează distribuția exactă a valorilor registrului clasic
+
+        Returns:
+            tuple: (valori întregi ale registrului clasic, probabilități)
+        """
+        operations, terminal = _split_terminal_measurements(_compile_operations(circuit))
+        branches = self._run_branches(operations, self._initial_branches(circuit))
+
+        n = circuit.num_qubits
+        distribution = {}
+        measured_qubits = sorted({qubit for qubit, _ in terminal})
+
+        for state, clbits, weight in branches:
+            if not terminal:
+                distribution[clbits] = distribution.get(clbits, 0.0) + weight
+                continue
+
+            # Marginala pe qubiții măsurați la final
+            probabilities = np.abs(state) ** 2
+            keep_axes = [n - 1 - qubit for qubit in measured_qubits]
+            sum_axes = tuple(axis for axis in range(n) if axis not in keep_axes)
+            marginal = probabilities.sum(axis=sum_axes) if sum_axes else probabilities
+            # Axele rămase sunt ordonate descrescător după qubit, deci la aplatizare
+            # bitul j al indexului corespunde qubit-ului measured_qubits[j]
+            marginal = marginal.reshape(-1)
+
+            outcomes = np.arange(marginal.size)
+            clbit_values = np.full(marginal.size, clbits, dtype=np.int64)
+            for qubit, clbit in terminal:
+                position = measured_qubits.index(qubit)
+                bit_values = (outcomes >> position) & 1
+                clbit_values = (clbit_values & ~(1 << clbit)) | (bit_values << clbit)
+
+            for value, probability in zip(clbit_values.tolist(), (marginal * weight).tolist()):
+                if probability > _BRANCH_EPSILON:
+                    distribution[value] = distribution.get(value, 0.0) + probability
+
+        values = np.fromiter(distribution.keys(), dtype=np.int64, count=len(distribution))
+        probabilities = np.fromiter(distribution.values(), dtype=float, count=len(distribution))
+        return values, probabilities / probabilities.sum()
+
+    def run(self, circuit, shots=1024):
+        """
+        Simulează circuitul și eșantionează shot-urile
+
+        Returns:
+            dict: Histograma în formatul Qiskit (bitstring -> număr)
+        """
+        values, probabilities = self.outcome_distribution(circuit)
+        samples = self.rng.choice(len(values), size=shots, p=probabilities)
+        counts = np.bincount(samples, minlength=len(values))
+        return {
+            format_clbits(circuit, int(value)): int(count)
+            for value, count in zip(values, counts) if count > 0
+        }
+
+
+def format_clbits(circuit, value):
+    """Formatează valoarea registrului clasic ca în Qiskit (registrele separate prin spațiu)"""
+    if not circuit.cregs:
+        return format(value, f"0{circuit.num_clbits}b") if circuit.num_clbits else ""
+    parts = []
+    for register in reversed(circuit.cregs):
+        bits = [(value >> _bit_index(circuit, clbit)) & 1 for clbit in register]
+        parts.append("".join(str(bit) for bit in reversed(bits)))
+    return " ".join(parts)
+
+
+_default_engine = NumpyStatevectorEngine()
+
+
+def simulate_statevector(circuit):
+    """Calculează exact statevector-ul final al unui circuit mic, fără eșantionare"""
+    return _default_engine.statevector(circuit)
+
+
+def exact_outcome_distribution(circuit):
+    """Distribuția exactă a valorilor registrului clasic (valori întregi, probabilități)"""
+    return _default_engine.outcome_distribution(circuit)
+
+
+def select_engine(circuit):
+    """
+    Alege motorul de simulare pentru un circuit
+
+    Returns:
+        str: "numpy" pentru circuite mici cu porți suportate, altfel "aer"
+    """
+    return "numpy" if _default_engine.supports(circuit) else "aer"
+
+
+def _compile_for_backend(circuit, backend):
+    """Transpilează prin cache; circuitele mari cu operații native rulează direct (transpilarea lor durează secunde)"""
+    if circuit.num_qubits > STATEVECTOR_MAX_QUBITS and supports_natively(circuit, backend):
+        return circuit
+    return cached_transpile(circuit, backend)
+
+
+def execute_circuit(circuit, backend=None, shots=1024, engine=None, family=None, compiled=False):
+    """
+    Execută un circuit pe motorul potrivit (NumPy pentru circuite mici, Aer în rest).
+    Fără backend dat, pe calea Aer analizorul de circuite alege metoda de simulare:
+    circuitele Clifford merg pe "stabilizer", cele mari slab entanglate pe
+    "matrix_product_state". Un backend dat de apelant este folosit ca atare.
+
+    Args:
+        circuit (QuantumCircuit): Circuitul de executat
+        backend: Backend-ul Aer pe care rulează circuitul (implicit cel ales de analizor)
+        shots (int): Numărul de shot-uri
+        engine (str, optional): Forțează "numpy" sau "aer"
+        family (str, optional): Familia de circuite; pe calea Aer se aplică profilul
+            de execuție ales pentru ea (vezi simulator_profile)
+        compiled (bool): Circuitul este deja transpilat pentru backend (ex. un șablon legat)
+
+    Returns:
+        dict: counts, engine ("numpy" sau "aer"), method (metoda de simulare folosită
+            efectiv) și execution_time_ms
+    """
+    start_time = time.perf_counter()
+    engine = engine or select_engine(circuit)
+
+    if engine == "numpy":
+        # Motorul NumPy simulează întotdeauna statevector-ul dens
+        method = "statevector"
+        counts = _default_engine.run(circuit, shots=shots)
+    else:
+        if backend is None:
+            method = analyze_circuit(circuit)["method"]
+            backend = get_backend('aer_simulator', None if method == "statevector" else method)
+
+        compiled_circuit = circuit if compiled else _compile_for_backend(circuit, backend)
+        profile = get_profile(family)
+        run_options = profile.run_options() if profile else {}
+        result = backend.run(compiled_circuit, shots=shots, **run_options).result()
+        counts = result.get_counts()
+        # Metoda raportată de Aer (un backend "automatic" o alege la execuție)
+        method = result.results[0].metadata.get("method", getattr(backend.options, "method", None))
+
+    return {
+        "counts": counts,
+        "engine": engine,
+        "method": method,
+        "execution_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+
+def execute_circuits(circuits, shots=1024, family=None, compiled=False):
+    """
+    Execută o listă de circuite pe Aer, câte un singur job per metodă de simulare.
+
+    Circuitele sunt grupate după metoda aleasă de analizor (de obicei una singură),
+    transpilate prin cache și trimise împreună într-un singur backend.run(); Aer
+    rulează experimentele în paralel (max_parallel_experiments=0, adică automat).
+
+    Args:
+        circuits (list): Circuitele de executat
+        shots (int): Numărul de shot-uri per circuit
+        family (str, optional): Familia de circuite al cărei profil de execuție se aplică
+        compiled (bool): Circuitele sunt deja transpilate pentru Aer
+
+    Returns:
+        list: Câte un dict (counts, engine, method, job_index și execution_time_ms al
+            job-ului comun) per circuit, în ordinea de intrare
+    """
+    groups = {}
+    for index, circuit in enumerate(circuits):
+        method = analyze_circuit(circuit)["method"]
+        groups.setdefault(method, []).append(index)
+
+    profile = get_profile(family)
+    run_options = profile.run_options() if profile else {}
+    run_options["max_parallel_experiments"] = 0
+
+    results = [None] * len(circuits)
+    for job_index, (method, indices) in enumerate(groups.items()):
+        start_time = time.perf_counter()
+        backend = get_backend('aer_simulator', None if method == "statevector" else method)
+        compiled_circuits = [circuits[index] if compiled else _compile_for_backend(circuits[index], backend)
+                             for index in indices]
+        result = backend.run(compiled_circuits, shots=shots, **run_options).result()
+        execution_time_ms = round((time.perf_counter() - start_time) * 1000, 3)
+
+        for position, index in enumerate(indices):
+            results[index] = {
+                "counts": result.get_counts(position),
+                "engine": "aer",
+                "method": method,
+                "job_index": job_index,
+                "execution_time_ms": execution_time_ms
+            }
+    return results
+
+
+def _benchmark_circuits():
+    """Circuitele standard folosite pentru benchmark"""
+    basic = QuantumCircuit(3, 3)
+    basic.h(0)
+    basic.cx(0, 1)
+    basic.x(2)
+    basic.measure([0, 1, 2], [0, 1, 2])
+
+    teleport = QuantumCircuit(3, 2)
+    teleport.h(0)
+    teleport.t(0)
+    teleport.h(1)
+    teleport.cx(1, 2)
+    teleport.cx(0, 1)
+    teleport.h(0)
+    teleport.measure([0, 1], [0, 1])
+    with teleport.if_test((teleport.clbits[1], 1)):
+        teleport.x(2)
+    with teleport.if_test((teleport.clbits[0], 1)):
+        teleport.z(2)
+
+    ghz = QuantumCircuit(10, 10)
+    ghz.h(0)
+    for qubit in range(9):
+        ghz.cx(qubit, qubit + 1)
+    ghz.measure(range(10), range(10))
+
+    return {"basic_3q": basic, "teleportation_3q": teleport, "ghz_10q": ghz}
+
+
+def benchmark_engines(shots=1024, repeats=20):
+    """
+    Compară latența motorului NumPy cu cea a simulatorului Aer pe circuitele standard
+
+    Returns:
+        dict: Latența medie (ms) pentru fiecare circuit și motor
+    """
+    backend = get_backend('aer_simulator')
+    results = {}
+
+    for name, circuit in _benchmark_circuits().items():
+        # Încălzire: transpilare în cache și primele alocări
+        execute_circuit(circuit, backend, shots=shots, engine="aer")
+        execute_circuit(circuit, backend, shots=shots, engine="numpy")
+
+        timings = {}
+        for engine in ("numpy", "aer"):
+            start_time = time.perf_counter()
+            for _ in range(repeats):
+                execute_circuit(circuit, backend, shots=shots, engine=engine)
+            timings[f"{engine}_ms"] = round((time.perf_counter() - start_time) * 1000 / repeats, 3)
+        timings["speedup"] = round(timings["aer_ms"] / timings["numpy_ms"], 2) if timings["numpy_ms"] else None
+        results[name] = timings
+
+    return results
+
+
+if __name__ == "__main__":
+    for circuit_name, timings in benchmark_engines().items():
+        print(f"{circuit_name}: {timings}")
@@ -0,0 +1,278 @@
+import os
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+from qiskit import QuantumCircuit, transpile, qpy
+
+# COPYRIGHT ERVIN REMUS RADOSAVLEVICI - SISTEM CU SECURITATE DNA
+# TOATE DREPTURILE REZERVATE MONDIAL © 2023-2033
+# PROTECȚIE DNA CU NIVEL MAXIM DE SECURITATE NUCLEARĂ
+# SISTEMUL ESTE AUTO-PROTEJAT ȘI AUTO-REPARAT LA NIVEL MONDIAL
+
+
+def _param_fingerprint(param):
+    """Reprezentare stabilă a unui parametru de instrucțiune"""
+    if isinstance(param, QuantumCircuit):
+        # Blocurile control-flow (if_test, for_loop...) sunt circuite imbricate
+        return f"block[{circuit_fingerprint(param)}]"
+    if isinstance(param, float):
+        return repr(round(param, 12))
+    return repr(param)
+
+
+def _condition_fingerprint(circuit, condition):
+    """Reprezentare stabilă a condiției clasice a unei instrucțiuni"""
+    if condition is None:
+        return ""
+    target, value = condition if isinstance(condition, tuple) else (condition, None)
+    if hasattr(target, "size") and hasattr(target, "name"):
+        target_repr = f"creg:{target.name}:{target.size}"
+    else:
+        try:
+            target_repr = f"clbit:{circuit.find_bit(target).index}"
+        except Exception:
+            target_repr = repr(target)
+    return f"{target_repr}=={value}"
+
+
+def circuit_fingerprint(circuit):
+    """
+    Calculează amprenta structurală a unui circuit quantum.
+    Numele circuitului și metadatele sunt ignorate, astfel încât două circuite
+    construite identic la apeluri diferite au aceeași amprentă.
+
+    Args:
+        circuit (QuantumCircuit): Circuitul pentru care se calculează amprenta
+
+    Returns:
+        str: Hash SHA-256 al structurii circuitului
+    """
+    parts = [
+        f"q={circuit.num_qubits}",
+        f"c={circuit.num_clbits}",
+        f"qregs={[(reg.name, reg.size) for reg in circuit.qregs]}",
+        f"cregs={[(reg.name, reg.size) for reg in circuit.cregs]}",
+        f"phase={_param_fingerprint(circuit.global_phase)}",
+    ]
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        clbits = [circuit.find_bit(clbit).index for clbit in instruction.clbits]
+        params = [_param_fingerprint(param) for param in operation.params]
+        condition = _condition_fingerprint(circuit, getattr(operation, "condition", None))
+        parts.append(f"{operation.name}|{qubits}|{clbits}|{params}|{condition}")
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+# Amprentele calculate, per obiect backend (backend.target al Aer este reconstruit la fiecare acces)
+_backend_fingerprints = weakref.WeakKeyDictionary()
+
+
+def backend_fingerprint(backend):
+    """
+    Calculează amprenta țintei de transpilare a unui backend
+
+    Args:
+        backend: Backend-ul Qiskit/Aer folosit la transpilare
+
+    Returns:
+        str: Hash SHA-256 al numelui, setului de porți și conectivității backend-ului
+    """
+    try:
+        return _backend_fingerprints[backend]
+    except (KeyError, TypeError):
+        pass
+
+    target = getattr(backend, "target", None)
+    operation_names = sorted(target.operation_names) if target is not None else []
+    coupling_map = getattr(backend, "coupling_map", None)
+    edges = sorted(coupling_map.get_edges()) if coupling_map is not None else None
+    num_qubits = getattr(backend, "num_qubits", None)
+
+    backend_base = f"{backend.name}|{num_qubits}|{operation_names}|{edges}"
+    fingerprint = hashlib.sha256(backend_base.encode()).hexdigest()
+    try:
+        _backend_fingerprints[backend] = fingerprint
+    except TypeError:
+        pass
+    return fingerprint
+
+
+class TranspileCache:
+    """
+    Cache comun pentru circuitele transpilate, partajat de QuantumSimulator,
+    QuantumTeleportation și QuantumConnector.
+
+    Cheia combină amprenta structurală a circuitului, ținta backend-ului și
+    nivelul de optimizare. Evacuarea se face LRU, iar opțional circuitele
+    sunt persistate pe disc (QPY) pentru ca repornirile să evite transpilarea.
+
+    Circuitele returnate sunt partajate între apelanți și nu trebuie modificate.
+    """
+
+    def __init__(self, max_entries=256, persist_dir=None):
+        self.max_entries = max_entries
+        self.persist_dir = persist_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistici cache
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if self.persist_dir:
+            os.makedirs(self.persist_dir, exist_ok=True)
+
+    def make_key(self, circuit, backend, optimization_level=None):
+        """Construiește cheia cache pentru un circuit, backend și nivel de optimizare"""
+        return f"{circuit_fingerprint(circuit)[:32]}-{backend_fingerprint(backend)[:16]}-o{optimization_level}"
+
+    def get(self, key):
+        """Returnează circuitul transpilat pentru cheie sau None"""
+        with self._lock:
+            circuit = self._entries.get(key)
+            if circuit is not None:
+                self._entries.move_to_end(key)
+            return circuit
+
+    def put(self, key, circuit):
+        """Adaugă un circuit transpilat în cache, evacuând intrările cele mai vechi"""
+        with self._lock:
+            self._entries[key] = circuit
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def transpile(self, circuit, backend, optimization_level=None):
+        """
+        Transpilează un circuit folosind cache-ul
+
+        Args:
+            circuit (QuantumCircuit): Circuitul de transpilat
+            backend: Backend-ul țintă
+            optimization_level (int, optional): Nivelul de optimizare Qiskit
+
+        Returns:
+            QuantumCircuit: Circuitul transpilat (partajat, nu se modifică)
+        """
+        key = self.make_key(circuit, backend, optimization_level)
+
+        cached = self.get(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        cached = self._load_from_disk(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+            self.put(key, cached)
+            return cached
+
+        with self._lock:
+            self.misses += 1
+
+        transpiled = transpile(circuit, backend, optimization_level=optimization_level)
+        self.put(key, transpiled)
+        self._save_to_disk(key, transpiled)
+        return transpiled
+
+    def _disk_path(self, key):
+        return os.path.join(self.persist_dir, f"{key}.qpy")
+
+    def _load_from_disk(self, key):
+        """Încarcă un circuit transpilat persistat anterior"""
+        if not self.persist_dir:
+            return None
+
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return qpy.load(f)[0]
+        except Exception as e:
+            print(f"[TRANSPILE CACHE] Eroare la citirea circuitului persistat: {str(e)}")
+            return None
+
+    def _save_to_disk(self, key, circuit):
+        """Persistă un circuit transpilat pe disc (scriere atomică)"""
+        if not self.persist_dir:
+            return
+
+        path = self._disk_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                qpy.dump(circuit, f)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"[TRANSPILE CACHE] Eroare la persistarea circuitului: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+
+    def clear(self, include_disk=False):
+        """Golește cache-ul din memorie și, opțional, pe cel de pe disc"""
+        with self._lock:
+            self._entries.clear()
+
+        if include_disk and self.persist_dir and os.path.isdir(self.persist_dir):
+            for filename in os.listdir(self.persist_dir):
+                if filename.endswith(".qpy"):
+                    try:
+                        os.remove(os.path.join(self.persist_dir, filename))
+                    except Exception:
+                        pass
+
+    def get_stats(self):
+        """Returnează statisticile cache-ului"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "persist_dir": self.persist_dir
+            }
+
+
+_transpile_cache = None
+_transpile_cache_lock = threading.Lock()
+
+
+def get_transpile_cache():
+    """
+    Returnează cache-ul de transpilare comun procesului.
+    Persistența pe disc se activează prin variabila de mediu QUANTUM_TRANSPILE_CACHE_DIR,
+    iar dimensiunea prin QUANTUM_TRANSPILE_CACHE_SIZE.
+    """
+    global _transpile_cache
+    if _transpile_cache is None:
+        with _transpile_cache_lock:
+            if _transpile_cache is None:
+                _transpile_cache = TranspileCache(
+                    max_entries=int(os.environ.get('QUANTUM_TRANSPILE_CACHE_SIZE', 256)),
+                    persist_dir=os.environ.get('QUANTUM_TRANSPILE_CACHE_DIR')
+                )
+    return _transpile_cache
+
+
+def cached_transpile(circuit, backend, optimization_level=None):
+    """Transpilează un circuit prin cache-ul comun procesului"""
+    return get_transpile_cache().transpile(circuit, backend, optimization_level=optimization_level)
@@ -114,28 +114,120 @@ def complex_to_rgb(complex_value):
     # Convert to RGB string
     return f'rgb({int(r*255)}, {int(g*255)}, {int(b*255)})'
 
-def format_quantum_state(state_vector):
-    """Format a quantum state vector as a string with proper notation."""
+def complex_to_rgb_array(complex_values):
+    """
+    Vectorized version of complex_to_rgb for a whole array of amplitudes.
+
+    Returns:
+        list: RGB strings, identical to calling complex_to_rgb on every element
+    """
+    values = np.asarray(complex_values, dtype=complex).ravel()
+    magnitude = np.abs(values)
+    hue = (np.angle(values) + np.pi) / (2 * np.pi)
+    saturation = np.minimum(magnitude * 2, 1.0)
+    value = np.minimum(0.5 + magnitude * 0.5, 1.0)
+
+    # HSV -> RGB (same sector formulas as colorsys.hsv_to_rgb)
+    sector = np.floor(hue * 6.0)
+    fraction = hue * 6.0 - sector
+    sector = sector.astype(int) % 6
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * fraction)
+    t = value * (1.0 - saturation * (1.0 - fraction))
+
+    red = np.choose(sector, [value, q, p, p, t, value])
+    green = np.choose(sector, [t, value, value, q, p, p])
+    blue = np.choose(sector, [p, p, t, value, value, q])
+
+    rgb = (np.stack([red, green, blue], axis=1) * 255).astype(int)
+    return [f'rgb({r}, {g}, {b})' for r, g, b in rgb.tolist()]
+
+def basis_labels(indices, n_qubits):
+    """Vectorized binary labels (e.g. '0101') for basis-state indices."""
+    indices = np.asarray(indices, dtype=np.int64).ravel()
+    if n_qubits == 0:
+        return [''] * len(indices)
+    shifts = np.arange(n_qubits - 1, -1, -1, dtype=np.int64)
+    bits = ((indices[:, None] >> shifts) & 1).astype(np.uint8) + ord('0')
+    return np.ascontiguousarray(bits).view(f'S{n_qubits}').ravel().astype(str).tolist()
+
+def top_k_amplitudes(state_vector, k):
+    """
+    Select the k largest-magnitude amplitudes using argpartition (O(N), no full sort).
+
+    Returns:
+        numpy.ndarray: Indices of the selected amplitudes, largest magnitude first
+    """
+    magnitudes = np.abs(np.asarray(state_vector))
+    k = min(k, magnitudes.size)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < magnitudes.size:
+        indices = np.argpartition(magnitudes, -k)[-k:]
+    else:
+        indices = np.arange(magnitudes.size)
+    return indices[np.argsort(-magnitudes[indices], kind='stable')]
+
+def aggregate_amplitudes(state_vector, max_bars):
+    """
+    Aggregate a large register into at most max_bars buckets keyed by the leading qubits.
+
+    Each bucket's magnitude is sqrt(total probability of the bucket) and its phase
+    is taken from the dominant amplitude of the bucket.
+
+    Returns:
+        tuple: (labels with 'x' for the aggregated qubits, magnitudes, representative amplitudes)
+    """
+    state_vector = np.asarray(state_vector)
+    n_qubits = int(np.log2(state_vector.size))
+    leading_qubits = min(n_qubits, max(0, int(np.floor(np.log2(max_bars)))))
+    buckets = state_vector.reshape(2 ** leading_qubits, -1)
+
+    probabilities = np.abs(buckets) ** 2
+    magnitudes = np.sqrt(probabilities.sum(axis=1))
+    dominant = buckets[np.arange(buckets.shape[0]), np.argmax(probabilities, axis=1)]
+    # Keep the dominant phase but scale the colour by the bucket magnitude
+    representatives = np.where(np.abs(dominant) > 0, dominant / np.maximum(np.abs(dominant), 1e-300), 0) * magnitudes
+
+    suffix = 'x' * (n_qubits - leading_qubits)
+    labels = [label + suffix for label in basis_labels(np.arange(buckets.shape[0]), leading_qubits)]
+    return labels, magnitudes, representatives
+
+def format_quantum_state(state_vector, top_k=None, threshold=1e-10):
+    """
+    Format a quantum state vector as a string with proper notation.
+
+    Args:
+        state_vector: Amplitudes in Qiskit (little-endian) order
+        top_k (int, optional): Only show the k largest amplitudes
+        threshold (float): Amplitudes with magnitude below this are hidden
+
+    Returns:
+        str: Dirac notation of the non-zero amplitudes
+    """
+    state_vector = np.asarray(state_vector)
     n_qubits = int(np.log2(len(state_vector)))
+
+    # Only show non-zero amplitudes (vectorized filtering)
+    magnitudes = np.abs(state_vector)
+    indices = np.flatnonzero(magnitudes > threshold)
+    if top_k is not None and len(indices) > top_k:
+        selected = indices[np.argpartition(magnitudes[indices], -top_k)[-top_k:]]
+        indices = np.sort(selected)
+
+    phases = np.angle(state_vector[indices])
+    labels = basis_labels(indices, n_qubits)
+
     formatted = []
-    
-    for i, amplitude in enumerate(state_vector):
-        if abs(amplitude) > 1e-10:  # Only show non-zero amplitudes
-            # Convert index to binary representation
-            binary = bin(i)[2:].zfill(n_qubits)
-            
-            # Format the amplitude
-            magnitude = abs(amplitude)
-            phase = np.angle(amplitude)
-            
-            # Format as magnitude and phase
-            if abs(phase) < 1e-10:  # Real positive
-                amplitude_str = f"{magnitude:.4f}"
-            elif abs(phase - np.pi) < 1e-10:  # Real negative
-                amplitude_str = f"-{magnitude:.4f}"
-            else:
-                amplitude_str = f"{magnitude:.4f}e^({phase:.4f}i)"
-            
-            formatted.append(f"{amplitude_str}|{binary}⟩")
-    
+    for binary, magnitude, phase in zip(labels, magnitudes[indices].tolist(), phases.tolist()):
+        # Format as magnitude and phase
+        if abs(phase) < 1e-10:  # Real positive
+            amplitude_str = f"{magnitude:.4f}"
+        elif abs(phase - np.pi) < 1e-10:  # Real negative
+            amplitude_str = f"-{magnitude:.4f}"
+        else:
+            amplitude_str = f"{magnitude:.4f}e^({phase:.4f}i)"
+
+        formatted.append(f"{amplitude_str}|{binary}⟩")
+
     return " + ".join(formatted)